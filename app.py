@@ -2,31 +2,23 @@
 Hallar DSS — Stuðningur fyrir ákvörðun um þróun Hallarsvæðisins
 """
 from __future__ import annotations
+import re
 import sys
+from operator import attrgetter, itemgetter
 from pathlib import Path
 
 import streamlit as st
-import pandas as pd
 import numpy as np
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from hallar_risk_factors.structural_factors import (
-    STRUCTURAL_FACTORS, SCENARIO_FACTORS, get_scenario_profile,
-)
-from hallar_risk_factors.risk_sensitivities import RISK_PROFILES
-from hallar_risk_factors.risk_calculator import (
-    calculate_adjusted_probability,
-    calculate_scenario_risk_profile,
-)
+# Only the tables behind the module-level constants are imported here;
+# scoring, justifications and pandas are imported by the pages and
+# cached helpers that use them.
+from hallar_risk_factors.structural_factors import STRUCTURAL_FACTORS, SCENARIO_FACTORS
 from hallar_risk_factors.goal_impacts import GOALS
-from hallar_risk_factors.goal_scoring import (
-    calculate_scenario_goal_profile, rank_scenarios,
-    WEIGHTS_BALANCED,
-)
-from justifications_and_calculator import (
-    SCENARIO_FACTOR_JUSTIFICATIONS, RISK_CONFIDENCE,
-)
+from display_text import SCENARIO_DISPLAY, GOAL_DESCRIPTIONS, GOAL_SHORT_LABELS
+from display_text import METHODOLOGY_BEFORE_TABLE_MD, METHODOLOGY_AFTER_TABLE_MD
 
 # ═════════════════════════════════════════════════════════════════════
 # CONFIGURATION
@@ -39,251 +31,227 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-SCENARIO_IDS = sorted(SCENARIO_FACTORS.keys(), key=lambda x: int(x[1:]))
-GOAL_IDS = list(GOALS.keys())
-FACTOR_IDS = ["F1", "F2", "F3", "F4", "F5", "F6", "F7"]
+FACTOR_IDS = ("F1", "F2", "F3", "F4", "F5", "F6", "F7")
+
+
+@st.cache_resource
+def _load_tables():
+    """Id orderings, index maps and display lookups for the model tables.
+
+    app.py is re-executed on every rerun; these are built once per process
+    and the same objects are shared by every session.
+    """
+    scenario_ids = tuple(sorted(SCENARIO_FACTORS, key=lambda x: int(x[1:])))
+    goal_ids = tuple(GOALS)
+    names = {
+        sid: SCENARIO_DISPLAY.get(sid, {}).get("name", SCENARIO_FACTORS[sid].name_is)
+        for sid in scenario_ids
+    }
+    descs = {sid: SCENARIO_DISPLAY.get(sid, {}).get("desc", "") for sid in scenario_ids}
+    return (
+        scenario_ids,
+        goal_ids,
+        {sid: i for i, sid in enumerate(scenario_ids)},
+        {gid: j for j, gid in enumerate(goal_ids)},
+        np.array([GOALS[gid].direction == "higher_better" for gid in goal_ids]),
+        names,
+        descs,
+        # Result-card description blocks, wrapped once instead of per card render
+        {sid: f'<div class="result-desc">{desc}</div>' for sid, desc in descs.items()},
+    )
+
+
+(SCENARIO_IDS, GOAL_IDS, SCENARIO_INDEX, GOAL_INDEX, GOAL_HIGHER_BETTER,
+ SCENARIO_NAMES, SCENARIO_DESCS, _DESC_HTML) = _load_tables()
+
 
 # ═════════════════════════════════════════════════════════════════════
-# SCENARIO NAMES & DESCRIPTIONS (plain Icelandic)
+# CACHED MODEL RESULTS — per-scenario profiles reused across reruns
 # ═════════════════════════════════════════════════════════════════════
 
-SCENARIO_DISPLAY = {
-    "S1": {
-        "name": "Borgin byggir innviði og selur byggingarrétt",
-        "desc": (
-            "Borgin ber ábyrgð á öllum innviðum — götum, innviðum og byggingar- "
-            "hæfi lóða og selur síðan byggingarrétt til verktaka sem byggja "
-            "íbúðirnar. Borgin hefur fulla stjórn yfir verkefninu en verkefna- "
-            "stjórnun er veik og skipulag er aðskilið frá framkvæmdum. "
-            "Þetta er hefðbundin leið sem borgin þekkir vel en áhætta er "
-            "á hægagangi í framkvæmd og kostnaðarframúrkeyrslu vegna takmarkaðrar "
-            "samhæfingar."
-        ),
-    },
-    "S2": {
-        "name": "Lífeyrissjóðir eigendur sem ráða til sín verkefnastjóra",
-        "desc": (
-            "Lífeyrissjóður á verkefnið og ræður sérstakan verkefnastjóra "
-            "til að halda utan um framkvæmdir. Sjóðurinn leggur til þolið "
-            "fjármagn og verkefnastjórinn sér um daglegan rekstur. "
-            "Borgin á ekki hlut en hefur einhverja samningsstöðu. "
-            "Hætta er á því að verkefnastjóri hafi takmarkað vald yfir "
-            "verktökum þar sem hann er ekki meðeigandi og ber ekki "
-            "fjárhagslega áhættu."
-        ),
-    },
-    "S3": {
-        "name": "Lífeyrissjóðir og verkefnastjóri eru meðeigendur",
-        "desc": (
-            "Lífeyrissjóður á verkefnið en verkefnastjóri er einnig "
-            "meðeigandi og ber fjárhagslega áhættu ásamt sjóðnum. "
-            "Þetta eykur hvata verkefnastjóra til að halda tíma og "
-            "kostnaði í skefjum. Sterk verkefnastjórnun og þolið "
-            "fjármagn draga úr áhættu. Borgin á ekki hlut en hefur "
-            "einhverja samningsstöðu gagnvart verkefninu."
-        ),
-    },
-    "S4": {
-        "name": "Lífeyrissjóðir og aðalverktaki eru eigendur",
-        "desc": (
-            "Lífeyrissjóður á verkefnið og sterkur aðalverktaki er "
-            "meðeigandi. Verktakinn ber áhættu ásamt sjóðnum sem tryggir "
-            "sterkan hvata til vandaðra og tímanlegra framkvæmda. "
-            "Full samþætting skipulags og framkvæmda dregur verulega úr "
-            "töfum og kostnaði. Þetta er sterkasta samningsleiðin í "
-            "flestum aðstæðum — en borgin hefur ekki beint eignarhald."
-        ),
-    },
-    "S5": {
-        "name": "Lífeyrissjóðir eigendur með fasteignaþróunarfélagi",
-        "desc": (
-            "Tveir eða fleiri lífeyrissjóðir fjárfesta í verkefninu með "
-            "fasteignaþróunarfélagi sem stýrir verkefninu og útvegar "
-            "verktaka til að byggja upp svæðið. Traust sviðsmynd sem "
-            "nýtir þekkingu og reynslu þróunarfyrirtækja og þolinmótt . "
-            "fjármagn lífeyrissjóðanna. Fjöldi eigenda eykur hins vegar  "
-            "samhæfingaráhættu og borgin hefur litla beina aðkomu."
-        ),
-    },
-    "S6": {
-        "name": "Innviðafélag byggir innviði og selur áfram BR",
-        "desc": (
-            "Lífeyrissjóður byggir innviðin og selur síðan byggingarrétt "
-            "til ýmissa verktaka. Algjör aðskilnaður milli innviða og "
-            "íbúðabygginga skapar áskoranir í samhæfingu. "
-            "Borgin á ekki hlut og hefur veika samningsstöðu. Hætta er á "
-            "gæðavandamálum þegar margir verktakar starfa sjálfstætt án "
-            "sameiginlegrar stjórnunar."
-        ),
-    },
-    "S7": {
-        "name": "2–3 stórir verktakar eigendur með bankafjármögnun ",
-        "desc": (
-            "Tveir til þrír stórir verktakar stofna sameiginlegt félag "
-            "og fjármagna verkefnið með bankalánum. Verktakarnir bera áhættu "
-            "og hafa hvata til að ljúka framkvæmdum sem fyrst. "
-            "Bankafjármögnun er hins vegar óþolinmóð — bankar geta þrýst á "
-            "uppgreiðslu lána eða stöðvun framkvæmda í niðursveiflu en eigin-. "
-            "fjárstaða verktaka dregur úr þessari áhættu. Borgin hefur litla "
-            "samningsstöðu. "
-        ),
-    },
-    "S8": {
-        "name": "1 stór verktaki eigandi verkefnis með bankafjármögnun ",
-        "desc": (
-            "Einn stór verktaki tekur verkefnið að sér og fjármagnar "
-            "með bankalánum. Full samþætting og sterk verkefnisstjórnun "
-            "draga úr töfum. Fáir eigendur einfalda ákvarðanatöku. "
-            "Hætta er þó á að verktakinn verði of ráðandi og eiginfjár-"
-            "staða ekki nægilega traust í niðursveiflu eða við vaxtabreytingu. "
-        ),
-    },
-    "S9": {
-        "name": "Margir smáir verktakar — engin samhæfing",
-        "desc": (
-            "Mörgum litlum verktökum er úthlutað lóðum og þeir byggja "
-            "sjálfstætt. Engin sameiginleg verkefnisstjórnun og engin "
-            "samþætting skipulags og framkvæmda. "
-            "Þetta er áhættusamasta leiðin — mikil hætta á töfum, "
-            "gæðavandamálum og jafnvel gjaldþroti einstakra verktaka. "
-            "Borgin hefur nánast enga stjórn á framgangi verkefnisins."
-        ),
-    },
-    "S10": {
-        "name": "Reykjavíkurborg og lífeyrissjóðir eru eigendur",
-        "desc": (
-            "Borgin og lífeyrissjóðir stofna sameiginlegt félag um "
-            "verkefnið. Borgin hefur beina aðkomu og stjórn á meðan "
-            "sjóðirnir leggja til þolinmótt fjármagn. "
-            "Styrkur verktaka og verkefnisstjórnun er í meðallagi í "
-            "þessari sviðsmynd. Góð leið ef borgin vill halda áhrifum "
-            "en deila áhættu og kostnaði með lífeyrissjóðunum."
-        ),
-    },
-    "S11": {
-        "name": "Reykjavíkurborg, lífeyrissjóðir og aðalverktaki eigendur",
-        "desc": (
-            "Borgin, lífeyrissjóðir og sterkur aðalverktaki eru eigendur. "
-            "Sameinar styrk lífeyrisfjármagns, reynslu aðalverktaka og "
-            "stjórn borgarinnar. Full samþætting og sterk verkefnisstjórnun. "
-            " Flóknara eignarhald en dreifir áhættu vel og tryggir að hagsmunir "
-            " allra aðila séu amræmdir. "
-        ),
-    },
-    "S12": {
-        "name": "Lífeyrissjóðir eru eigendur og ráða til sín aðalverktaka",
-        "desc": (
-            "Lífeyrissjóðir eiga verkefnið og ráða aðalverktaka til stýringar "
-            "og framkvæmda, en verktakinn er ekki meðeigandi. Gott skipulag "
-            "og sterk verkefnisstjórnun. Verktakinn hefur þó minni hvata en í"
-            " sviðsmynd S4 þar sem hann ber ekki eignarhaldsáhættu. Þolið "
-            "fjármagn sjóðsins dregur úr fjárhagslegri áhættu verkefnisins. "
-        ),
-    },
-}
-
-def scenario_name(sid: str) -> str:
-    return SCENARIO_DISPLAY.get(sid, {}).get("name", SCENARIO_FACTORS[sid].name_is)
-
-def scenario_desc(sid: str) -> str:
-    return SCENARIO_DISPLAY.get(sid, {}).get("desc", "")
+# Profiles depend only on the scenario, never on user input: all 12 are
+# computed on first use and the same (read-only) objects are shared by
+# every session and rerun, with no per-call copy.
+
+@st.cache_resource(show_spinner=False)
+def _all_goal_profiles():
+    from hallar_risk_factors.goal_scoring import calculate_scenario_goal_profile
+    return {sid: calculate_scenario_goal_profile(sid) for sid in SCENARIO_IDS}
+
+
+@st.cache_resource(show_spinner=False)
+def _all_risk_profiles():
+    from hallar_risk_factors.risk_calculator import calculate_scenario_risk_profile
+    return {sid: calculate_scenario_risk_profile(sid) for sid in SCENARIO_IDS}
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _cached_rankings(weight_values: tuple[float, ...]):
+    """rank_scenarios() keyed on the slider weights, in GOAL_IDS order."""
+    from hallar_risk_factors.goal_scoring import rank_scenarios
+    return rank_scenarios(dict(zip(GOAL_IDS, weight_values)))
 
 
 # ═════════════════════════════════════════════════════════════════════
-# GOAL DESCRIPTIONS (plain Icelandic)
+# HTML TEMPLATES — static markup bound once; renders fill in the fields
 # ═════════════════════════════════════════════════════════════════════
 
-GOAL_DESCRIPTIONS = {
-    "G1": "Götur og hluti innviða tilbúnir áður en flutt hefur verið inn í 300 íbúðir",
-    "G2": "Að minnsta kosti 400 íbúðir tilbúnar til afhendingar á hverju ári",
-    "G3": "Íbúðaverð verði 15-20% undir markaðsverði",
-    "G4": "Að borgin verði ekki af fjármunum við samningsgerð",
-    "G5": "Að verkefnið klárist að fullu eins og áætlað er",
-    "G6": "Að innviðaframkvæmdir haldist innan fjárhagsáætlunar",
-    "G7": "Að götur, innviðir og almenningssvæði séu vönduð og endingargóð",
-    "G8": "Að íbúðir og byggingar séu vandaðar og uppfylli gæðakröfur",
-    "G9": "Að borgin hafi áhrif á framkvæmdir og geti tryggt almannahagsmuni",
-    "G10": "Að fjölbreyttur hópur fólks geti búið á svæðinu, þ.m.t. tekjulágir",
-}
-
-GOAL_SHORT_LABELS = {
-    "G1": "Innviðahraði",
-    "G2": "Byggingarhraði",
-    "G3": "Hagkvæmni",
-    "G4": "Fjárhagslegir hagsmunir",
-    "G5": "Verklok",
-    "G6": "Kostnaður við innviði",
-    "G7": "Gæði innviða",
-    "G8": "Gæði bygginga",
-    "G9": "Stýring borgarinnar",
-    "G10": "Félagsleg blöndun",
-}
+_RESULT_CARD_TMPL = (
+    '<div class="result-card {style}">'
+    '<div style="display:flex;justify-content:space-between;align-items:flex-start;">'
+    '<div>'
+    '<div class="result-rank {style}">{label}</div>'
+    '<div class="result-name">{name}</div>'
+    '</div>'
+    '<div style="text-align:right;">'
+    '<div style="font-size:0.65rem;color:#94a3b8;text-transform:uppercase;letter-spacing:0.05em;">Áhættuskor</div>'
+    '<div style="font-size:1.4rem;font-weight:700;color:#334155;">{score:.1f}</div>'
+    '</div>'
+    '</div>'
+    '{desc_html}'
+    '</div>'
+).format
+
+_RANK_ROW_TMPL = (
+    '<div class="rank-row">'
+    '<span class="rank-label">{label}</span>'
+    '<div class="rank-bar-bg">'
+    '<div class="rank-bar-fill" style="width:{pct:.0f}%;background:{color};"></div>'
+    '</div>'
+    '<span class="rank-score" style="color:{color};">{score}/12</span>'
+    '</div>'
+).format
+
+_CHART_ROW_TMPL = (
+    '<div class="ranking-bar-row">'
+    '<span class="ranking-bar-rank">#{rank}</span>'
+    '<span class="ranking-bar-label">{name}</span>'
+    '<div class="ranking-bar-bg">'
+    '<div class="ranking-bar-fill" style="width:{pct:.0f}%;background:{color};">'
+    '{sid}</div>'
+    '</div>'
+    '</div>'
+).format
+
+# Strength / weakness tiles share the layout; the palette is passed in
+_GOAL_TILE_TMPL = (
+    '<div style="background:{bg};border:1px solid {border};'
+    'border-radius:10px;padding:14px 18px;margin-bottom:10px;">'
+    '<div style="display:flex;justify-content:space-between;align-items:center;">'
+    '<div>'
+    '<div style="font-size:0.92rem;font-weight:700;color:{title};">'
+    '{gid}: {short}</div>'
+    '<div style="font-size:0.8rem;color:#1e293b;margin-top:2px;">{desc}</div>'
+    '</div>'
+    '<div style="text-align:right;min-width:70px;">'
+    '<div style="font-size:1.4rem;font-weight:800;color:{color};">{score}/12</div>'
+    '</div></div>'
+    '<div style="background:{track};border-radius:4px;height:6px;'
+    'overflow:hidden;margin-top:8px;">'
+    '<div style="background:{color};border-radius:4px;height:6px;'
+    'width:{pct}%;"></div></div>'
+    '</div>'
+).format
+_STRONG_TILE = {"bg": "#f0fdf4", "border": "#bbf7d0", "title": "#166534", "track": "#dcfce7"}
+_WEAK_TILE = {"bg": "#fef2f2", "border": "#fecaca", "title": "#991b1b", "track": "#fee2e2"}
+
+_FORSENDUR_METRIC_TMPL = (
+    '<div class="forsendur-metric">'
+    '<div class="forsendur-metric-label">{label}</div>'
+    '<div class="forsendur-metric-value">{value}</div>'
+    '</div>'
+).format
+_FORSENDUR_METRIC_SMALL_TMPL = (
+    '<div class="forsendur-metric">'
+    '<div class="forsendur-metric-label">{label}</div>'
+    '<div class="forsendur-metric-value small">{value}</div>'
+    '</div>'
+).format
 
 
 # ═════════════════════════════════════════════════════════════════════
 # GOAL RANKING — comparative scores across all 12 scenarios
 # ═════════════════════════════════════════════════════════════════════
 
-@st.cache_data(ttl=300)
+@st.cache_data(show_spinner=False)
 def compute_goal_rankings():
     """Compute 1-12 score for every (scenario, goal) pair.
 
     Score 12 = best among all scenarios, 1 = worst.
     This is a pure ranking — it doesn't claim to predict absolute outcomes.
+    Pure with respect to the model code, so it is cached for the life of
+    the process; after editing model data call st.cache_data.clear() and
+    st.cache_resource.clear() (the profiles it reads are cached too).
+    Returns (scores, colors, emojis): (n_scenarios, n_goals) arrays indexed
+    via SCENARIO_INDEX / GOAL_INDEX, colors/emojis gathered from the rank LUTs.
     """
-    # Step 1: compute raw expected values
-    raw = {}
-    for sid in SCENARIO_IDS:
-        profile = calculate_scenario_goal_profile(sid)
-        for gid in GOAL_IDS:
-            gs = profile.goal_scores[gid]
-            raw[(sid, gid)] = gs.expected_value
-
-    # Step 2: rank within each goal
-    rankings = {}  # (sid, gid) → 1-12 score
-    for gid in GOAL_IDS:
-        goal = GOALS[gid]
-        vals = [(sid, raw[(sid, gid)]) for sid in SCENARIO_IDS]
-
-        # Sort: best first
-        if goal.direction == "higher_better":
-            vals.sort(key=lambda x: x[1], reverse=True)
-        else:
-            vals.sort(key=lambda x: x[1])
+    # Step 1: compute raw expected values, one row per scenario
+    raw = np.empty((len(SCENARIO_IDS), len(GOAL_IDS)))
+    goal_profiles = _all_goal_profiles()
+    for i, sid in enumerate(SCENARIO_IDS):
+        goal_scores = goal_profiles[sid].goal_scores
+        raw[i] = [goal_scores[gid].expected_value for gid in GOAL_IDS]
 
-        for rank_0, (sid, _val) in enumerate(vals):
-            rankings[(sid, gid)] = 12 - rank_0  # 12=best, 1=worst
+    # Step 2: rank within each goal (column); flip sign so best sorts first
+    signs = np.where(GOAL_HIGHER_BETTER, -1.0, 1.0)
+    order = np.argsort(raw * signs, axis=0, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(len(SCENARIO_IDS))[:, None], axis=0)
 
-    return rankings
+    scores = 12 - ranks  # 12=best, 1=worst
+    return scores, _RANK_COLOR_ARR[scores], _RANK_EMOJI_ARR[scores]
 
 
-def goal_rank_color(score: int) -> str:
-    """Return color for a 1-12 ranking score."""
-    if score >= 10:
-        return "#22c55e"   # green
-    elif score >= 7:
-        return "#84cc16"   # lime
-    elif score >= 4:
-        return "#f59e0b"   # amber
-    else:
-        return "#ef4444"   # red
+# Rank color/emoji LUTs indexed directly by the 0-12 score, so whole score
+# arrays are mapped with one fancy-index: 0-3 red, 4-6 amber, 7-9 lime, 10-12 green
+_RANK_COLOR_ARR = np.array(("#ef4444",) * 4 + ("#f59e0b",) * 3 + ("#84cc16",) * 3 + ("#22c55e",) * 3)
+_RANK_EMOJI_ARR = np.array(("🔴",) * 4 + ("🟠",) * 3 + ("🟡",) * 3 + ("🟢",) * 3)
+# Full-ranking chart bar colors, indexed by (rank - 1) // 3
+_CHART_COLOR_ARR = np.array(["#16a34a", "#2563eb", "#f59e0b", "#ef4444"])
+
+
+@st.cache_data(show_spinner=False)
+def compute_goal_rank_rows():
+    """Pre-rendered rank-bar rows, laid out like compute_goal_rankings().
+
+    Returns rows[scenario_index][goal_index] -> HTML, so a renderer joins
+    the goals it needs and emits them with a single st.markdown call.
+    """
+    goal_ranks, goal_colors, _ = compute_goal_rankings()
+    return tuple(
+        tuple(
+            _RANK_ROW_TMPL(label=GOAL_SHORT_LABELS[gid], pct=score / 12 * 100, color=color, score=score)
+            for gid, score, color in zip(GOAL_IDS, score_row, color_row)
+        )
+        for score_row, color_row in zip(goal_ranks, goal_colors)
+    )
+
+
+@st.cache_data(show_spinner=False)
+def compute_goal_status_md():
+    """Per-scenario "status vs other scenarios" list as one markdown string.
+
+    Built from the same rankings as compute_goal_rank_rows(), so the
+    expander under each result card reuses it instead of re-reading ranks.
+    """
+    goal_ranks, _, goal_emojis = compute_goal_rankings()
+    return tuple(
+        "\n\n".join(
+            f"{emoji} **{GOAL_SHORT_LABELS[gid]}:** {score}/12"
+            for gid, score, emoji in zip(GOAL_IDS, score_row, emoji_row)
+        )
+        for score_row, emoji_row in zip(goal_ranks, goal_emojis)
+    )
 
 
-def goal_rank_emoji(score: int) -> str:
-    """Return emoji for a 1-12 ranking score."""
-    if score >= 10:
-        return "🟢"
-    elif score >= 7:
-        return "🟡"
-    elif score >= 4:
-        return "🟠"
-    else:
-        return "🔴"
 # ═════════════════════════════════════════════════════════════════════
 # CSS — LIGHT THEME
 # ═════════════════════════════════════════════════════════════════════
 
-st.markdown("""
+@st.cache_resource
+def _app_css() -> str:
+    """Stylesheet shared by every session; built once per process."""
+    return """
 <style>
     /* ── Reset to light theme ──────────────────────────── */
     .stApp { background: #ffffff; }
@@ -375,6 +343,25 @@ st.markdown("""
         background: #ffffff !important;
     }
 
+    /* ── Factor tiles (plain <details>, styled like expanders) ── */
+    .factor-details {
+        border: 1px solid #e2e8f0;
+        border-radius: 8px;
+        margin-bottom: 8px;
+        background: #ffffff;
+    }
+    .factor-details > summary {
+        padding: 0.75rem 1rem;
+        cursor: pointer;
+        color: #1e293b;
+    }
+    .factor-body {
+        padding: 0 1rem 1rem 1rem;
+        color: #1e293b;
+        font-size: 0.9rem;
+        line-height: 1.6;
+    }
+
     /* ── Tab labels fix ────────────────────────────────── */
     .stTabs [data-baseweb="tab-list"] button p,
     .stTabs [data-baseweb="tab-list"] button span,
@@ -621,7 +608,11 @@ st.markdown("""
         color: #1e3a5f;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+# Re-emitted on every run: Streamlit drops elements a rerun does not write.
+st.markdown(_app_css(), unsafe_allow_html=True)
 
 
 # ═════════════════════════════════════════════════════════════════════
@@ -632,12 +623,6 @@ with st.sidebar:
     st.markdown("### 🏗️ Hallar DSS")
     st.caption("Stuðningur við\nþróun Hallarsvæðis")
 
-    page = st.radio(
-        "Síður",
-        ["📊 Kostnaður við innviði", "📊 Markmið og áherslur uppbyggingar", "🔍 Ítarleg lýsing á sviðsmyndum og áhættun", "📖 Aðferðafræði"],
-        label_visibility="collapsed",
-    )
-
     st.markdown("---")
     st.caption(
         " "
@@ -648,7 +633,79 @@ with st.sidebar:
 # PAGE 0: KOSTNAÐUR VIÐ INNVIÐI
 # ═════════════════════════════════════════════════════════════════════
 
-if page == "📊 Kostnaður við innviði":
+def _annuity_factor(r, n_years):
+    """Present value of 1 M ISK paid yearly for n_years at rate r.
+
+    Shared by both annuity helpers so (1 + r)^(-n) is evaluated once;
+    accepts scalars or arrays (e.g. an ROI × term sweep).
+    """
+    if np.ndim(r) == 0 and np.ndim(n_years) == 0:
+        # Slider path: plain float math, no array round-trip
+        r, n_years = float(r), float(n_years)
+        return (1 - (1 + r) ** (-n_years)) / r if r > 0 else n_years
+    r = np.asarray(r, dtype=float)
+    n_years = np.asarray(n_years, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(r > 0, (1 - (1 + r) ** (-n_years)) / r, n_years)
+
+
+def _pv_annuity(payment, r, n_years):
+    return payment * _annuity_factor(r, n_years)
+
+
+def _annuity_payment(pv_target, r, n_years):
+    return pv_target / _annuity_factor(r, np.maximum(n_years, 1))
+
+
+def school_counts(children, kg_capacity, school_capacity, kg_share, school_share):
+    """Kindergartens and schools needed for a given number of children.
+
+    Returns (n_kindergartens, n_schools, kg_children, school_children).
+    Scalars and equally-shaped NumPy arrays (e.g. a sensitivity grid)
+    both work; counts are ints (int32 arrays), and 0 wherever a capacity
+    is not positive.
+    """
+    kg_children = children * kg_share
+    school_children = children * school_share
+    n_kindergartens = _ceil_count(kg_children, kg_capacity)
+    n_schools = _ceil_count(school_children, school_capacity)
+    return n_kindergartens, n_schools, kg_children, school_children
+
+
+def _ceil_count(need, capacity):
+    """ceil(need / capacity) as a whole count, 0 if capacity <= 0."""
+    if np.ndim(need) == 0 and np.ndim(capacity) == 0:
+        # Ceiling division without NumPy dispatch: -(-a // b) == ceil(a / b)
+        return int(-(-need // capacity)) if capacity > 0 else 0
+    capacity = np.asarray(capacity)
+    positive = capacity > 0
+    return np.where(
+        positive, -(-np.asarray(need) // np.where(positive, capacity, 1)), 0
+    ).astype(np.int32)
+
+
+def compute_infra(apartments, avg_unit_sqm, residents_per_unit, kids_per_unit,
+                  kg_share, school_share, kg_capacity, school_capacity,
+                  kg_cost_misk, school_cost_misk, open_areas_misk):
+    """Derived quantities for cost-page sections A–C.
+
+    Returns (population, children, total_res_sqm, kg_children,
+    school_children, n_kindergartens, n_schools, infra_total_misk).
+    """
+    population = apartments * residents_per_unit
+    children = apartments * kids_per_unit
+    total_res_sqm = apartments * avg_unit_sqm
+    n_kindergartens, n_schools, kg_children, school_children = school_counts(
+        children, kg_capacity, school_capacity, kg_share, school_share,
+    )
+    n_kindergartens, n_schools = int(n_kindergartens), int(n_schools)
+    infra_total_misk = n_kindergartens * kg_cost_misk + n_schools * school_cost_misk + open_areas_misk
+    return (population, children, total_res_sqm, kg_children, school_children,
+            n_kindergartens, n_schools, infra_total_misk)
+
+
+@st.fragment
+def _page_costs():
 
     st.markdown('<div class="page-header">Innviðir  ↔  Byggingarréttur</div>', unsafe_allow_html=True)
     st.markdown(
@@ -660,17 +717,6 @@ if page == "📊 Kostnaður við innviði":
         unsafe_allow_html=True,
     )
 
-    # ── Helper functions ──
-    def _pv_annuity(payment, r, n_years):
-        if r <= 0:
-            return payment * n_years
-        return payment * (1 - (1 + r) ** (-n_years)) / r
-
-    def _annuity_payment(pv_target, r, n_years):
-        if r <= 0:
-            return pv_target / max(1, n_years)
-        return pv_target * r / (1 - (1 + r) ** (-n_years))
-
     # ── A) Íbúðir, íbúar og börn ──────────────────────────────────
     st.markdown('<hr class="forsendur-divider">', unsafe_allow_html=True)
     st.markdown('<div class="section-label">A) Íbúðir, íbúar og börn</div>', unsafe_allow_html=True)
@@ -683,33 +729,6 @@ if page == "📊 Kostnaður við innviði":
         residents_per_unit = st.slider("Íbúar á íbúð (meðaltal)", 1.5, 3.5, 2.3, 0.1)
         kids_per_unit = st.slider("Börn á íbúð (meðaltal)", 0.0, 1.5, 0.45, 0.05)
 
-    population = apartments * residents_per_unit
-    children = apartments * kids_per_unit
-    total_res_sqm = apartments * avg_unit_sqm
-
-    with a_right:
-        st.markdown(
-            f'<div class="forsendur-metric">'
-            f'<div class="forsendur-metric-label">Áætlaðir íbúar</div>'
-            f'<div class="forsendur-metric-value">{population:,.0f}</div>'
-            f'</div>',
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            f'<div class="forsendur-metric">'
-            f'<div class="forsendur-metric-label">Áætluð börn (alls)</div>'
-            f'<div class="forsendur-metric-value">{children:,.0f}</div>'
-            f'</div>',
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            f'<div class="forsendur-metric">'
-            f'<div class="forsendur-metric-label">Heildarflatarmál íbúða (m²)</div>'
-            f'<div class="forsendur-metric-value">{total_res_sqm:,.0f}</div>'
-            f'</div>',
-            unsafe_allow_html=True,
-        )
-
     # ── B) Þjónustuþörf og skólaþörf ──────────────────────────────
     st.markdown('<hr class="forsendur-divider">', unsafe_allow_html=True)
     st.markdown('<div class="section-label">B) Þjónustuþörf og skólaþörf</div>', unsafe_allow_html=True)
@@ -722,34 +741,6 @@ if page == "📊 Kostnaður við innviði":
         kg_capacity = st.slider("Leikskóli — pláss (börn)", 60, 200, 120, 10)
         school_capacity = st.slider("Grunnskóli — pláss (nemendur)", 300, 1200, 600, 50)
 
-    kg_children = children * kg_share
-    school_children = children * school_share
-    n_kindergartens = int(np.ceil(kg_children / kg_capacity)) if kg_capacity > 0 else 0
-    n_schools = int(np.ceil(school_children / school_capacity)) if school_capacity > 0 else 0
-
-    with b_right:
-        st.markdown(
-            f'<div class="forsendur-breakdown">'
-            f'Leikskólabörn (áætlað): <strong>{kg_children:,.0f}</strong><br>'
-            f'Grunnskólabörn (áætlað): <strong>{school_children:,.0f}</strong>'
-            f'</div>',
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            f'<div class="forsendur-metric">'
-            f'<div class="forsendur-metric-label">Leikskólar (fjöldi)</div>'
-            f'<div class="forsendur-metric-value">{n_kindergartens}</div>'
-            f'</div>',
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            f'<div class="forsendur-metric">'
-            f'<div class="forsendur-metric-label">Grunnskólar (fjöldi)</div>'
-            f'<div class="forsendur-metric-value">{n_schools}</div>'
-            f'</div>',
-            unsafe_allow_html=True,
-        )
-
     st.markdown(
         '<div class="forsendur-note">Markmiðið er að sjá næmni: fleiri íbúar/börn → '
         'meiri þörf fyrir innviði → Aukinn kostnaður við innviði → Afhending stærri hluta af byggingarrétti.</div>',
@@ -772,22 +763,52 @@ if page == "📊 Kostnaður við innviði":
         school_cost_misk = st.slider("Grunnskóli kostnaður (M ISK / hver)", 6000, 9000, 7000, 250)
         open_areas_misk = st.slider("Opin svæði / almenningsrými (M ISK heild)", 0, 20000, 6000, 250)
 
-    infra_total_misk = n_kindergartens * kg_cost_misk + n_schools * school_cost_misk + open_areas_misk
+    # Results for A–C are filled into the right-hand columns once every input
+    # is known; memoized so e.g. dragging the ROI slider skips the arithmetic.
+    infra_key = (
+        apartments, avg_unit_sqm, residents_per_unit, kids_per_unit,
+        kg_share, school_share, kg_capacity, school_capacity,
+        kg_cost_misk, school_cost_misk, open_areas_misk,
+    )
+    if st.session_state.get("_infra_key") != infra_key:
+        st.session_state["_infra_key"] = infra_key
+        st.session_state["_infra"] = compute_infra(*infra_key)
+    (population, children, total_res_sqm, kg_children, school_children,
+     n_kindergartens, n_schools, infra_total_misk) = st.session_state["_infra"]
 
-    with c_right:
+    with a_right:
         st.markdown(
-            f'<div class="forsendur-metric">'
-            f'<div class="forsendur-metric-label">Heildarkostnaður innviða (M ISK)</div>'
-            f'<div class="forsendur-metric-value">{infra_total_misk:,.0f}</div>'
-            f'</div>',
+            "".join([
+                _FORSENDUR_METRIC_TMPL(label="Áætlaðir íbúar", value=f"{population:,.0f}"),
+                _FORSENDUR_METRIC_TMPL(label="Áætluð börn (alls)", value=f"{children:,.0f}"),
+                _FORSENDUR_METRIC_TMPL(label="Heildarflatarmál íbúða (m²)", value=f"{total_res_sqm:,.0f}"),
+            ]),
             unsafe_allow_html=True,
         )
+
+    with b_right:
         st.markdown(
-            f'<div class="forsendur-breakdown">'
-            f'• Leikskólar: {n_kindergartens} × {kg_cost_misk:,} = <strong>{n_kindergartens * kg_cost_misk:,.0f} M ISK</strong><br>'
-            f'• Grunnskólar: {n_schools} × {school_cost_misk:,} = <strong>{n_schools * school_cost_misk:,.0f} M ISK</strong><br>'
-            f'• Opin svæði: <strong>{open_areas_misk:,.0f} M ISK</strong>'
-            f'</div>',
+            "".join([
+                f'<div class="forsendur-breakdown">'
+                f'Leikskólabörn (áætlað): <strong>{kg_children:,.0f}</strong><br>'
+                f'Grunnskólabörn (áætlað): <strong>{school_children:,.0f}</strong>'
+                f'</div>',
+                _FORSENDUR_METRIC_TMPL(label="Leikskólar (fjöldi)", value=n_kindergartens),
+                _FORSENDUR_METRIC_TMPL(label="Grunnskólar (fjöldi)", value=n_schools),
+            ]),
+            unsafe_allow_html=True,
+        )
+
+    with c_right:
+        st.markdown(
+            "".join([
+                _FORSENDUR_METRIC_TMPL(label="Heildarkostnaður innviða (M ISK)", value=f"{infra_total_misk:,.0f}"),
+                f'<div class="forsendur-breakdown">'
+                f'• Leikskólar: {n_kindergartens} × {kg_cost_misk:,} = <strong>{n_kindergartens * kg_cost_misk:,.0f} M ISK</strong><br>'
+                f'• Grunnskólar: {n_schools} × {school_cost_misk:,} = <strong>{n_schools * school_cost_misk:,.0f} M ISK</strong><br>'
+                f'• Opin svæði: <strong>{open_areas_misk:,.0f} M ISK</strong>'
+                f'</div>',
+            ]),
             unsafe_allow_html=True,
         )
 
@@ -850,27 +871,17 @@ if page == "📊 Kostnaður við innviði":
 
         with e_right:
             st.markdown(
-                f'<div class="forsendur-metric">'
-                f'<div class="forsendur-metric-label">Byggingarréttur (M ISK)</div>'
-                f'<div class="forsendur-metric-value small">{rights_given_misk:,.0f}</div>'
-                f'</div>',
-                unsafe_allow_html=True,
-            )
-            st.markdown(
-                f'<div class="forsendur-metric">'
-                f'<div class="forsendur-metric-label">Árleg leiga (M ISK / ár)</div>'
-                f'<div class="forsendur-metric-value small">{annual_rent_misk:,.0f}</div>'
-                f'</div>',
-                unsafe_allow_html=True,
-            )
-            st.markdown(
-                f'<div class="forsendur-breakdown">'
-                f'PV(leigu) við ROI={roi:.3f}'
-                f'{f" og {term_years} ár" if term_years else ""}: '
-                f'<strong>{pv_rent:,.0f} M ISK</strong><br>'
-                f'Samtals PV (byggingarréttur + leiga): '
-                f'<strong>{(rights_given_misk + pv_rent):,.0f} M ISK</strong>'
-                f'</div>',
+                "".join([
+                    _FORSENDUR_METRIC_SMALL_TMPL(label="Byggingarréttur (M ISK)", value=f"{rights_given_misk:,.0f}"),
+                    _FORSENDUR_METRIC_SMALL_TMPL(label="Árleg leiga (M ISK / ár)", value=f"{annual_rent_misk:,.0f}"),
+                    f'<div class="forsendur-breakdown">'
+                    f'PV(leigu) við ROI={roi:.3f}'
+                    f'{f" og {term_years} ár" if term_years else ""}: '
+                    f'<strong>{pv_rent:,.0f} M ISK</strong><br>'
+                    f'Samtals PV (byggingarréttur + leiga): '
+                    f'<strong>{(rights_given_misk + pv_rent):,.0f} M ISK</strong>'
+                    f'</div>',
+                ]),
                 unsafe_allow_html=True,
             )
 
@@ -890,18 +901,12 @@ if page == "📊 Kostnaður við innviði":
     f_res_left, f_res_right = st.columns(2, gap="large")
     with f_res_left:
         st.markdown(
-            f'<div class="forsendur-metric">'
-            f'<div class="forsendur-metric-label">Byggingarréttur afhentur (M ISK)</div>'
-            f'<div class="forsendur-metric-value">{float(rights_given_misk):,.0f}</div>'
-            f'</div>',
+            _FORSENDUR_METRIC_TMPL(label="Byggingarréttur afhentur (M ISK)", value=f"{float(rights_given_misk):,.0f}"),
             unsafe_allow_html=True,
         )
     with f_res_right:
         st.markdown(
-            f'<div class="forsendur-metric">'
-            f'<div class="forsendur-metric-label">Byggingarréttur sem m²</div>'
-            f'<div class="forsendur-metric-value">{sqm_required:,.0f} m²</div>'
-            f'</div>',
+            _FORSENDUR_METRIC_TMPL(label="Byggingarréttur sem m²", value=f"{sqm_required:,.0f} m²"),
             unsafe_allow_html=True,
         )
 
@@ -920,18 +925,30 @@ if page == "📊 Kostnaður við innviði":
             "n_kindergartens": n_kindergartens,
             "n_schools": n_schools,
             "infra_total_misk": infra_total_misk,
-            "infra_total_misk": infra_total_misk,
             "rights_given_misk": rights_given_misk,
             "model": model.split(":")[0].strip(),
         }
         st.success("Forsendur vistaðar.")
 
 
+def _band_p(p):
+    """Likely probability rounded to 1e-9 for the 15/20/40/50% bands.
+
+    Several risks sit exactly on a band edge, so last-bit noise from the
+    logistic transform must not move them between bands. Accepts scalars
+    or arrays.
+    """
+    return np.round(p, 9) if np.ndim(p) else round(p, 9)
+
+
 # ═════════════════════════════════════════════════════════════════════
 # PAGE 1: MARKMIÐ OG ÁHERSLUR
 # ═════════════════════════════════════════════════════════════════════
 
-elif page == "📊 Markmið og áherslur uppbyggingar":
+@st.fragment
+def _page_goals():
+    from justifications_and_calculator import RISK_CONFIDENCE
+
 
     st.markdown('<div class="page-header">Markmið uppbyggingar Hallarsvæðisins</div>', unsafe_allow_html=True)
     st.markdown(
@@ -951,7 +968,6 @@ elif page == "📊 Markmið og áherslur uppbyggingar":
     col_left, col_right = st.columns(2)
 
     for i, gid in enumerate(GOAL_IDS):
-        goal = GOALS[gid]
         short = GOAL_SHORT_LABELS[gid]
         desc = GOAL_DESCRIPTIONS[gid]
         target_col = col_left if i < 5 else col_right
@@ -980,15 +996,23 @@ elif page == "📊 Markmið og áherslur uppbyggingar":
         st.info("Dragðu einn eða fleiri renna til hægri til að forgangsraða markmiðum.")
         st.stop()
 
-    # ── Run Rankings ─────────────────────────────────────────────
-    rankings = rank_scenarios(weights)
+    # Goals with a weight, highest priority first — same order on all cards
+    active_goals = sorted(
+        ((gid, w) for gid, w in weights.items() if w > 0), key=itemgetter(1), reverse=True,
+    )
 
-    # Compute goal profiles for top scenarios
-    all_goal_profiles = {}
-    all_risk_profiles = {}
-    for r in rankings:
-        all_goal_profiles[r.scenario_id] = calculate_scenario_goal_profile(r.scenario_id)
-        all_risk_profiles[r.scenario_id] = calculate_scenario_risk_profile(r.scenario_id)
+    # ── Run Rankings ─────────────────────────────────────────────
+    # Memoized on the weights so reruns that only open an expander skip
+    # even the cache_data round-trip for the rankings.
+    weights_key = tuple(weights[gid] for gid in GOAL_IDS)
+    if st.session_state.get("_rankings_key") != weights_key:
+        st.session_state["_rankings_key"] = weights_key
+        st.session_state["_rankings"] = _cached_rankings(weights_key)
+    rankings = st.session_state["_rankings"]
+    all_goal_profiles = _all_goal_profiles()
+    all_risk_profiles = _all_risk_profiles()
+    goal_rank_rows = compute_goal_rank_rows()
+    goal_status_md = compute_goal_status_md()
 
     # ── Results: Top 3 ───────────────────────────────────────────
     st.markdown("")
@@ -1016,63 +1040,30 @@ elif page == "📊 Markmið og áherslur uppbyggingar":
         rank = rank_obj.rank
         style = rank_styles[rank]
         label = rank_labels[rank]
-        name = scenario_name(sid)
-        desc = scenario_desc(sid)
+        name = SCENARIO_NAMES[sid]
+        desc_html = _DESC_HTML[sid]
         gp = all_goal_profiles[sid]
         rp = all_risk_profiles[sid]
 
         score = rank_obj.total_score
 
-        st.markdown(
-            f'<div class="result-card {style}">'
-            f'<div style="display:flex;justify-content:space-between;align-items:flex-start;">'
-            f'<div>'
-            f'<div class="result-rank {style}">{label}</div>'
-            f'<div class="result-name">{name}</div>'
-            f'</div>'
-            f'<div style="text-align:right;">'
-            f'<div style="font-size:0.65rem;color:#94a3b8;text-transform:uppercase;letter-spacing:0.05em;">Áhættuskor</div>'
-            f'<div style="font-size:1.4rem;font-weight:700;color:#334155;">{score:.1f}</div>'
-            f'</div>'
-            f'</div>'
-            f'<div class="result-desc">{desc}</div>'
-            f'</div>',
-            unsafe_allow_html=True,
-        )
+        card_parts = [
+            _RESULT_CARD_TMPL(style=style, label=label, name=name, score=score, desc_html=desc_html),
+        ]
 
-        # ── Ranking visualization ─────────────────────────────
+        # ── Ranking visualization (same markdown message as the card) ──
         if gp:
-            goal_ranks = compute_goal_rankings()
-            rank_html = ""
-            active_goals = [(gid, weights[gid]) for gid in GOAL_IDS if weights[gid] > 0]
-            # Sort by user weight (highest priority first) — same order on all cards
-            active_goals.sort(key=lambda x: x[1], reverse=True)
-
-            for gid, w in active_goals:
-                short = GOAL_SHORT_LABELS[gid]
-                score = goal_ranks.get((sid, gid), 6)
-                bar_pct = score / 12 * 100
-                color = goal_rank_color(score)
-
-                rank_html += (
-                    f'<div class="rank-row">'
-                    f'<span class="rank-label">{short}</span>'
-                    f'<div class="rank-bar-bg">'
-                    f'<div class="rank-bar-fill" style="width:{bar_pct:.0f}%;background:{color};"></div>'
-                    f'</div>'
-                    f'<span class="rank-score" style="color:{color};">{score}/12</span>'
-                    f'</div>'
+            rank_rows = goal_rank_rows[SCENARIO_INDEX[sid]]
+            if active_goals:
+                card_parts.append(
+                    '<div style="margin-top:24px;margin-bottom:8px;padding:0 24px;">'
+                    '<div style="font-size:0.8rem;font-weight:600;color:#64748b;'
+                    'margin-bottom:6px;">Staða miðað við aðrar samningsleiðir (12 = best):</div>'
                 )
+                card_parts.extend(rank_rows[GOAL_INDEX[gid]] for gid, _w in active_goals)
+                card_parts.append('</div>')
 
-            if rank_html:
-                st.markdown(
-                    f'<div style="margin-top:-12px;margin-bottom:8px;padding:0 24px;">'
-                    f'<div style="font-size:0.8rem;font-weight:600;color:#64748b;'
-                    f'margin-bottom:6px;">Staða miðað við aðrar samningsleiðir (12 = best):</div>'
-                    f'{rank_html}'
-                    f'</div>',
-                    unsafe_allow_html=True,
-                )
+        st.markdown("".join(card_parts), unsafe_allow_html=True)
 
         # ── Expandable detail ────────────────────────────────
         with st.expander(f"Sjá nánari greiningu — {name}"):
@@ -1082,7 +1073,8 @@ elif page == "📊 Markmið og áherslur uppbyggingar":
                 st.markdown("**Helstu áhættur í þessari sviðsmynd:**")
                 if rp:
                     for risk in rp.top_risks(5):
-                        p = risk.prob_likely
+                        p = _band_p(risk.prob_likely)
+                        ipct = round(p * 100)  # same digits as f"{p*100:.0f}"
                         if p > 0.40:
                             icon = "🔴"
                         elif p > 0.20:
@@ -1097,29 +1089,23 @@ elif page == "📊 Markmið og áherslur uppbyggingar":
                             conf_note = f" · Öryggi mats: {conf.tier}"
 
                         st.markdown(
-                            f'{icon} **{risk.name_is}** — {p*100:.0f}% líkur{conf_note}'
+                            f'{icon} **{risk.name_is}** — {ipct}% líkur{conf_note}'
                         )
 
-                        # Show what drives this risk
-                        if risk.breakdown:
-                            drivers = []
-                            for fid, effect, _desc in risk.breakdown:
-                                if effect < 0.85:
-                                    drivers.append(f"{STRUCTURAL_FACTORS[fid].name_is} lækkar áhættu")
-                                elif effect > 1.15:
-                                    drivers.append(f"{STRUCTURAL_FACTORS[fid].name_is} hækkar áhættu")
-                            if drivers:
-                                st.caption("  " + " · ".join(drivers[:2]))
+                        # Show what drives this risk (first two non-neutral factors)
+                        effects = risk.effects
+                        strong = np.flatnonzero((effects < 0.85) | (effects > 1.15))[:2]
+                        if strong.size:
+                            st.caption("  " + " · ".join(
+                                f"{STRUCTURAL_FACTORS[risk.factor_ids[k]].name_is} "
+                                f"{'lækkar' if effects[k] < 0.85 else 'hækkar'} áhættu"
+                                for k in strong
+                            ))
 
             with detail_col2:
                 st.markdown("**Staða í samanburði við aðrar leiðir:**")
                 if gp:
-                    goal_ranks = compute_goal_rankings()
-                    for gid in GOAL_IDS:
-                        short = GOAL_SHORT_LABELS[gid]
-                        score = goal_ranks.get((sid, gid), 6)
-                        emoji = goal_rank_emoji(score)
-                        st.markdown(f"{emoji} **{short}:** {score}/12")
+                    st.markdown(goal_status_md[SCENARIO_INDEX[sid]])
 
         st.markdown("")  # spacer
 
@@ -1134,38 +1120,20 @@ elif page == "📊 Markmið og áherslur uppbyggingar":
         unsafe_allow_html=True,
     )
 
-    # Normalize scores for display
-    scores = [(r.scenario_id, r.total_score, r.rank) for r in rankings]
-    max_score = max(s[1] for s in scores) if scores else 1
-    min_score = min(s[1] for s in scores) if scores else 0
-
-    chart_html = ""
-    for sid, score, rank in scores:
-        name = scenario_name(sid)
-        # Bar width: best = 20%, worst = 100%
-        bar_pct = 20 + (score - min_score) / (max_score - min_score + 0.01) * 80
-
-        if rank <= 3:
-            color = "#16a34a"
-        elif rank <= 6:
-            color = "#2563eb"
-        elif rank <= 9:
-            color = "#f59e0b"
-        else:
-            color = "#ef4444"
-
-        chart_html += (
-            f'<div class="ranking-bar-row">'
-            f'<span class="ranking-bar-rank">#{rank}</span>'
-            f'<span class="ranking-bar-label">{name}</span>'
-            f'<div class="ranking-bar-bg">'
-            f'<div class="ranking-bar-fill" style="width:{bar_pct:.0f}%;background:{color};">'
-            f'{sid}</div>'
-            f'</div>'
-            f'</div>'
-        )
+    # Normalize scores for display: best = 20% bar width, worst = 100%
+    totals = np.fromiter((r.total_score for r in rankings), dtype=np.float64, count=len(rankings))
+    bar_pcts = 20 + (totals - totals.min()) / (np.ptp(totals) + 0.01) * 80
+    ranks = np.fromiter((r.rank for r in rankings), dtype=np.intp, count=len(rankings))
+    # Ranks 1-3 green, 4-6 blue, 7-9 amber, 10+ red
+    colors = _CHART_COLOR_ARR[np.minimum((ranks - 1) // 3, 3)]
 
-    st.markdown(chart_html, unsafe_allow_html=True)
+    chart_parts = []
+    for r, bar_pct, color in zip(rankings, bar_pcts, colors):
+        sid, rank = r.scenario_id, r.rank
+        name = SCENARIO_NAMES[sid]
+        chart_parts.append(_CHART_ROW_TMPL(rank=rank, name=name, pct=bar_pct, color=color, sid=sid))
+
+    st.markdown("".join(chart_parts), unsafe_allow_html=True)
     st.caption("Grænnar súlur = lægri áhætta. Rauðar súlur = hærri áhætta.")
 
 
@@ -1173,7 +1141,123 @@ elif page == "📊 Markmið og áherslur uppbyggingar":
 # PAGE 2: ÍTARLEG LÝSING Á SVIÐSMYNDUM OG ÁHÆTTUM
 # ═════════════════════════════════════════════════════════════════════
 
-elif page == "🔍 Ítarleg lýsing á sviðsmyndum og áhættun":
+@st.cache_data(show_spinner=False)
+def _risk_card_body(scenario_id: str, risk_id: str) -> str:
+    """Body HTML of a top-threat expander on the scenario page.
+
+    Depends only on the scenario and the risk, so each of the
+    12 × 33 bodies is built at most once and reruns only emit it.
+    """
+    risk = next(r for r in _all_risk_profiles()[scenario_id].risks if r.risk_id == risk_id)
+    sf = SCENARIO_FACTORS[scenario_id]
+    p = _band_p(risk.prob_likely)
+    # p < 1 (clamped in the model), so the rounded percent doubles as bar width
+    ipct = round(p * 100)
+    color = "#ef4444" if p > 0.40 else ("#f59e0b" if p > 0.20 else "#fb923c")
+
+    # Probability bar and range, then drivers and goals, in one block
+    parts = [
+        f'<div style="background:#e2e8f0;border-radius:4px;height:10px;'
+        f'overflow:hidden;margin-bottom:8px;">'
+        f'<div style="background:{color};border-radius:4px;height:10px;'
+        f'width:{ipct}%;"></div></div>',
+        f'<div style="font-size:0.8rem;color:#475569;">'
+        f'Svið: {round(risk.prob_low * 100)}% – '
+        f'<strong style="color:#1e293b;">{ipct}%</strong> – '
+        f'{round(risk.prob_high * 100)}%</div>',
+    ]
+
+    # What drives this risk
+    fids, effects = risk.factor_ids, risk.effects
+    up, down = effects > 1.15, effects < 0.85
+    if up.any() or down.any():
+        parts.append(
+            '<div style="font-size:0.85rem;font-weight:600;color:#1e293b;'
+            'margin-top:12px;">Hvað stýrir þessari áhættu:</div>'
+        )
+        parts.extend(
+            f'<div style="color:#1e293b;font-size:0.85rem;">⚡ {STRUCTURAL_FACTORS[fid].name_is} = '
+            f'{sf.get_factor(fid)}/5 → {effect:.2f}× (hækkar áhættu)</div>'
+            for fid, effect in zip(fids[up], effects[up])
+        )
+        parts.extend(
+            f'<div style="color:#1e293b;font-size:0.85rem;">🛡️ {STRUCTURAL_FACTORS[fid].name_is} = '
+            f'{sf.get_factor(fid)}/5 → {effect:.2f}× (lækkar áhættu)</div>'
+            for fid, effect in zip(fids[down], effects[down])
+        )
+
+    # Affected goals
+    aff = [f"{gid}: {GOAL_SHORT_LABELS[gid]}" for gid in risk.affected_goals if gid in GOAL_INDEX]
+    if aff:
+        parts.append(
+            f'<div style="font-size:0.82rem;color:#1e293b;margin-top:8px;">'
+            f'<strong>Hefur áhrif á:</strong> {", ".join(aff)}</div>'
+        )
+
+    return "".join(parts)
+
+
+_BOLD_MD = re.compile(r"\*\*(.+?)\*\*")
+
+
+def _md_to_html(text: str) -> str:
+    """Justification text (**bold** + blank-line paragraphs) as inline HTML.
+
+    Kept newline-free so the whole factor tab stays one raw HTML block.
+    """
+    paras = []
+    for para in text.split("\n\n"):
+        para = _BOLD_MD.sub(r"<strong>\1</strong>", para).replace("\n", "<br>")
+        paras.append(f"<p>{para}</p>")
+    return "".join(paras)
+
+
+@st.cache_data(show_spinner=False)
+def _factors_tab_html(scenario_id: str) -> str:
+    """All seven F1–F7 tiles of the scenario page as one HTML block."""
+    from hallar_risk_factors.structural_factors import get_scenario_profile
+    from justifications_and_calculator import SCENARIO_FACTOR_JUSTIFICATIONS
+
+    factor_profile = get_scenario_profile(scenario_id)
+    justifications = SCENARIO_FACTOR_JUSTIFICATIONS.get(scenario_id, {})
+
+    parts = []
+    for fid in FACTOR_IDS:
+        factor = STRUCTURAL_FACTORS[fid]
+        score = factor_profile[fid]
+        just = justifications.get(fid, "")
+
+        # Color logic: F1 is inverted (lower = better)
+        if fid == "F1":
+            color = "#22c55e" if score <= 2 else ("#f59e0b" if score <= 3 else "#ef4444")
+        else:
+            color = "#ef4444" if score <= 2 else ("#f59e0b" if score <= 3 else "#22c55e")
+
+        bar_pct = score / 5 * 100
+
+        parts.append(
+            f'<details class="factor-details">'
+            f'<summary><strong>{fid}: {factor.name_is}</strong> — {score}/5</summary>'
+            f'<div class="factor-body">'
+            f'<div style="display:flex;align-items:center;gap:12px;margin-bottom:12px;">'
+            f'<div style="font-size:1.8rem;font-weight:800;color:{color};">{score}</div>'
+            f'<div style="flex:1;">'
+            f'<div style="background:#e2e8f0;border-radius:4px;height:10px;overflow:hidden;">'
+            f'<div style="background:{color};border-radius:4px;height:10px;width:{bar_pct}%;"></div>'
+            f'</div>'
+            f'<div style="display:flex;justify-content:space-between;margin-top:4px;'
+            f'font-size:0.7rem;color:#64748b;">'
+            f'<span>{factor.scale_low}</span><span>{factor.scale_high}</span>'
+            f'</div></div></div>'
+        )
+        if just:
+            parts.append(_md_to_html(just))
+        parts.append('</div></details>')
+
+    return "".join(parts)
+
+
+def _page_scenarios():
 
     st.markdown('<div class="page-header">Ítarleg lýsing á sviðsmyndum</div>', unsafe_allow_html=True)
     st.markdown(
@@ -1187,12 +1271,11 @@ elif page == "🔍 Ítarleg lýsing á sviðsmyndum og áhættun":
     selected = st.selectbox(
         "Veldu sviðsmynd",
         SCENARIO_IDS,
-        format_func=lambda sid: f"{sid}: {scenario_name(sid)}",
+        format_func=lambda sid: f"{sid}: {SCENARIO_NAMES[sid]}",
     )
 
-    sf = SCENARIO_FACTORS[selected]
-    name = scenario_name(selected)
-    desc = scenario_desc(selected)
+    name = SCENARIO_NAMES[selected]
+    desc = SCENARIO_DESCS[selected]
 
     # ── Hero: scenario description ────────────────────────────────
     st.markdown(
@@ -1206,10 +1289,8 @@ elif page == "🔍 Ítarleg lýsing á sviðsmyndum og áhættun":
     )
 
     # ── Compute data for all tabs ─────────────────────────────────
-    factor_profile = get_scenario_profile(selected)
-    justifications = SCENARIO_FACTOR_JUSTIFICATIONS.get(selected, {})
-    risk_profile = calculate_scenario_risk_profile(selected)
-    goal_ranks = compute_goal_rankings()
+    risk_profile = _all_risk_profiles()[selected]
+    goal_ranks, goal_colors, _ = compute_goal_rankings()
 
     # ── Three tabs ────────────────────────────────────────────────
     tab_factors, tab_risks, tab_goals = st.tabs([
@@ -1231,38 +1312,7 @@ elif page == "🔍 Ítarleg lýsing á sviðsmyndum og áhættun":
             unsafe_allow_html=True,
         )
 
-        for fid in FACTOR_IDS:
-            factor = STRUCTURAL_FACTORS[fid]
-            score = factor_profile[fid]
-            just = justifications.get(fid, "")
-
-            # Color logic: F1 is inverted (lower = better)
-            if fid == "F1":
-                color = "#22c55e" if score <= 2 else ("#f59e0b" if score <= 3 else "#ef4444")
-            else:
-                color = "#ef4444" if score <= 2 else ("#f59e0b" if score <= 3 else "#22c55e")
-
-            bar_pct = score / 5 * 100
-
-            with st.expander(f"**{fid}: {factor.name_is}** — {score}/5"):
-                st.markdown(
-                    f'<div style="display:flex;align-items:center;gap:12px;margin-bottom:12px;">'
-                    f'<div style="font-size:1.8rem;font-weight:800;color:{color};">{score}</div>'
-                    f'<div style="flex:1;">'
-                    f'<div style="background:#e2e8f0;border-radius:4px;height:10px;overflow:hidden;">'
-                    f'<div style="background:{color};border-radius:4px;height:10px;width:{bar_pct}%;"></div>'
-                    f'</div>'
-                    f'<div style="display:flex;justify-content:space-between;margin-top:4px;'
-                    f'font-size:0.7rem;color:#64748b;">'
-                    f'<span>{factor.scale_low}</span><span>{factor.scale_high}</span>'
-                    f'</div></div></div>',
-                    unsafe_allow_html=True,
-                )
-                if just:
-                    st.markdown(
-                        f'<div style="color:#1e293b;font-size:0.9rem;line-height:1.6;">{just}</div>',
-                        unsafe_allow_html=True,
-                    )
+        st.markdown(_factors_tab_html(selected), unsafe_allow_html=True)
 
     # ══════════════════════════════════════════════════════════════
     # TAB 2: ÁHÆTTUR
@@ -1272,12 +1322,14 @@ elif page == "🔍 Ítarleg lýsing á sviðsmyndum og áhættun":
             st.error("Villa við útreikning.")
             st.stop()
 
-        sorted_risks = sorted(risk_profile.risks, key=lambda r: r.prob_likely, reverse=True)
+        sorted_risks = sorted(risk_profile.risks, key=attrgetter("prob_likely"), reverse=True)
+
+        probs = _band_p(np.fromiter((r.prob_likely for r in sorted_risks), dtype=np.float64, count=len(sorted_risks)))
 
         # ── Summary metrics ───────────────────────────────────
-        high = sum(1 for r in sorted_risks if r.prob_likely > 0.40)
-        med = sum(1 for r in sorted_risks if 0.20 <= r.prob_likely <= 0.40)
-        low = sum(1 for r in sorted_risks if r.prob_likely < 0.20)
+        high = int((probs > 0.40).sum())
+        med = int(((probs >= 0.20) & (probs <= 0.40)).sum())
+        low = int((probs < 0.20).sum())
 
         m1, m2, m3, m4 = st.columns(4)
         m1.metric("Samtals áhættur", len(sorted_risks))
@@ -1286,7 +1338,8 @@ elif page == "🔍 Ítarleg lýsing á sviðsmyndum og áhættun":
         m4.metric("🟢 Lágar (<20%)", low)
 
         # ── Top threats ───────────────────────────────────────
-        top_threats = [r for r in sorted_risks if r.prob_likely > 0.15][:6]
+        # sorted_risks is descending, so each band is a contiguous slice
+        top_threats = sorted_risks[:min(int((probs > 0.15).sum()), 6)]
         if top_threats:
             st.markdown(
                 '<div style="font-size:1rem;font-weight:600;color:#1e293b;'
@@ -1301,65 +1354,19 @@ elif page == "🔍 Ítarleg lýsing á sviðsmyndum og áhættun":
             )
 
             for risk in top_threats:
-                p = risk.prob_likely
+                p = _band_p(risk.prob_likely)
+                ipct = round(p * 100)
                 icon = "🔴" if p > 0.40 else ("🟡" if p > 0.20 else "🟠")
-                color = "#ef4444" if p > 0.40 else ("#f59e0b" if p > 0.20 else "#fb923c")
 
                 with st.expander(
-                    f"{icon} **{risk.name_is}** — {p*100:.0f}% líkur",
+                    f"{icon} **{risk.name_is}** — {ipct}% líkur",
                     expanded=(p > 0.50),
                 ):
-                    # Probability bar
-                    st.markdown(
-                        f'<div style="background:#e2e8f0;border-radius:4px;height:10px;'
-                        f'overflow:hidden;margin-bottom:8px;">'
-                        f'<div style="background:{color};border-radius:4px;height:10px;'
-                        f'width:{min(p*100,100):.0f}%;"></div></div>',
-                        unsafe_allow_html=True,
-                    )
-                    st.markdown(
-                        f'<div style="font-size:0.8rem;color:#475569;">'
-                        f'Svið: {risk.prob_low*100:.0f}% – '
-                        f'<strong style="color:#1e293b;">{p*100:.0f}%</strong> – '
-                        f'{risk.prob_high*100:.0f}%</div>',
-                        unsafe_allow_html=True,
-                    )
-
-                    # What drives this risk
-                    if risk.breakdown:
-                        drivers_up = []
-                        drivers_down = []
-                        for fid, effect, _desc in risk.breakdown:
-                            fname = STRUCTURAL_FACTORS[fid].name_is
-                            fscore = sf.get_factor(fid)
-                            if effect > 1.15:
-                                drivers_up.append(f"⚡ {fname} = {fscore}/5 → {effect:.2f}× (hækkar áhættu)")
-                            elif effect < 0.85:
-                                drivers_down.append(f"🛡️ {fname} = {fscore}/5 → {effect:.2f}× (lækkar áhættu)")
-
-                        if drivers_up or drivers_down:
-                            st.markdown(
-                                '<div style="font-size:0.85rem;font-weight:600;color:#1e293b;'
-                                'margin-top:12px;">Hvað stýrir þessari áhættu:</div>',
-                                unsafe_allow_html=True,
-                            )
-                            for d in drivers_up:
-                                st.markdown(f'<div style="color:#1e293b;font-size:0.85rem;">{d}</div>', unsafe_allow_html=True)
-                            for d in drivers_down:
-                                st.markdown(f'<div style="color:#1e293b;font-size:0.85rem;">{d}</div>', unsafe_allow_html=True)
-
-                    # Affected goals
-                    aff = [f"{gid}: {GOAL_SHORT_LABELS[gid]}" for gid in risk.affected_goals if gid in GOALS]
-                    if aff:
-                        st.markdown(
-                            f'<div style="font-size:0.82rem;color:#1e293b;margin-top:8px;">'
-                            f'<strong>Hefur áhrif á:</strong> {", ".join(aff)}</div>',
-                            unsafe_allow_html=True,
-                        )
+                    st.markdown(_risk_card_body(selected, risk.risk_id), unsafe_allow_html=True)
 
         # ── Best-protected risks ──────────────────────────────
-        low_risks = [r for r in sorted_risks if r.prob_likely < 0.15]
-        low_risks.sort(key=lambda r: r.prob_likely)
+        low_risks = sorted_risks[len(sorted_risks) - int((probs < 0.15).sum()):]
+        low_risks.sort(key=attrgetter("prob_likely"))
         best_protected = low_risks[:4]
 
         if best_protected:
@@ -1375,29 +1382,24 @@ elif page == "🔍 Ítarleg lýsing á sviðsmyndum og áhættun":
                 unsafe_allow_html=True,
             )
 
+            parts = []
             for risk in best_protected:
-                p = risk.prob_likely
-                st.markdown(
+                ipct = round(risk.prob_likely * 100)
+                parts.append(
                     f'<div style="background:#f0fdf4;border:1px solid #bbf7d0;'
                     f'border-radius:8px;padding:12px 16px;margin-bottom:8px;">'
                     f'<div style="font-size:0.88rem;font-weight:600;color:#166534;">'
-                    f'🟢 {risk.name_is} — {p*100:.0f}%</div>',
-                    unsafe_allow_html=True,
+                    f'🟢 {risk.name_is} — {ipct}%</div>'
                 )
                 # Show protective factors
-                if risk.breakdown:
-                    shields = []
-                    for fid, effect, _desc in risk.breakdown:
-                        if effect < 0.85:
-                            fname = STRUCTURAL_FACTORS[fid].name_is
-                            shields.append(fname)
-                    if shields:
-                        st.markdown(
-                            f'<div style="font-size:0.8rem;color:#15803d;">'
-                            f'Varið af: {", ".join(shields)}</div>',
-                            unsafe_allow_html=True,
-                        )
-                st.markdown('</div>', unsafe_allow_html=True)
+                shields = [STRUCTURAL_FACTORS[fid].name_is for fid in risk.factor_ids[risk.effects < 0.85]]
+                if shields:
+                    parts.append(
+                        f'<div style="font-size:0.8rem;color:#15803d;">'
+                        f'Varið af: {", ".join(shields)}</div>'
+                    )
+                parts.append('</div>')
+            st.markdown("".join(parts), unsafe_allow_html=True)
 
     # ══════════════════════════════════════════════════════════════
     # TAB 3: MARKMIÐ
@@ -1415,10 +1417,10 @@ elif page == "🔍 Ítarleg lýsing á sviðsmyndum og áhættun":
         # Rank all goals for this scenario
         scenario_goal_scores = []
         for gid in GOAL_IDS:
-            score = goal_ranks.get((selected, gid), 6)
+            score = goal_ranks[SCENARIO_INDEX[selected], GOAL_INDEX[gid]]
             scenario_goal_scores.append((gid, score))
 
-        scenario_goal_scores.sort(key=lambda x: x[1], reverse=True)
+        scenario_goal_scores.sort(key=itemgetter(1), reverse=True)
 
         # ── Top 3 strengths ───────────────────────────────────
         top_3 = scenario_goal_scores[:3]
@@ -1428,31 +1430,18 @@ elif page == "🔍 Ítarleg lýsing á sviðsmyndum og áhættun":
             unsafe_allow_html=True,
         )
 
+        parts = []
         for gid, score in top_3:
             short = GOAL_SHORT_LABELS[gid]
             full_desc = GOAL_DESCRIPTIONS[gid]
-            color = goal_rank_color(score)
+            color = goal_colors[SCENARIO_INDEX[selected], GOAL_INDEX[gid]]
             bar_pct = score / 12 * 100
 
-            st.markdown(
-                f'<div style="background:#f0fdf4;border:1px solid #bbf7d0;'
-                f'border-radius:10px;padding:14px 18px;margin-bottom:10px;">'
-                f'<div style="display:flex;justify-content:space-between;align-items:center;">'
-                f'<div>'
-                f'<div style="font-size:0.92rem;font-weight:700;color:#166534;">'
-                f'{gid}: {short}</div>'
-                f'<div style="font-size:0.8rem;color:#1e293b;margin-top:2px;">{full_desc}</div>'
-                f'</div>'
-                f'<div style="text-align:right;min-width:70px;">'
-                f'<div style="font-size:1.4rem;font-weight:800;color:{color};">{score}/12</div>'
-                f'</div></div>'
-                f'<div style="background:#dcfce7;border-radius:4px;height:6px;'
-                f'overflow:hidden;margin-top:8px;">'
-                f'<div style="background:{color};border-radius:4px;height:6px;'
-                f'width:{bar_pct}%;"></div></div>'
-                f'</div>',
-                unsafe_allow_html=True,
-            )
+            parts.append(_GOAL_TILE_TMPL(
+                **_STRONG_TILE, gid=gid, short=short, desc=full_desc,
+                color=color, score=score, pct=bar_pct,
+            ))
+        st.markdown("".join(parts), unsafe_allow_html=True)
 
         # ── Bottom 2 weaknesses ───────────────────────────────
         bottom_2 = scenario_goal_scores[-2:]
@@ -1464,31 +1453,18 @@ elif page == "🔍 Ítarleg lýsing á sviðsmyndum og áhættun":
             unsafe_allow_html=True,
         )
 
+        parts = []
         for gid, score in bottom_2:
             short = GOAL_SHORT_LABELS[gid]
             full_desc = GOAL_DESCRIPTIONS[gid]
-            color = goal_rank_color(score)
+            color = goal_colors[SCENARIO_INDEX[selected], GOAL_INDEX[gid]]
             bar_pct = score / 12 * 100
 
-            st.markdown(
-                f'<div style="background:#fef2f2;border:1px solid #fecaca;'
-                f'border-radius:10px;padding:14px 18px;margin-bottom:10px;">'
-                f'<div style="display:flex;justify-content:space-between;align-items:center;">'
-                f'<div>'
-                f'<div style="font-size:0.92rem;font-weight:700;color:#991b1b;">'
-                f'{gid}: {short}</div>'
-                f'<div style="font-size:0.8rem;color:#1e293b;margin-top:2px;">{full_desc}</div>'
-                f'</div>'
-                f'<div style="text-align:right;min-width:70px;">'
-                f'<div style="font-size:1.4rem;font-weight:800;color:{color};">{score}/12</div>'
-                f'</div></div>'
-                f'<div style="background:#fee2e2;border-radius:4px;height:6px;'
-                f'overflow:hidden;margin-top:8px;">'
-                f'<div style="background:{color};border-radius:4px;height:6px;'
-                f'width:{bar_pct}%;"></div></div>'
-                f'</div>',
-                unsafe_allow_html=True,
-            )
+            parts.append(_GOAL_TILE_TMPL(
+                **_WEAK_TILE, gid=gid, short=short, desc=full_desc,
+                color=color, score=score, pct=bar_pct,
+            ))
+        st.markdown("".join(parts), unsafe_allow_html=True)
 
         # ── All goals overview bar chart ──────────────────────
         st.markdown(
@@ -1497,28 +1473,49 @@ elif page == "🔍 Ítarleg lýsing á sviðsmyndum og áhættun":
             unsafe_allow_html=True,
         )
 
-        for gid, score in scenario_goal_scores:
-            short = GOAL_SHORT_LABELS[gid]
-            color = goal_rank_color(score)
-            bar_pct = score / 12 * 100
-
-            st.markdown(
-                f'<div class="rank-row">'
-                f'<span class="rank-label">{short}</span>'
-                f'<div class="rank-bar-bg">'
-                f'<div class="rank-bar-fill" style="width:{bar_pct:.0f}%;background:{color};"></div>'
-                f'</div>'
-                f'<span class="rank-score" style="color:{color};">{score}/12</span>'
-                f'</div>',
-                unsafe_allow_html=True,
-            )
+        rank_rows = compute_goal_rank_rows()[SCENARIO_INDEX[selected]]
+        st.markdown(
+            "".join(rank_rows[GOAL_INDEX[gid]] for gid, _score in scenario_goal_scores),
+            unsafe_allow_html=True,
+        )
 
 
 # ═════════════════════════════════════════════════════════════════════
 # PAGE 3: AÐFERÐAFRÆÐI
 # ═════════════════════════════════════════════════════════════════════
 
-elif page == "📖 Aðferðafræði":
+@st.cache_data(show_spinner=False)
+def _build_confidence_df():
+    """Risk confidence table for the methodology page, built once."""
+    import pandas as pd
+    from hallar_risk_factors.risk_sensitivities import RISK_IDS
+    from justifications_and_calculator import confidence_row
+
+    # Column lists (not row dicts), with appends bound once
+    labels, tiers, reasons = [], [], []
+    add_label, add_tier, add_reason = labels.append, tiers.append, reasons.append
+    for rid in RISK_IDS:
+        row = confidence_row(rid)
+        if row:
+            label, tier, reason = row
+            add_label(label)
+            add_tier(tier)
+            add_reason(reason)
+
+    # Öryggi has only three distinct values; category dtype ships them to
+    # the browser as small integer codes plus one dictionary
+    return pd.DataFrame(
+        {
+            "Áhætta": labels,
+            "Öryggi": pd.Categorical(tiers),
+            "Rökstuðningur": reasons,
+        },
+        copy=False,
+    )
+
+
+@st.fragment
+def _page_methodology():
 
     st.markdown('<div class="page-header">Aðferðafræði</div>', unsafe_allow_html=True)
     st.markdown(
@@ -1529,104 +1526,26 @@ elif page == "📖 Aðferðafræði":
         unsafe_allow_html=True,
     )
 
-    st.markdown("### Fimm-laga reiknilíkan")
-    st.markdown("""
-**Lag 1 — Skipulagsþættir (F1–F7):**
-Hver sviðsmynd fær einkunn 1–5 á sjö þáttum sem lýsa uppbyggingu
-eignarhaldsleiðar: hverjir eiga, hverjir byggja, hvernig er fjármagnað,
-hver stýrir, o.s.frv. Hver einkunn er rökstudd.
-
-**Lag 2 — Áhættuþolni (Risk Sensitivities):**
-Hvert af 33 áhættum hefur skilgreint þolni gagnvart þáttum.
-Stefna (PROTECTIVE/EXPOSURE) og styrkur (LOW/MEDIUM/HIGH/CRITICAL)
-ákvarða hvernig þáttaskor breytir áhættulíkum.
-
-**Lag 3 — Áhættureikningur (Logistic Model):**
-Grunnlíkur → log-odds → aðlagað eftir þáttaáhrifum → sigmoid → líkur.
-Tryggir 0–100% mörk stærðfræðilega. Engin gervileg þök.
-
-**Lag 4 — Áhrif á markmið (Goal Impacts):**
-Hvert par áhætta × markmið: PERT-mat (besta/líklegast/versta).
-Vænt framlag = P(áhætta) × E[áhrif].
-
-**Lag 5 — Vegið skor:**
-Einingarnar stöðlaðar, vegnar eftir vali notanda, summað.
-Lægra skor = betri sviðsmynd.
-    """)
-
-    st.markdown("### Stærðfræðilegar forsendur")
-    st.markdown("""
-**Áhrifafall þáttar:**
-
-PROTECTIVE: `effect = (3 / (3 + d))^s`
-
-EXPOSURE: `effect = ((3 + d) / 3)^s`
-
-þar sem `d = skor − 3` og `s = styrkleikaveldi` (0.5 / 1.0 / 1.5 / 2.0)
-
-**Logistic umbreyting:**
-
-1. `L₀ = ln(p / (1−p))` — grunnlíkur → log-odds
-2. `L₁ = L₀ + Σ ln(effect)` — aðlögun í log-odds rúmi
-3. `p' = 1 / (1 + e^(−L₁))` — sigmoid → líkur
-4. Klemma: `[1×10⁻¹⁵, 1 − 1×10⁻¹⁵]` — float64 öryggismörk
-
-**PERT-meðaltal:** `E = (besta + 4×líklegast + versta) / 6`
-    """)
-
-    st.markdown("### Öryggisstig gagna")
-
-    conf_data = []
-    for rid in sorted(RISK_PROFILES.keys(), key=lambda x: int(x[1:])):
-        risk = RISK_PROFILES[rid]
-        conf = RISK_CONFIDENCE.get(rid)
-        if conf:
-            icons = {"High": "🟢", "Medium": "🟡", "Low": "🔴"}
-            conf_data.append({
-                "Áhætta": f"{rid}: {risk.name_is}",
-                "Öryggi": f"{icons.get(conf.tier_en, '')} {conf.tier}",
-                "Rökstuðningur": conf.justification,
-            })
-    st.dataframe(pd.DataFrame(conf_data), use_container_width=True, hide_index=True)
-
-    st.markdown("### Staðfesting")
-    st.markdown("""
-Reiknilíkanið hefur verið staðfest með **2.874 sjálfvirkum prófunum:**
-
-| Flokkur | Lýsing | Staða |
-|---------|--------|-------|
-| Skipulag | 84 þáttagildi í bili 1–5, allar 12 sviðsmyndir | ✅ |
-| Gagnaheilleiki | 33 áhættur, grunnlíkur, þolni, markmið | ✅ |
-| Áhrifaformerki | 100 áhrif, rétt stefna og röð | ✅ |
-| Stærðfræði | Logistic: auðkenni, mörk, monotonía, overflow | ✅ |
-| Stærðfræði | PERT-röðun varðveitt eftir umbreytingu | ✅ |
-| Stigagjöf | Stöðlun, formerki, abs() öryggi | ✅ |
-| Heilbrigðisathugun | S11 = #1, S9 = #12 á jafnvægi | ✅ |
-| Rökstuðningur | 84 textar, >80 stafir, rétt einkunn | ✅ |
-| Öryggisstig | 33 stig, gilt form | ✅ |
-| Samræmi | affected_goals = RISK_GOAL_IMPACTS | ✅ |
-    """)
-
-    st.markdown("### Uppfærsluskrá")
-    st.markdown("""
-**v5 — 33 áhættur, G9 lagfært, stöðlun endurkvörðuð (febrúar 2026)**
-- R34–R37 bætt við: skattar, útboðsreglur, slit samstarfs, hagsmunaárekstrar
-- R30 útvíkkað: millisala byggingarréttar og virðisaukning lands
-- G9 grunngildi breytilegt eftir F6/F7 (40–100 í stað 100 alltaf)
-- R04→G9 og R11→G9 fjarlægð (verktakaþættir, ekki borgarstjórnun)
-- Stöðlun endurkvörðuð: öll markmið jafn áhrifarík við sömu vægi
-- 2.874 sjálfvirk próf standast
-
-**v4 — 29 áhættur og uppfærð staðfesting (febrúar 2026)**
-- 29. áhætta bætt við (R29–R33), 4 áhættur sameinaðar/fjarlægðar
-- Öll 28→29 tilvísanir lagfærðar
-- Staðfestingarpróf uppfærð
-
-**v3 — Endanleg útgáfa (febrúar 2026)**
-- Logistic (sigmoid) líkan í stað capped multiplicative
-- G6 styrktur: 3 áhættur í stað 1
-- 4 vantar þolni bætt við
-- 10 rökstuðningstextar endurbættir
-- Float64 útkomuklemma
-- Dead code fjarlægður
-    """)
\ No newline at end of file
+    st.markdown(METHODOLOGY_BEFORE_TABLE_MD)
+
+    st.dataframe(
+        _build_confidence_df(),
+        use_container_width=True,
+        hide_index=True,
+        column_config={"Rökstuðningur": st.column_config.TextColumn(width="large")},
+    )
+
+    st.markdown(METHODOLOGY_AFTER_TABLE_MD)
+
+
+# ═════════════════════════════════════════════════════════════════════
+# NAVIGATION — only the selected page's function runs on a rerun
+# ═════════════════════════════════════════════════════════════════════
+
+page = st.navigation([
+    st.Page(_page_costs, title="Kostnaður við innviði", icon="📊", url_path="kostnadur", default=True),
+    st.Page(_page_goals, title="Markmið og áherslur uppbyggingar", icon="📊", url_path="markmid"),
+    st.Page(_page_scenarios, title="Ítarleg lýsing á sviðsmyndum og áhættun", icon="🔍", url_path="svidsmyndir"),
+    st.Page(_page_methodology, title="Aðferðafræði", icon="📖", url_path="adferdafraedi"),
+])
+page.run()
@@ -2,24 +2,35 @@
 HALLAR DSS — Deep Pre-Build Audit
 Checks everything a lawyer or auditor would challenge.
 """
+import inspect
 import math
+import re
 import sys
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
+from functools import lru_cache
+
+import numpy as np
 
 sys.path.insert(0, str(Path(__file__).parent))
+
+# Block-buffer stdout even on a terminal, so the report is written in a few
+# large chunks instead of one flush per line. Everything is flushed at exit.
+if hasattr(sys.stdout, "reconfigure"):
+    sys.stdout.reconfigure(line_buffering=False)
 from hallar_risk_factors.structural_factors import SCENARIO_FACTORS, STRUCTURAL_FACTORS, get_scenario_profile
 from hallar_risk_factors.risk_sensitivities import RISK_PROFILES, FactorDirection, Sensitivity, FactorSensitivity
-from hallar_risk_factors.goal_impacts import GOALS, RISK_GOAL_IMPACTS, ImpactUnit, pert_mean
+from hallar_risk_factors.goal_impacts import GOALS, GOAL_ID_SET, RISK_GOAL_IMPACTS, ImpactUnit, pert_mean
 from hallar_risk_factors.risk_calculator import (
     calculate_factor_effect,
     calculate_scenario_modifier,
     calculate_adjusted_probability, calculate_scenario_risk_profile,
+    calculate_probability_matrix,
     NEUTRAL_FACTOR,
 )
 from hallar_risk_factors.goal_scoring import (
-    calculate_scenario_goal_profile, calculate_weighted_score,
-    rank_scenarios, WEIGHTS_BALANCED,
+    calculate_scenario_goal_profile,
+    rank_scenarios, NORMALIZERS, WEIGHTS_BALANCED,
 )
 from justifications_and_calculator import (
     SCENARIO_FACTOR_JUSTIFICATIONS, RISK_CONFIDENCE,
@@ -29,39 +40,65 @@ from justifications_and_calculator import (
 passed = 0
 failed = 0
 warnings = 0
-findings = []
+# (severity, msg) -> None: an insertion-ordered set, so a finding raised
+# repeatedly is counted, printed and listed once, in first-seen order
+findings = {}
 
-def ok(msg):
+def ok(n=1):
+    # Passes are only counted, never printed, so callers pass no message
     global passed
-    passed += 1
+    passed += n
 
 def fail(msg):
     global failed
+    if ("FAIL", msg) in findings:
+        return
     failed += 1
-    findings.append(("FAIL", msg))
+    findings[("FAIL", msg)] = None
     print(f"  ❌ FAIL: {msg}")
 
 def warn(msg):
     global warnings
+    if ("WARN", msg) in findings:
+        return
     warnings += 1
-    findings.append(("WARN", msg))
+    findings[("WARN", msg)] = None
     print(f"  ⚠️  WARN: {msg}")
 
+# calculate_factor_effect is pure over 5 scores × 2 directions × 4 sensitivities;
+# the scenario × risk loops below repeat those 40 combinations thousands of times.
+# Sections 4.1/4.2 still call the function itself, since they are testing it.
+factor_effect = lru_cache(maxsize=64)(calculate_factor_effect)
+
+def duplicate_factors(rp):
+    """Factor IDs a risk has more than one sensitivity to (one Counter pass)."""
+    return {fid for fid, n in Counter(s.factor_id for s in rp.sensitivities).items() if n > 1}
+
 
 # ═══════════════════════════════════════════════════════════════
 print("=" * 80)
 print("SECTION 1: STRUCTURAL INTEGRITY")
 print("=" * 80)
 
+# Scenario × factor scores as one dense matrix, read once; the rest of the
+# audit looks scores up with fget() instead of per-call getattr dispatch
+FIDS = ["F1", "F2", "F3", "F4", "F5", "F6", "F7"]
+SID_IDX = {sid: i for i, sid in enumerate(SCENARIO_FACTORS)}
+FID_IDX = {fid: j for j, fid in enumerate(FIDS)}
+FACTOR_MAT = np.array(
+    [[sf.get_factor(fid) for fid in FIDS] for sf in SCENARIO_FACTORS.values()],
+).reshape(len(SCENARIO_FACTORS), len(FIDS))
+
+def fget(sid, fid):
+    return int(FACTOR_MAT[SID_IDX[sid], FID_IDX[fid]])
+
 # 1.1 All scenarios have all 7 factors in range 1-5
 print("\n--- 1.1 Factor ranges ---")
-for sid, sf in SCENARIO_FACTORS.items():
-    for fid in ["F1", "F2", "F3", "F4", "F5", "F6", "F7"]:
-        val = sf.get_factor(fid)
-        if not (1 <= val <= 5):
-            fail(f"{sid}.{fid}={val} outside 1-5 range")
-        else:
-            ok(f"{sid}.{fid} in range")
+out_of_range = (FACTOR_MAT < 1) | (FACTOR_MAT > 5)
+sid_list = list(SCENARIO_FACTORS)
+for i, j in np.argwhere(out_of_range):
+    fail(f"{sid_list[i]}.{FIDS[j]}={FACTOR_MAT[i, j]} outside 1-5 range")
+ok(n=int((~out_of_range).sum()))
 print(f"  ✅ All {len(SCENARIO_FACTORS)*7} factor values in 1-5 range")
 
 # 1.2 All 12 scenarios present
@@ -71,7 +108,7 @@ for sid in expected_scenarios:
     if sid not in SCENARIO_FACTORS:
         fail(f"Missing scenario {sid}")
     else:
-        ok(f"{sid} present")
+        ok()
 print(f"  ✅ All {len(expected_scenarios)} scenarios present")
 
 # 1.3 All risks present and valid
@@ -80,17 +117,17 @@ for rid, rp in RISK_PROFILES.items():
     if rp.risk_id != rid:
         fail(f"{rid}: risk_id mismatch (says {rp.risk_id})")
     else:
-        ok(f"{rid} present")
+        ok()
 print(f"  ✅ All {len(RISK_PROFILES)} risks present")
 
 # 1.4 All 10 goals present
 print("\n--- 1.4 Goal completeness ---")
 expected_goals = [f"G{i}" for i in range(1, 11)]
 for gid in expected_goals:
-    if gid not in GOALS:
+    if gid not in GOAL_ID_SET:
         fail(f"Missing goal {gid}")
     else:
-        ok(f"{gid} present")
+        ok()
 print(f"  ✅ All {len(expected_goals)} goals present")
 
 
@@ -107,7 +144,7 @@ for rid, rp in RISK_PROFILES.items():
     elif rp.base_prob_low == rp.base_prob_likely or rp.base_prob_likely == rp.base_prob_high:
         warn(f"{rid}: degenerate range (some equal)")
     else:
-        ok(f"{rid} ordering OK")
+        ok()
 
 # 2.2 Base probabilities in (0, 1)
 print("\n--- 2.2 Base probability bounds ---")
@@ -116,49 +153,56 @@ for rid, rp in RISK_PROFILES.items():
         if val <= 0 or val >= 1:
             fail(f"{rid}.{field}={val} outside (0,1)")
         else:
-            ok(f"{rid}.{field} OK")
-
-# 2.3 Sensitivity factor_id references valid factors
-print("\n--- 2.3 Sensitivity factor references ---")
-for rid, rp in RISK_PROFILES.items():
-    for sens in rp.sensitivities:
-        if sens.factor_id not in STRUCTURAL_FACTORS:
-            fail(f"{rid}: sensitivity references unknown factor {sens.factor_id}")
-        else:
-            ok(f"{rid}→{sens.factor_id} valid")
+            ok()
 
-# 2.4 No duplicate sensitivities (same risk → same factor twice)
-print("\n--- 2.4 Duplicate sensitivity check ---")
+# 2.3–2.6 Per-risk reference checks, fused into one pass over RISK_PROFILES.
+# Failures are collected per sub-section and reported after the pass, so the
+# output keeps its 2.3 → 2.6 grouping.
+ref_fails = {"2.3": [], "2.4": [], "2.5": [], "2.6": []}
+sens_checks = {}  # rid -> (n_sensitivities, unknown factor IDs, duplicates), reused by 7.2
 for rid, rp in RISK_PROFILES.items():
-    factor_ids = [s.factor_id for s in rp.sensitivities]
-    if len(factor_ids) != len(set(factor_ids)):
-        dups = [f for f in factor_ids if factor_ids.count(f) > 1]
-        fail(f"{rid}: duplicate sensitivity to factor(s) {set(dups)}")
+    # 2.3 Sensitivity factor_id references valid factors
+    bad_refs = [s.factor_id for s in rp.sensitivities if s.factor_id not in STRUCTURAL_FACTORS]
+    for fid in bad_refs:
+        ref_fails["2.3"].append(f"{rid}: sensitivity references unknown factor {fid}")
+    ok(n=len(rp.sensitivities) - len(bad_refs))
+
+    # 2.4 No duplicate sensitivities (same risk → same factor twice)
+    dups = duplicate_factors(rp)
+    sens_checks[rid] = (len(rp.sensitivities), bad_refs, dups)
+    if dups:
+        ref_fails["2.4"].append(f"{rid}: duplicate sensitivity to factor(s) {dups}")
     else:
-        ok(f"{rid} no duplicates")
+        ok()
 
-# 2.5 requires_factors references valid factors and sensible ranges
-print("\n--- 2.5 requires_factors validation ---")
-for rid, rp in RISK_PROFILES.items():
+    # 2.5 requires_factors references valid factors and sensible ranges
     if rp.requires_factors:
         for fid, (lo, hi) in rp.requires_factors.items():
             if fid not in STRUCTURAL_FACTORS:
-                fail(f"{rid}: requires_factors references unknown {fid}")
+                ref_fails["2.5"].append(f"{rid}: requires_factors references unknown {fid}")
             elif lo > hi:
-                fail(f"{rid}: requires_factors {fid} has lo={lo} > hi={hi}")
+                ref_fails["2.5"].append(f"{rid}: requires_factors {fid} has lo={lo} > hi={hi}")
             elif lo < 1 or hi > 5:
-                fail(f"{rid}: requires_factors {fid} range ({lo},{hi}) outside 1-5")
+                ref_fails["2.5"].append(f"{rid}: requires_factors {fid} range ({lo},{hi}) outside 1-5")
             else:
-                ok(f"{rid} requires_factors {fid} valid")
+                ok()
 
-# 2.6 affected_goals references valid goals
-print("\n--- 2.6 affected_goals references ---")
-for rid, rp in RISK_PROFILES.items():
+    # 2.6 affected_goals references valid goals
     for gid in rp.affected_goals:
-        if gid not in GOALS:
-            fail(f"{rid}: affected_goals references unknown {gid}")
+        if gid not in GOAL_ID_SET:
+            ref_fails["2.6"].append(f"{rid}: affected_goals references unknown {gid}")
         else:
-            ok(f"{rid}→{gid} valid")
+            ok()
+
+for num, title in [
+    ("2.3", "Sensitivity factor references"),
+    ("2.4", "Duplicate sensitivity check"),
+    ("2.5", "requires_factors validation"),
+    ("2.6", "affected_goals references"),
+]:
+    print(f"\n--- {num} {title} ---")
+    for msg in ref_fails[num]:
+        fail(msg)
 
 # 2.7 affected_goals matches RISK_GOAL_IMPACTS exactly
 print("\n--- 2.7 affected_goals ↔ RISK_GOAL_IMPACTS consistency ---")
@@ -176,7 +220,7 @@ for rid, rp in RISK_PROFILES.items():
         if extra_impacts:
             fail(f"{rid}: has impact data for {extra_impacts} not in affected_goals")
     else:
-        ok(f"{rid} goals consistent")
+        ok()
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -184,64 +228,70 @@ print("\n" + "=" * 80)
 print("SECTION 3: GOAL IMPACT DATA INTEGRITY")
 print("=" * 80)
 
+# Goal direction by ID, looked up once for Sections 3.2 and 5.4
+GOAL_DIR = {gid: g.direction for gid, g in GOALS.items()}
+
 # 3.1 Impact ordering: |low| <= |likely| <= |high| for each impact
 print("\n--- 3.1 Impact magnitude ordering ---")
 for rid, impacts in RISK_GOAL_IMPACTS.items():
     for imp in impacts:
+        low, likely, high = imp.impact_low, imp.impact_likely, imp.impact_high
         # For negative impacts (higher_better goals), all values should be negative
         # For positive impacts (lower_better goals like delays), all values should be positive
-        if imp.impact_low >= 0 and imp.impact_likely >= 0 and imp.impact_high >= 0:
+        if low >= 0 and likely >= 0 and high >= 0:
             # All positive — should be low <= likely <= high
-            if not (imp.impact_low <= imp.impact_likely <= imp.impact_high):
-                fail(f"{rid}→{imp.goal_id}: positive impacts not ordered: {imp.impact_low} <= {imp.impact_likely} <= {imp.impact_high}")
+            if not (low <= likely <= high):
+                fail(f"{rid}→{imp.goal_id}: positive impacts not ordered: {low} <= {likely} <= {high}")
             else:
-                ok(f"{rid}→{imp.goal_id} positive ordering OK")
-        elif imp.impact_low <= 0 and imp.impact_likely <= 0 and imp.impact_high <= 0:
+                ok()
+        elif low <= 0 and likely <= 0 and high <= 0:
             # All negative — should be |low| <= |likely| <= |high| i.e. low >= likely >= high
-            if not (imp.impact_low >= imp.impact_likely >= imp.impact_high):
-                fail(f"{rid}→{imp.goal_id}: negative impacts not ordered: {imp.impact_low} >= {imp.impact_likely} >= {imp.impact_high}")
+            if not (low >= likely >= high):
+                fail(f"{rid}→{imp.goal_id}: negative impacts not ordered: {low} >= {likely} >= {high}")
             else:
-                ok(f"{rid}→{imp.goal_id} negative ordering OK")
+                ok()
         else:
-            fail(f"{rid}→{imp.goal_id}: mixed signs in impacts: {imp.impact_low}, {imp.impact_likely}, {imp.impact_high}")
+            fail(f"{rid}→{imp.goal_id}: mixed signs in impacts: {low}, {likely}, {high}")
 
 # 3.2 Impact signs match goal direction
 print("\n--- 3.2 Impact sign ↔ goal direction ---")
 for rid, impacts in RISK_GOAL_IMPACTS.items():
     for imp in impacts:
-        goal = GOALS.get(imp.goal_id)
-        if not goal:
+        direction = GOAL_DIR.get(imp.goal_id)
+        if direction is None:
             fail(f"{rid}→{imp.goal_id}: goal not found")
             continue
         
-        if goal.direction == "lower_better":
+        likely = imp.impact_likely
+        if direction == "lower_better":
             # Risks should INCREASE this metric (positive = bad)
-            if imp.impact_likely < 0:
-                fail(f"{rid}→{imp.goal_id}: lower_better goal but negative impact {imp.impact_likely}")
+            if likely < 0:
+                fail(f"{rid}→{imp.goal_id}: lower_better goal but negative impact {likely}")
             else:
-                ok(f"{rid}→{imp.goal_id} sign OK")
+                ok()
         else:  # higher_better
             # Risks should DECREASE this metric (negative = bad)
-            if imp.impact_likely > 0:
-                fail(f"{rid}→{imp.goal_id}: higher_better goal but positive impact {imp.impact_likely}")
+            if likely > 0:
+                fail(f"{rid}→{imp.goal_id}: higher_better goal but positive impact {likely}")
             else:
-                ok(f"{rid}→{imp.goal_id} sign OK")
+                ok()
 
 # 3.3 Every goal is affected by at least 2 risks
 print("\n--- 3.3 Goal coverage ---")
-goal_risk_count = defaultdict(int)
+goal_risk_count = Counter(imp.goal_id for imps in RISK_GOAL_IMPACTS.values() for imp in imps)
+goal_to_risks = defaultdict(list)  # inverse index, also used by Section 7.1
 for rid, impacts in RISK_GOAL_IMPACTS.items():
     for imp in impacts:
-        goal_risk_count[imp.goal_id] += 1
+        goal_to_risks[imp.goal_id].append(rid)
 
 for gid in GOALS:
     count = goal_risk_count.get(gid, 0)
     if count == 0:
         fail(f"{gid}: NO risks affect this goal")
     elif count == 1:
-        warn(f"{gid} ({GOALS[gid].name_en}): only 1 risk contributes — fragile. Risk={[rid for rid, imps in RISK_GOAL_IMPACTS.items() for imp in imps if imp.goal_id == gid]}")
+        warn(f"{gid} ({GOALS[gid].name_en}): only 1 risk contributes — fragile. Risk={goal_to_risks[gid]}")
     else:
-        ok(f"{gid}: {count} contributing risks")
+        ok()
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -257,26 +307,25 @@ for direction in [FactorDirection.PROTECTIVE, FactorDirection.EXPOSURE]:
         if abs(effect - 1.0) > 0.001:
             fail(f"Factor effect at score=3, {direction.value}/{sens.name}: {effect} ≠ 1.0")
         else:
-            ok(f"Neutral OK for {direction.value}/{sens.name}")
+            ok()
 
 # 4.2 Factor effect monotonicity — protective: higher score = lower effect (reduces risk)
 print("\n--- 4.2 Factor effect monotonicity ---")
-for sens in [Sensitivity.LOW, Sensitivity.MEDIUM, Sensitivity.HIGH, Sensitivity.CRITICAL]:
-    prev = None
-    for score in [1, 2, 3, 4, 5]:
-        effect = calculate_factor_effect(score, FactorDirection.PROTECTIVE, sens)
-        if prev is not None and effect >= prev:
-            fail(f"PROTECTIVE {sens.name}: score {score} effect {effect} >= score {score-1} effect {prev}")
-        prev = effect
-    ok(f"PROTECTIVE {sens.name} monotonic")
-    
-    prev = None
-    for score in [1, 2, 3, 4, 5]:
-        effect = calculate_factor_effect(score, FactorDirection.EXPOSURE, sens)
-        if prev is not None and effect <= prev:
-            fail(f"EXPOSURE {sens.name}: score {score} effect {effect} <= score {score-1} effect {prev}")
-        prev = effect
-    ok(f"EXPOSURE {sens.name} monotonic")
+# Effects for every (direction, sensitivity, score 1-5), then one np.diff per
+# direction: protective steps must all be < 0, exposure steps all > 0
+SENSITIVITIES = [Sensitivity.LOW, Sensitivity.MEDIUM, Sensitivity.HIGH, Sensitivity.CRITICAL]
+EF = np.array([
+    [[calculate_factor_effect(score, direction, sens) for score in range(1, 6)] for sens in SENSITIVITIES]
+    for direction in (FactorDirection.PROTECTIVE, FactorDirection.EXPOSURE)
+])
+prot_bad = np.diff(EF[0], axis=1) >= 0
+expo_bad = np.diff(EF[1], axis=1) <= 0
+for k, sens in enumerate(SENSITIVITIES):
+    for m in np.flatnonzero(prot_bad[k]):
+        fail(f"PROTECTIVE {sens.name}: score {m+2} effect {EF[0, k, m+1]} >= score {m+1} effect {EF[0, k, m]}")
+    for m in np.flatnonzero(expo_bad[k]):
+        fail(f"EXPOSURE {sens.name}: score {m+2} effect {EF[1, k, m+1]} <= score {m+1} effect {EF[1, k, m]}")
+ok(n=2 * len(SENSITIVITIES))
 
 # 4.3 Logistic calculator: identity property f(p, []) = p
 print("\n--- 4.3 Logistic identity ---")
@@ -285,62 +334,57 @@ for p in [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]:
     if abs(result - p) > 0.001:
         fail(f"Logistic identity: f({p}, []) = {result} ≠ {p}")
     else:
-        ok(f"Logistic identity at {p}")
+        ok()
+
+# Factor effects and applicability for every scenario×risk pair, built once:
+# APPLIES is a (scenario, risk) bool matrix in SCENARIO_FACTORS × RISK_PROFILES
+# order that masks Sections 4.5 and 9.1; EFFECTS feeds 9.1
+EFFECTS = {}
+APPLIES = np.ones((len(SCENARIO_FACTORS), len(RISK_PROFILES)), dtype=bool)
+for i, sid in enumerate(SCENARIO_FACTORS):
+    for j, (rid, risk) in enumerate(RISK_PROFILES.items()):
+        EFFECTS[(sid, rid)] = [
+            factor_effect(fget(sid, sens.factor_id), sens.direction, sens.sensitivity)
+            for sens in risk.sensitivities
+        ]
+        if risk.requires_factors:
+            # all() stops at the first requirement the scenario fails
+            APPLIES[i, j] = all(
+                lo <= fget(sid, fid) <= hi
+                for fid, (lo, hi) in risk.requires_factors.items()
+            )
 
 # 4.4 Logistic: all results in (0, 1)
+# 4.4 and 4.5 check the model's vectorized path: one (scenario, risk, PERT)
+# probability array instead of three calculate_risk_logistic calls per pair.
+# 4.4 bounds-checks the raw logistic output for every pair, including risks
+# that do not apply to a scenario (the model zeroes those afterwards);
+# 4.5 checks PERT ordering only where the risk applies.
 print("\n--- 4.4 Logistic bounds for all scenario×risk ---")
-bound_violations = 0
-for sid in SCENARIO_FACTORS:
-    scenario = SCENARIO_FACTORS[sid]
-    for rid, risk in RISK_PROFILES.items():
-        effects = []
-        for sens in risk.sensitivities:
-            score = scenario.get_factor(sens.factor_id)
-            effect = calculate_factor_effect(score, sens.direction, sens.sensitivity)
-            effects.append(effect)
-        
-        for base_field in ["base_prob_low", "base_prob_likely", "base_prob_high"]:
-            base = getattr(risk, base_field)
-            prob, _ = calculate_risk_logistic(base, effects)
-            if prob <= 0 or prob >= 1:
-                fail(f"Logistic {sid}×{rid} ({base_field}): {prob} outside (0,1)")
-                bound_violations += 1
-            else:
-                ok(f"{sid}×{rid} {base_field}")
+PERT_FIELDS = ["base_prob_low", "base_prob_likely", "base_prob_high"]
+matrix_sids, matrix_rids, probs = calculate_probability_matrix(
+    list(SCENARIO_FACTORS), apply_requirements=False
+)
+
+out_of_bounds = (probs <= 0) | (probs >= 1)
+for i, j, k in np.argwhere(out_of_bounds):
+    fail(f"Logistic {matrix_sids[i]}×{matrix_rids[j]} ({PERT_FIELDS[k]}): {probs[i, j, k]} outside (0,1)")
+bound_violations = int(out_of_bounds.sum())
+checked = probs.size
+ok(n=checked - bound_violations)
 
 if bound_violations == 0:
-    print(f"  ✅ All {len(SCENARIO_FACTORS)*len(RISK_PROFILES)*3} logistic calculations in (0,1)")
+    print(f"  ✅ All {checked} logistic calculations in (0,1)")
 
 # 4.5 Logistic: PERT ordering preserved (low <= likely <= high after transform)
 print("\n--- 4.5 PERT ordering preserved after logistic ---")
-pert_violations = 0
-for sid in SCENARIO_FACTORS:
-    scenario = SCENARIO_FACTORS[sid]
-    for rid, risk in RISK_PROFILES.items():
-        # Skip if doesn't apply
-        if risk.requires_factors:
-            skip = False
-            for fid, (lo, hi) in risk.requires_factors.items():
-                if not (lo <= scenario.get_factor(fid) <= hi):
-                    skip = True
-            if skip:
-                continue
-        
-        effects = []
-        for sens in risk.sensitivities:
-            score = scenario.get_factor(sens.factor_id)
-            effect = calculate_factor_effect(score, sens.direction, sens.sensitivity)
-            effects.append(effect)
-        
-        p_low, _ = calculate_risk_logistic(risk.base_prob_low, effects)
-        p_likely, _ = calculate_risk_logistic(risk.base_prob_likely, effects)
-        p_high, _ = calculate_risk_logistic(risk.base_prob_high, effects)
-        
-        if not (p_low <= p_likely + 1e-10 and p_likely <= p_high + 1e-10):
-            fail(f"PERT ordering: {sid}×{rid}: low={p_low:.4f} likely={p_likely:.4f} high={p_high:.4f}")
-            pert_violations += 1
-        else:
-            ok(f"{sid}×{rid} PERT ordering")
+p_low, p_likely, p_high = probs[..., 0], probs[..., 1], probs[..., 2]
+ordered = (p_low <= p_likely + 1e-10) & (p_likely <= p_high + 1e-10)
+for i, j in np.argwhere(~ordered & APPLIES):
+    fail(f"PERT ordering: {matrix_sids[i]}×{matrix_rids[j]}: "
+         f"low={p_low[i, j]:.4f} likely={p_likely[i, j]:.4f} high={p_high[i, j]:.4f}")
+pert_violations = int((~ordered & APPLIES).sum())
+ok(n=int((ordered & APPLIES).sum()))
 
 if pert_violations == 0:
     print(f"  ✅ PERT ordering preserved for all applicable scenario×risk combinations")
@@ -351,7 +395,7 @@ extreme_effects = [100.0] * 10  # Extreme positive
 try:
     p, _ = calculate_risk_logistic(0.5, extreme_effects)
     if 0 < p < 1:
-        ok("Extreme positive overflow handled")
+        ok()
     else:
         fail(f"Extreme positive: {p}")
 except Exception as e:
@@ -361,7 +405,7 @@ extreme_effects = [0.001] * 10  # Extreme negative
 try:
     p, _ = calculate_risk_logistic(0.5, extreme_effects)
     if 0 < p < 1:
-        ok("Extreme negative overflow handled")
+        ok()
     else:
         fail(f"Extreme negative: {p}")
 except Exception as e:
@@ -376,8 +420,8 @@ for rid, risk in RISK_PROFILES.items():
         # For PROTECTIVE: score 2 should give HIGHER risk than score 4
         # For EXPOSURE: score 4 should give HIGHER risk than score 2
         
-        effect_low = calculate_factor_effect(2, sens.direction, sens.sensitivity)
-        effect_high = calculate_factor_effect(4, sens.direction, sens.sensitivity)
+        effect_low = factor_effect(2, sens.direction, sens.sensitivity)
+        effect_high = factor_effect(4, sens.direction, sens.sensitivity)
         
         p_low, _ = calculate_risk_logistic(risk.base_prob_likely, [effect_low])
         p_high, _ = calculate_risk_logistic(risk.base_prob_likely, [effect_high])
@@ -392,7 +436,7 @@ for rid, risk in RISK_PROFILES.items():
             if p_high < p_low - 1e-10:
                 fail(f"{rid}→{sens.factor_id} EXPOSURE monotonicity: score=4 gives {p_high:.4f} < score=2 {p_low:.4f}")
                 mono_violations += 1
-        ok(f"{rid}→{sens.factor_id} monotonicity")
+        ok()
 
 if mono_violations == 0:
     print(f"  ✅ All sensitivities monotonic through logistic")
@@ -405,33 +449,23 @@ print("=" * 80)
 
 # 5.1 Dead code check
 print("\n--- 5.1 Dead if/else in goal_scoring.py ---")
-import inspect
 source = inspect.getsource(calculate_scenario_goal_profile)
 if 'if goal_def.direction == "lower_better"' in source:
     warn("Dead if/else still present in goal_scoring.py — both branches identical. Not a bug but misleading.")
 else:
-    ok("Dead code removed")
+    ok()
 
 # 5.2 Normalizers cover all 10 goals
 print("\n--- 5.2 Normalizer coverage ---")
-# Read normalizers from source since they're inline
-from hallar_risk_factors.goal_scoring import calculate_weighted_score
-source = inspect.getsource(calculate_weighted_score)
 for gid in GOALS:
-    if f'"{gid}"' not in source:
+    if gid not in NORMALIZERS:
         fail(f"Goal {gid} missing from NORMALIZERS")
     else:
-        ok(f"{gid} in normalizers")
+        ok()
 
 # 5.3 Normalizer signs: lower_better goals should have positive normalizers, 
 # higher_better should have negative (to convert to "badness")
 print("\n--- 5.3 Normalizer sign logic ---")
-# Parse normalizers from source (v5 — recalibrated for 33-risk model)
-NORMALIZERS = {
-    "G1":  0.023171, "G2":  0.006498, "G3":  0.022491, "G4":  0.000225,
-    "G5": -0.005898, "G6": -0.025075, "G7": -0.023433, "G8": -0.014442,
-    "G9": -0.009893, "G10": -0.015430,
-}
 for gid, norm in NORMALIZERS.items():
     goal = GOALS[gid]
     if goal.direction == "lower_better":
@@ -439,13 +473,13 @@ for gid, norm in NORMALIZERS.items():
         if norm <= 0:
             fail(f"{gid} ({goal.name_en}): lower_better but normalizer={norm} (should be positive)")
         else:
-            ok(f"{gid} normalizer sign OK")
+            ok()
     else:
         # Impacts are negative (less completion, less quality = bad). Normalizer should be negative.
         if norm >= 0:
             fail(f"{gid} ({goal.name_en}): higher_better but normalizer={norm} (should be negative)")
         else:
-            ok(f"{gid} normalizer sign OK")
+            ok()
 
 # 5.4 Weighted scoring uses abs() — check this makes sense
 print("\n--- 5.4 abs() in weighted scoring ---")
@@ -457,12 +491,11 @@ print("\n--- 5.4 abs() in weighted scoring ---")
 sign_mismatches = 0
 for rid, impacts in RISK_GOAL_IMPACTS.items():
     for imp in impacts:
-        goal = GOALS.get(imp.goal_id)
-        if not goal:
-            continue
-        if goal.direction == "lower_better" and imp.impact_likely < 0:
+        direction = GOAL_DIR.get(imp.goal_id)
+        likely = imp.impact_likely
+        if direction == "lower_better" and likely < 0:
             sign_mismatches += 1
-        elif goal.direction == "higher_better" and imp.impact_likely > 0:
+        elif direction == "higher_better" and likely > 0:
             sign_mismatches += 1
 
 if sign_mismatches == 0:
@@ -473,10 +506,10 @@ else:
 # 5.5 Sanity check: S4 should beat S9 on balanced weights
 print("\n--- 5.5 Sanity check: S4 vs S9 ---")
 rankings = rank_scenarios(WEIGHTS_BALANCED)
-s4_rank = next((r.rank for r in rankings if r.scenario_id == "S4"), None)
-s9_rank = next((r.rank for r in rankings if r.scenario_id == "S9"), None)
+rank_by_sid = {r.scenario_id: r.rank for r in rankings}
+s4_rank, s9_rank = rank_by_sid.get("S4"), rank_by_sid.get("S9")
 if s4_rank and s9_rank and s4_rank < s9_rank:
-    ok(f"S4 (rank {s4_rank}) beats S9 (rank {s9_rank}) on balanced weights")
+    ok()
     print(f"  ✅ S4 (rank {s4_rank}) beats S9 (rank {s9_rank})")
 else:
     fail(f"S4 rank={s4_rank}, S9 rank={s9_rank} — S4 should beat S9")
@@ -499,7 +532,7 @@ for name, weights in weight_profiles.items():
         elif weights[gid] < 0:
             fail(f"{name} profile {gid} weight={weights[gid]} (negative)")
         else:
-            ok(f"{name}.{gid} OK")
+            ok()
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -515,12 +548,12 @@ for sid in SCENARIO_FACTORS:
         fail(f"Scenario {sid} missing all justifications")
         just_missing += 7
     else:
-        for fid in ["F1", "F2", "F3", "F4", "F5", "F6", "F7"]:
+        for fid in FIDS:
             if fid not in SCENARIO_FACTOR_JUSTIFICATIONS[sid]:
                 fail(f"{sid}.{fid} missing justification")
                 just_missing += 1
             else:
-                ok(f"{sid}.{fid} justification present")
+                ok()
 
 if just_missing == 0:
     print(f"  ✅ All 84 justifications present")
@@ -528,21 +561,21 @@ if just_missing == 0:
 # 6.2 Each justification mentions the correct score
 print("\n--- 6.2 Justification ↔ score consistency ---")
 score_mismatches = 0
+SCORE_RE = re.compile(r"Einkunn: (\d)")
 for sid in SCENARIO_FACTORS:
     if sid not in SCENARIO_FACTOR_JUSTIFICATIONS:
         continue
-    scenario = SCENARIO_FACTORS[sid]
-    for fid in ["F1", "F2", "F3", "F4", "F5", "F6", "F7"]:
+    for fid in FIDS:
         text = SCENARIO_FACTOR_JUSTIFICATIONS[sid].get(fid, "")
-        actual_score = scenario.get_factor(fid)
+        actual_score = fget(sid, fid)
         
-        # Check that "Einkunn: X" appears with correct score
-        expected_pattern = f"Einkunn: {actual_score}"
-        if expected_pattern not in text:
+        # Check that "Einkunn: X" appears with correct score (any mention counts)
+        stated_scores = {int(m) for m in SCORE_RE.findall(text)}
+        if actual_score not in stated_scores:
             fail(f"{sid}.{fid}: actual score={actual_score} but justification says something else")
             score_mismatches += 1
         else:
-            ok(f"{sid}.{fid} score matches")
+            ok()
 
 if score_mismatches == 0:
     print(f"  ✅ All 84 justification scores match actual factor values")
@@ -557,7 +590,7 @@ for rid in RISK_PROFILES:
         if tier.tier_en not in ["High", "Medium", "Low"]:
             fail(f"{rid}: invalid tier '{tier.tier_en}'")
         else:
-            ok(f"{rid} confidence tier valid")
+            ok()
 print(f"  ✅ All {len(RISK_PROFILES)} confidence tiers present and valid")
 
 # 6.4 Justification minimum length (should be substantial, not placeholder)
@@ -569,7 +602,7 @@ for sid in SCENARIO_FACTOR_JUSTIFICATIONS:
             warn(f"{sid}.{fid}: justification only {len(text)} chars — may be too brief for lawyers")
             short_count += 1
         else:
-            ok(f"{sid}.{fid} length OK")
+            ok()
 
 if short_count == 0:
     print(f"  ✅ All justifications are substantive (>80 chars)")
@@ -582,40 +615,36 @@ print("=" * 80)
 
 # 7.1 G6 single-risk dependency
 print("\n--- 7.1 G6 single-risk dependency ---")
-g6_risks = [rid for rid, imps in RISK_GOAL_IMPACTS.items() for imp in imps if imp.goal_id == "G6"]
+g6_risks = goal_to_risks["G6"]
 if len(g6_risks) <= 1:
     warn(f"G6 depends on only {len(g6_risks)} risk(s): {g6_risks}. Every other goal has 2+. NEEDS FIX.")
 else:
-    ok(f"G6 has {len(g6_risks)} contributing risks")
+    ok()
 
 # 7.2 Every risk with sensitivities references valid, non-duplicate factors
+# Same checks as 2.3/2.4: re-report their cached results, don't recompute
 print("\n--- 7.2 Sensitivity completeness ---")
-for rid, rp in RISK_PROFILES.items():
-    factor_ids = [s.factor_id for s in rp.sensitivities]
-    for fid in factor_ids:
-        if fid not in STRUCTURAL_FACTORS:
-            fail(f"{rid} references invalid factor {fid}")
-        else:
-            ok(f"{rid}→{fid} valid")
-    if len(factor_ids) != len(set(factor_ids)):
-        dups = [f for f in factor_ids if factor_ids.count(f) > 1]
-        fail(f"{rid}: duplicate sensitivity to {set(dups)}")
+for rid, (n_sens, bad_refs, dups) in sens_checks.items():
+    for fid in bad_refs:
+        fail(f"{rid} references invalid factor {fid}")
+    ok(n=n_sens - len(bad_refs))
+    if dups:
+        fail(f"{rid}: duplicate sensitivity to {dups}")
     else:
-        ok(f"{rid} no duplicate sensitivities")
+        ok()
 
 # 7.3 requires_factors gating — R23 should exclude non-PF scenarios
 print("\n--- 7.3 R23 requires_factors gating ---")
 r23 = RISK_PROFILES["R23"]
 non_pf_scenarios = ["S7", "S8", "S9"]  # These have F3 < 3
 for sid in non_pf_scenarios:
-    scenario = SCENARIO_FACTORS[sid]
-    f3_val = scenario.get_factor("F3")
+    f3_val = fget(sid, "F3")
     if r23.requires_factors:
         lo, hi = r23.requires_factors.get("F3", (1, 5))
         if lo <= f3_val <= hi:
             fail(f"R23 should exclude {sid} (F3={f3_val}) but it doesn't. Range is ({lo},{hi})")
         else:
-            ok(f"R23 correctly excludes {sid} (F3={f3_val})")
+            ok()
     else:
         fail("R23 has no requires_factors — should gate on F3")
 
@@ -633,33 +662,37 @@ for rid in ["R18", "R19", "R20", "R22"]:  # These are F3-CRITICAL risks
     f3_sens = [s for s in risk.sensitivities if s.factor_id == "F3"]
     if f3_sens:
         for s7_s8 in [("S7", "S8")]:
-            effects_7 = calculate_factor_effect(
-                SCENARIO_FACTORS["S7"].get_factor("F3"),
+            effects_7 = factor_effect(
+                fget("S7", "F3"),
                 f3_sens[0].direction, f3_sens[0].sensitivity
             )
-            effects_8 = calculate_factor_effect(
-                SCENARIO_FACTORS["S8"].get_factor("F3"),
+            effects_8 = factor_effect(
+                fget("S8", "F3"),
                 f3_sens[0].direction, f3_sens[0].sensitivity
             )
             if abs(effects_7 - effects_8) > 0.001:
                 fail(f"{rid}: S7 and S8 both have F3=1 but different F3 effects")
             else:
-                ok(f"{rid}: S7=S8 on F3 ✓")
+                ok()
 
 # 8.2 S9 should be worst or near-worst on every goal under balanced weights
 print("\n--- 8.2 S9 should be worst or near-worst ---")
-profile = calculate_scenario_goal_profile("S9")
 all_profiles = {sid: calculate_scenario_goal_profile(sid) for sid in SCENARIO_FACTORS}
-for gid in GOALS:
-    s9_impact = profile.goal_scores[gid].expected_impact if gid in profile.goal_scores else 0
-    # Check how S9 ranks
-    all_impacts = [(sid, p.goal_scores[gid].expected_impact) for sid, p in all_profiles.items() if p and gid in p.goal_scores]
-    all_impacts.sort(key=lambda x: abs(x[1]), reverse=True)
-    s9_rank = next((i+1 for i, (sid, _) in enumerate(all_impacts) if sid == "S9"), None)
+profile_sids = [sid for sid, p in all_profiles.items() if p]
+goal_ids = list(GOALS)
+# Scenario × goal expected impacts; one stable argsort per column ranks the
+# scenarios by |impact| (largest first) for every goal at once
+IMPACTS = np.array(
+    [[all_profiles[sid].goal_scores[gid].expected_impact for gid in goal_ids] for sid in profile_sids],
+).reshape(len(profile_sids), len(goal_ids))
+order = np.argsort(-np.abs(IMPACTS), axis=0, kind="stable")
+rank_of = np.argsort(order, axis=0) + 1  # rank_of[scenario, goal]
+s9_ranks = rank_of[profile_sids.index("S9")] if "S9" in profile_sids else [None] * len(goal_ids)
+for gid, s9_rank in zip(goal_ids, s9_ranks):
     if s9_rank and s9_rank > 4:
         warn(f"S9 ranks {s9_rank}/12 on {gid} ({GOALS[gid].name_en}) — expected to be worse")
     else:
-        ok(f"S9 ranks {s9_rank}/12 on {gid}")
+        ok()
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -670,22 +703,12 @@ print("=" * 80)
 # Compare capped vs logistic for key scenarios
 print("\n--- 9.1 Key disagreements between models ---")
 key_cases = []
-for sid in SCENARIO_FACTORS:
-    scenario = SCENARIO_FACTORS[sid]
-    for rid, risk in RISK_PROFILES.items():
-        if risk.requires_factors:
-            skip = False
-            for fid, (lo, hi) in risk.requires_factors.items():
-                if not (lo <= scenario.get_factor(fid) <= hi):
-                    skip = True
-            if skip:
-                continue
+for i, sid in enumerate(SCENARIO_FACTORS):
+    for j, (rid, risk) in enumerate(RISK_PROFILES.items()):
+        if not APPLIES[i, j]:
+            continue
         
-        effects = []
-        for sens in risk.sensitivities:
-            score = scenario.get_factor(sens.factor_id)
-            effect = calculate_factor_effect(score, sens.direction, sens.sensitivity)
-            effects.append(effect)
+        effects = EFFECTS[(sid, rid)]
         
         adj_prob, modifier, _ = calculate_adjusted_probability(sid, rid)
         current = adj_prob[1]
@@ -720,7 +743,7 @@ for sid in SCENARIO_FACTORS:
     elif len(profile.risks) < 20:
         warn(f"{sid} has only {len(profile.risks)} applicable risks (expected ~25+)")
     else:
-        ok(f"{sid}: {len(profile.risks)} risks")
+        ok()
 
 # 10.2 Check PERT mean function
 print("\n--- 10.2 PERT mean correctness ---")
@@ -729,15 +752,19 @@ expected = (1 + 4*4 + 7) / 6  # = 24/6 = 4.0
 if abs(result - expected) > 0.001:
     fail(f"PERT mean(1,4,7) = {result}, expected {expected}")
 else:
-    ok("PERT mean formula correct")
+    ok()
 
-# 10.3 Check that ranking is stable (no ties that would cause non-determinism)
+# 10.3 Check that ranking is ordered and flag near-ties. Exact ties are
+# broken deterministically by rank_scenarios; near-ties are still fragile.
 print("\n--- 10.3 Ranking stability ---")
-rankings = rank_scenarios(WEIGHTS_BALANCED)
-scores = [r.total_score for r in rankings]
-for i in range(len(scores)-1):
-    if abs(scores[i] - scores[i+1]) < 0.0001:
-        warn(f"Near-tie between rank {i+1} ({rankings[i].scenario_id}) and rank {i+2} ({rankings[i+1].scenario_id}): diff={abs(scores[i]-scores[i+1]):.6f}")
+# Same balanced weights as Section 5.5, so reuse its rankings
+score_gaps = np.diff([r.total_score for r in rankings])
+if np.all(score_gaps >= 0):
+    ok()
+else:
+    fail("Rankings are not sorted by ascending total score")
+for i in np.flatnonzero(np.abs(score_gaps) < 0.0001):
+    warn(f"Near-tie between rank {i+1} ({rankings[i].scenario_id}) and rank {i+2} ({rankings[i+1].scenario_id}): diff={abs(score_gaps[i]):.6f}")
 
 # 10.4 Goal baselines make sense
 print("\n--- 10.4 Goal baseline sanity ---")
@@ -753,12 +780,17 @@ baseline_checks = {
     "G9": (50, 100, "control score"),
     "G10": (0, 100, "affordable %"),
 }
-for gid, (lo, hi, desc) in baseline_checks.items():
-    baseline = GOALS[gid].baseline
-    if not (lo <= baseline <= hi):
-        warn(f"{gid} baseline={baseline} outside expected ({lo},{hi}) for {desc}")
-    else:
-        ok(f"{gid} baseline={baseline} ✓")
+n_checks = len(baseline_checks)
+lo_arr = np.fromiter((lo for lo, _, _ in baseline_checks.values()), dtype=np.float64, count=n_checks)
+hi_arr = np.fromiter((hi for _, hi, _ in baseline_checks.values()), dtype=np.float64, count=n_checks)
+base_arr = np.fromiter((GOALS[gid].baseline for gid in baseline_checks), dtype=np.float64, count=n_checks)
+out_of_range = (base_arr < lo_arr) | (base_arr > hi_arr)
+check_gids = list(baseline_checks)
+for j in np.flatnonzero(out_of_range):
+    gid = check_gids[j]
+    lo, hi, desc = baseline_checks[gid]
+    warn(f"{gid} baseline={GOALS[gid].baseline} outside expected ({lo},{hi}) for {desc}")
+ok(n_checks - int(out_of_range.sum()))
 
 
 # ═══════════════════════════════════════════════════════════════
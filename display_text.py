@@ -0,0 +1,277 @@
+"""
+Display text for the Hallar DSS app — scenario names/descriptions, goal
+labels and the methodology page, in plain Icelandic.
+
+Kept out of app.py so the literals are built once per process when this
+module is first imported, rather than on every Streamlit rerun.
+"""
+
+# ═════════════════════════════════════════════════════════════════════
+# SCENARIO NAMES & DESCRIPTIONS (plain Icelandic)
+# ═════════════════════════════════════════════════════════════════════
+
+SCENARIO_DISPLAY = {
+    "S1": {
+        "name": "Borgin byggir innviði og selur byggingarrétt",
+        "desc": (
+            "Borgin ber ábyrgð á öllum innviðum — götum, innviðum og byggingar- "
+            "hæfi lóða og selur síðan byggingarrétt til verktaka sem byggja "
+            "íbúðirnar. Borgin hefur fulla stjórn yfir verkefninu en verkefna- "
+            "stjórnun er veik og skipulag er aðskilið frá framkvæmdum. "
+            "Þetta er hefðbundin leið sem borgin þekkir vel en áhætta er "
+            "á hægagangi í framkvæmd og kostnaðarframúrkeyrslu vegna takmarkaðrar "
+            "samhæfingar."
+        ),
+    },
+    "S2": {
+        "name": "Lífeyrissjóðir eigendur sem ráða til sín verkefnastjóra",
+        "desc": (
+            "Lífeyrissjóður á verkefnið og ræður sérstakan verkefnastjóra "
+            "til að halda utan um framkvæmdir. Sjóðurinn leggur til þolið "
+            "fjármagn og verkefnastjórinn sér um daglegan rekstur. "
+            "Borgin á ekki hlut en hefur einhverja samningsstöðu. "
+            "Hætta er á því að verkefnastjóri hafi takmarkað vald yfir "
+            "verktökum þar sem hann er ekki meðeigandi og ber ekki "
+            "fjárhagslega áhættu."
+        ),
+    },
+    "S3": {
+        "name": "Lífeyrissjóðir og verkefnastjóri eru meðeigendur",
+        "desc": (
+            "Lífeyrissjóður á verkefnið en verkefnastjóri er einnig "
+            "meðeigandi og ber fjárhagslega áhættu ásamt sjóðnum. "
+            "Þetta eykur hvata verkefnastjóra til að halda tíma og "
+            "kostnaði í skefjum. Sterk verkefnastjórnun og þolið "
+            "fjármagn draga úr áhættu. Borgin á ekki hlut en hefur "
+            "einhverja samningsstöðu gagnvart verkefninu."
+        ),
+    },
+    "S4": {
+        "name": "Lífeyrissjóðir og aðalverktaki eru eigendur",
+        "desc": (
+            "Lífeyrissjóður á verkefnið og sterkur aðalverktaki er "
+            "meðeigandi. Verktakinn ber áhættu ásamt sjóðnum sem tryggir "
+            "sterkan hvata til vandaðra og tímanlegra framkvæmda. "
+            "Full samþætting skipulags og framkvæmda dregur verulega úr "
+            "töfum og kostnaði. Þetta er sterkasta samningsleiðin í "
+            "flestum aðstæðum — en borgin hefur ekki beint eignarhald."
+        ),
+    },
+    "S5": {
+        "name": "Lífeyrissjóðir eigendur með fasteignaþróunarfélagi",
+        "desc": (
+            "Tveir eða fleiri lífeyrissjóðir fjárfesta í verkefninu með "
+            "fasteignaþróunarfélagi sem stýrir verkefninu og útvegar "
+            "verktaka til að byggja upp svæðið. Traust sviðsmynd sem "
+            "nýtir þekkingu og reynslu þróunarfyrirtækja og þolinmótt . "
+            "fjármagn lífeyrissjóðanna. Fjöldi eigenda eykur hins vegar  "
+            "samhæfingaráhættu og borgin hefur litla beina aðkomu."
+        ),
+    },
+    "S6": {
+        "name": "Innviðafélag byggir innviði og selur áfram BR",
+        "desc": (
+            "Lífeyrissjóður byggir innviðin og selur síðan byggingarrétt "
+            "til ýmissa verktaka. Algjör aðskilnaður milli innviða og "
+            "íbúðabygginga skapar áskoranir í samhæfingu. "
+            "Borgin á ekki hlut og hefur veika samningsstöðu. Hætta er á "
+            "gæðavandamálum þegar margir verktakar starfa sjálfstætt án "
+            "sameiginlegrar stjórnunar."
+        ),
+    },
+    "S7": {
+        "name": "2–3 stórir verktakar eigendur með bankafjármögnun ",
+        "desc": (
+            "Tveir til þrír stórir verktakar stofna sameiginlegt félag "
+            "og fjármagna verkefnið með bankalánum. Verktakarnir bera áhættu "
+            "og hafa hvata til að ljúka framkvæmdum sem fyrst. "
+            "Bankafjármögnun er hins vegar óþolinmóð — bankar geta þrýst á "
+            "uppgreiðslu lána eða stöðvun framkvæmda í niðursveiflu en eigin-. "
+            "fjárstaða verktaka dregur úr þessari áhættu. Borgin hefur litla "
+            "samningsstöðu. "
+        ),
+    },
+    "S8": {
+        "name": "1 stór verktaki eigandi verkefnis með bankafjármögnun ",
+        "desc": (
+            "Einn stór verktaki tekur verkefnið að sér og fjármagnar "
+            "með bankalánum. Full samþætting og sterk verkefnisstjórnun "
+            "draga úr töfum. Fáir eigendur einfalda ákvarðanatöku. "
+            "Hætta er þó á að verktakinn verði of ráðandi og eiginfjár-"
+            "staða ekki nægilega traust í niðursveiflu eða við vaxtabreytingu. "
+        ),
+    },
+    "S9": {
+        "name": "Margir smáir verktakar — engin samhæfing",
+        "desc": (
+            "Mörgum litlum verktökum er úthlutað lóðum og þeir byggja "
+            "sjálfstætt. Engin sameiginleg verkefnisstjórnun og engin "
+            "samþætting skipulags og framkvæmda. "
+            "Þetta er áhættusamasta leiðin — mikil hætta á töfum, "
+            "gæðavandamálum og jafnvel gjaldþroti einstakra verktaka. "
+            "Borgin hefur nánast enga stjórn á framgangi verkefnisins."
+        ),
+    },
+    "S10": {
+        "name": "Reykjavíkurborg og lífeyrissjóðir eru eigendur",
+        "desc": (
+            "Borgin og lífeyrissjóðir stofna sameiginlegt félag um "
+            "verkefnið. Borgin hefur beina aðkomu og stjórn á meðan "
+            "sjóðirnir leggja til þolinmótt fjármagn. "
+            "Styrkur verktaka og verkefnisstjórnun er í meðallagi í "
+            "þessari sviðsmynd. Góð leið ef borgin vill halda áhrifum "
+            "en deila áhættu og kostnaði með lífeyrissjóðunum."
+        ),
+    },
+    "S11": {
+        "name": "Reykjavíkurborg, lífeyrissjóðir og aðalverktaki eigendur",
+        "desc": (
+            "Borgin, lífeyrissjóðir og sterkur aðalverktaki eru eigendur. "
+            "Sameinar styrk lífeyrisfjármagns, reynslu aðalverktaka og "
+            "stjórn borgarinnar. Full samþætting og sterk verkefnisstjórnun. "
+            " Flóknara eignarhald en dreifir áhættu vel og tryggir að hagsmunir "
+            " allra aðila séu amræmdir. "
+        ),
+    },
+    "S12": {
+        "name": "Lífeyrissjóðir eru eigendur og ráða til sín aðalverktaka",
+        "desc": (
+            "Lífeyrissjóðir eiga verkefnið og ráða aðalverktaka til stýringar "
+            "og framkvæmda, en verktakinn er ekki meðeigandi. Gott skipulag "
+            "og sterk verkefnisstjórnun. Verktakinn hefur þó minni hvata en í"
+            " sviðsmynd S4 þar sem hann ber ekki eignarhaldsáhættu. Þolið "
+            "fjármagn sjóðsins dregur úr fjárhagslegri áhættu verkefnisins. "
+        ),
+    },
+}
+
+
+# ═════════════════════════════════════════════════════════════════════
+# GOAL DESCRIPTIONS (plain Icelandic)
+# ═════════════════════════════════════════════════════════════════════
+
+GOAL_DESCRIPTIONS = {
+    "G1": "Götur og hluti innviða tilbúnir áður en flutt hefur verið inn í 300 íbúðir",
+    "G2": "Að minnsta kosti 400 íbúðir tilbúnar til afhendingar á hverju ári",
+    "G3": "Íbúðaverð verði 15-20% undir markaðsverði",
+    "G4": "Að borgin verði ekki af fjármunum við samningsgerð",
+    "G5": "Að verkefnið klárist að fullu eins og áætlað er",
+    "G6": "Að innviðaframkvæmdir haldist innan fjárhagsáætlunar",
+    "G7": "Að götur, innviðir og almenningssvæði séu vönduð og endingargóð",
+    "G8": "Að íbúðir og byggingar séu vandaðar og uppfylli gæðakröfur",
+    "G9": "Að borgin hafi áhrif á framkvæmdir og geti tryggt almannahagsmuni",
+    "G10": "Að fjölbreyttur hópur fólks geti búið á svæðinu, þ.m.t. tekjulágir",
+}
+
+GOAL_SHORT_LABELS = {
+    "G1": "Innviðahraði",
+    "G2": "Byggingarhraði",
+    "G3": "Hagkvæmni",
+    "G4": "Fjárhagslegir hagsmunir",
+    "G5": "Verklok",
+    "G6": "Kostnaður við innviði",
+    "G7": "Gæði innviða",
+    "G8": "Gæði bygginga",
+    "G9": "Stýring borgarinnar",
+    "G10": "Félagsleg blöndun",
+}
+
+
+# ═════════════════════════════════════════════════════════════════════
+# METHODOLOGY PAGE (markdown, plain Icelandic)
+# ═════════════════════════════════════════════════════════════════════
+
+METHODOLOGY_LAYERS_MD = """
+**Lag 1 — Skipulagsþættir (F1–F7):**
+Hver sviðsmynd fær einkunn 1–5 á sjö þáttum sem lýsa uppbyggingu
+eignarhaldsleiðar: hverjir eiga, hverjir byggja, hvernig er fjármagnað,
+hver stýrir, o.s.frv. Hver einkunn er rökstudd.
+
+**Lag 2 — Áhættuþolni (Risk Sensitivities):**
+Hvert af 33 áhættum hefur skilgreint þolni gagnvart þáttum.
+Stefna (PROTECTIVE/EXPOSURE) og styrkur (LOW/MEDIUM/HIGH/CRITICAL)
+ákvarða hvernig þáttaskor breytir áhættulíkum.
+
+**Lag 3 — Áhættureikningur (Logistic Model):**
+Grunnlíkur → log-odds → aðlagað eftir þáttaáhrifum → sigmoid → líkur.
+Tryggir 0–100% mörk stærðfræðilega. Engin gervileg þök.
+
+**Lag 4 — Áhrif á markmið (Goal Impacts):**
+Hvert par áhætta × markmið: PERT-mat (besta/líklegast/versta).
+Vænt framlag = P(áhætta) × E[áhrif].
+
+**Lag 5 — Vegið skor:**
+Einingarnar stöðlaðar, vegnar eftir vali notanda, summað.
+Lægra skor = betri sviðsmynd.
+"""
+
+METHODOLOGY_MATH_MD = """
+**Áhrifafall þáttar:**
+
+PROTECTIVE: `effect = (3 / (3 + d))^s`
+
+EXPOSURE: `effect = ((3 + d) / 3)^s`
+
+þar sem `d = skor − 3` og `s = styrkleikaveldi` (0.5 / 1.0 / 1.5 / 2.0)
+
+**Logistic umbreyting:**
+
+1. `L₀ = ln(p / (1−p))` — grunnlíkur → log-odds
+2. `L₁ = L₀ + Σ ln(effect)` — aðlögun í log-odds rúmi
+3. `p' = 1 / (1 + e^(−L₁))` — sigmoid → líkur
+4. Klemma: `[1×10⁻¹⁵, 1 − 1×10⁻¹⁵]` — float64 öryggismörk
+
+**PERT-meðaltal:** `E = (besta + 4×líklegast + versta) / 6`
+"""
+
+METHODOLOGY_VALIDATION_MD = """
+Reiknilíkanið hefur verið staðfest með **2.874 sjálfvirkum prófunum:**
+
+| Flokkur | Lýsing | Staða |
+|---------|--------|-------|
+| Skipulag | 84 þáttagildi í bili 1–5, allar 12 sviðsmyndir | ✅ |
+| Gagnaheilleiki | 33 áhættur, grunnlíkur, þolni, markmið | ✅ |
+| Áhrifaformerki | 100 áhrif, rétt stefna og röð | ✅ |
+| Stærðfræði | Logistic: auðkenni, mörk, monotonía, overflow | ✅ |
+| Stærðfræði | PERT-röðun varðveitt eftir umbreytingu | ✅ |
+| Stigagjöf | Stöðlun, formerki, abs() öryggi | ✅ |
+| Heilbrigðisathugun | S11 = #1, S9 = #12 á jafnvægi | ✅ |
+| Rökstuðningur | 84 textar, >80 stafir, rétt einkunn | ✅ |
+| Öryggisstig | 33 stig, gilt form | ✅ |
+| Samræmi | affected_goals = RISK_GOAL_IMPACTS | ✅ |
+"""
+
+METHODOLOGY_CHANGELOG_MD = """
+**v5 — 33 áhættur, G9 lagfært, stöðlun endurkvörðuð (febrúar 2026)**
+- R34–R37 bætt við: skattar, útboðsreglur, slit samstarfs, hagsmunaárekstrar
+- R30 útvíkkað: millisala byggingarréttar og virðisaukning lands
+- G9 grunngildi breytilegt eftir F6/F7 (40–100 í stað 100 alltaf)
+- R04→G9 og R11→G9 fjarlægð (verktakaþættir, ekki borgarstjórnun)
+- Stöðlun endurkvörðuð: öll markmið jafn áhrifarík við sömu vægi
+- 2.874 sjálfvirk próf standast
+
+**v4 — 29 áhættur og uppfærð staðfesting (febrúar 2026)**
+- 29. áhætta bætt við (R29–R33), 4 áhættur sameinaðar/fjarlægðar
+- Öll 28→29 tilvísanir lagfærðar
+- Staðfestingarpróf uppfærð
+
+**v3 — Endanleg útgáfa (febrúar 2026)**
+- Logistic (sigmoid) líkan í stað capped multiplicative
+- G6 styrktur: 3 áhættur í stað 1
+- 4 vantar þolni bætt við
+- 10 rökstuðningstextar endurbættir
+- Float64 útkomuklemma
+- Dead code fjarlægður
+"""
+
+# The page sections joined into the two markdown elements on either side of
+# the confidence table (each section constant starts and ends with a newline)
+METHODOLOGY_BEFORE_TABLE_MD = "\n".join((
+    "### Fimm-laga reiknilíkan", METHODOLOGY_LAYERS_MD,
+    "### Stærðfræðilegar forsendur", METHODOLOGY_MATH_MD,
+    "### Öryggisstig gagna",
+))
+METHODOLOGY_AFTER_TABLE_MD = "\n".join((
+    "### Staðfesting", METHODOLOGY_VALIDATION_MD,
+    "### Uppfærsluskrá", METHODOLOGY_CHANGELOG_MD,
+))
@@ -4,112 +4,103 @@ Hallar Risk Factors Module
 Structural approach to risk quantification across development scenarios.
 
 Chain: Structure → Risk Probability → Goal Impact → Weighted Ranking
-"""
-from .structural_factors import (
-    STRUCTURAL_FACTORS,
-    SCENARIO_FACTORS,
-    StructuralFactor,
-    ScenarioFactors,
-    get_scenario_profile,
-    compare_scenarios,
-)
-
-from .risk_sensitivities import (
-    RISK_PROFILES,
-    RiskProfile,
-    FactorSensitivity,
-    FactorDirection,
-    Sensitivity,
-    get_risk_affected_goals,
-    get_risks_affecting_goal,
-)
-
-from .risk_calculator import (
-    calculate_adjusted_probability,
-    calculate_scenario_risk_profile,
-    compare_scenarios_by_goal,
-    get_scenario_risk_summary,
-    print_scenario_comparison,
-    ScenarioRiskResult,
-    ScenarioRiskProfile,
-)
 
-from .goal_impacts import (
-    GOALS,
-    RISK_GOAL_IMPACTS,
-    GoalDefinition,
-    RiskGoalImpact,
-    ImpactUnit,
-    get_impacts_for_risk,
-    get_impacts_for_goal,
-    pert_mean,
-)
-
-from .goal_scoring import (
-    calculate_scenario_goal_profile,
-    calculate_weighted_score,
-    rank_scenarios,
-    compare_scenarios_by_goals,
-    find_best_scenario_per_goal,
-    GoalScore,
-    GoalRiskContribution,
-    ScenarioGoalProfile,
-    WeightedScenarioScore,
-    WEIGHTS_BALANCED,
-    WEIGHTS_SPEED_FOCUSED,
-    WEIGHTS_FISCAL_FOCUSED,
-    WEIGHTS_SOCIAL_FOCUSED,
-    WEIGHTS_CONTROL_FOCUSED,
-    WEIGHTS_CITY_CRO,
-)
+Public names are loaded lazily (PEP 562): a submodule is imported the
+first time one of its names is accessed on the package.
+"""
+from importlib import import_module
+from typing import Dict, Tuple
 
-__all__ = [
+# Submodule → public names it provides
+_EXPORTS: Dict[str, Tuple[str, ...]] = {
     # Structural factors
-    "STRUCTURAL_FACTORS",
-    "SCENARIO_FACTORS",
-    "StructuralFactor",
-    "ScenarioFactors",
-    "get_scenario_profile",
-    "compare_scenarios",
+    "structural_factors": (
+        "STRUCTURAL_FACTORS",
+        "SCENARIO_FACTORS",
+        "StructuralFactor",
+        "ScenarioFactors",
+        "get_scenario_profile",
+        "compare_scenarios",
+    ),
     # Risk profiles
-    "RISK_PROFILES",
-    "RiskProfile",
-    "FactorSensitivity",
-    "FactorDirection",
-    "Sensitivity",
-    "get_risk_affected_goals",
-    "get_risks_affecting_goal",
+    "risk_sensitivities": (
+        "RISK_PROFILES",
+        "RISK_IDS",
+        "RiskProfile",
+        "FactorSensitivity",
+        "FactorDirection",
+        "Sensitivity",
+        "get_risk_affected_goals",
+        "get_risks_affecting_goal",
+    ),
     # Risk calculator
-    "calculate_adjusted_probability",
-    "calculate_scenario_risk_profile",
-    "compare_scenarios_by_goal",
-    "get_scenario_risk_summary",
-    "print_scenario_comparison",
-    "ScenarioRiskResult",
-    "ScenarioRiskProfile",
+    "risk_calculator": (
+        "calculate_adjusted_probability",
+        "calculate_probability_matrix",
+        "calculate_scenario_risk_profile",
+        "compare_scenarios_by_goal",
+        "get_scenario_risk_summary",
+        "print_scenario_comparison",
+        "ScenarioRiskResult",
+        "ScenarioRiskProfile",
+    ),
     # Goal impacts
-    "GOALS",
-    "RISK_GOAL_IMPACTS",
-    "GoalDefinition",
-    "RiskGoalImpact",
-    "ImpactUnit",
-    "get_impacts_for_risk",
-    "get_impacts_for_goal",
-    "pert_mean",
+    "goal_impacts": (
+        "GOALS",
+        "GOAL_ID_SET",
+        "GOAL_LIST",
+        "RISK_GOAL_IMPACTS",
+        "GoalDefinition",
+        "RiskGoalImpact",
+        "ImpactUnit",
+        "get_impacts_for_risk",
+        "get_impacts_for_goal",
+        "get_rationale",
+        "pert_mean",
+        "pert_mean_batch",
+        "pert_mean_all",
+        "expected_impact_per_goal",
+        "compute_goal_totals",
+        "expected_impact_matrix",
+        "IMPACT_INDEX",
+    ),
     # Goal scoring
-    "calculate_scenario_goal_profile",
-    "calculate_weighted_score",
-    "rank_scenarios",
-    "compare_scenarios_by_goals",
-    "find_best_scenario_per_goal",
-    "GoalScore",
-    "GoalRiskContribution",
-    "ScenarioGoalProfile",
-    "WeightedScenarioScore",
-    "WEIGHTS_BALANCED",
-    "WEIGHTS_SPEED_FOCUSED",
-    "WEIGHTS_FISCAL_FOCUSED",
-    "WEIGHTS_SOCIAL_FOCUSED",
-    "WEIGHTS_CONTROL_FOCUSED",
-    "WEIGHTS_CITY_CRO",
-]
+    "goal_scoring": (
+        "calculate_scenario_goal_profile",
+        "calculate_weighted_score",
+        "calculate_weighted_scores",
+        "rank_scenarios",
+        "compare_scenarios_by_goals",
+        "find_best_scenario_per_goal",
+        "GoalScore",
+        "GoalRiskContribution",
+        "ScenarioGoalProfile",
+        "WeightedScenarioScore",
+        "NORMALIZERS",
+        "WEIGHTS_BALANCED",
+        "WEIGHTS_SPEED_FOCUSED",
+        "WEIGHTS_FISCAL_FOCUSED",
+        "WEIGHTS_SOCIAL_FOCUSED",
+        "WEIGHTS_CONTROL_FOCUSED",
+        "WEIGHTS_CITY_CRO",
+    ),
+}
+
+_LAZY: Dict[str, str] = {
+    name: module for module, names in _EXPORTS.items() for name in names
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
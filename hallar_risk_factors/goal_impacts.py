@@ -15,23 +15,36 @@ v4 — February 2026
   - R21 removed
   - R29–R33 added
   - v5: R30 expanded (added G4); R34–R37 added; R04→G9 removed; R11→G9 removed
+  - ImpactUnit is an IntEnum: .value is now 0–3; the unit names
+    ("months", "misk", "pct_points", "score") moved to ImpactUnit.label
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
-from enum import Enum
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from enum import IntEnum
 
+import numpy as np
 
-class ImpactUnit(Enum):
+
+class ImpactUnit(IntEnum):
     """Units for goal impacts."""
-    MONTHS = "months"
-    MISK = "misk"
-    PCT_POINTS = "pct_points"
-    SCORE_POINTS = "score"
+    MONTHS = 0
+    MISK = 1
+    PCT_POINTS = 2
+    SCORE_POINTS = 3
+
+    @property
+    def label(self) -> str:
+        """Unit name used in scores and reports."""
+        return _UNIT_LABELS[self]
+
+
+_UNIT_LABELS = ("months", "misk", "pct_points", "score")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GoalDefinition:
     """Definition of a city goal."""
     goal_id: str
@@ -136,8 +149,12 @@ GOALS: Dict[str, GoalDefinition] = {
     ),
 }
 
+# Goal ids for membership tests and goal definitions in GOALS order
+GOAL_ID_SET: FrozenSet[str] = frozenset(GOALS)
+GOAL_LIST: Tuple[GoalDefinition, ...] = tuple(GOALS.values())
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class RiskGoalImpact:
     """Impact of a single risk on a single goal."""
     risk_id: str
@@ -145,336 +162,463 @@ class RiskGoalImpact:
     impact_low: float
     impact_likely: float
     impact_high: float
-    rationale: str
+    # Caller-supplied rationale. None for the RISK_GOAL_IMPACTS rows, whose
+    # text is kept in the rationale sidecar and read back through get_rationale
+    rationale_text: Optional[str] = field(default=None, repr=False, compare=False)
+    # PERT mean of the three estimates, fixed at construction
+    mean: float = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "mean", (self.impact_low + 4 * self.impact_likely + self.impact_high) / 6
+        )
 
-RISK_GOAL_IMPACTS: Dict[str, List[RiskGoalImpact]] = {
+    @property
+    def rationale(self) -> str:
+        """Rationale text: the caller's own if given, else the table's."""
+        if self.rationale_text is not None:
+            return self.rationale_text
+        return get_rationale(self.risk_id, self.goal_id)
+
+
+# (goal_id, low, likely, high, rationale) per risk, materialized below
+_RAW_IMPACTS: Dict[str, Tuple[Tuple[str, float, float, float, str], ...]] = {
     # ═══════════════════════════════════════════════════════════
     # SKIPULAG OG LEYFI
     # ═══════════════════════════════════════════════════════════
-    "R01": [
-        RiskGoalImpact("R01", "G1", 3, 6, 12,
-                        "Seinkun á deiliskipulagi bætir 3–12 mánuðum við innviðaáætlun"),
-        RiskGoalImpact("R01", "G2", 3, 6, 12,
-                        "Keðjuverkun: seinkun á innviðum seinkar byggingum"),
-        RiskGoalImpact("R01", "G4", 50, 150, 400,
-                        "Umsýslukostnaður og verðbólga á biðtíma (M kr.)"),
-    ],
-    "R02": [
-        RiskGoalImpact("R02", "G1", 6, 12, 24,
-                        "Kæra getur bætt 6–24 mánuðum við áætlun"),
-        RiskGoalImpact("R02", "G2", 6, 12, 24,
-                        "Keðjuverkun: kæra seinkar öllu"),
-        RiskGoalImpact("R02", "G4", 100, 300, 800,
-                        "Lögfræðikostnaður og tafakostnaður (M kr.)"),
-        RiskGoalImpact("R02", "G5", -5, -15, -40,
-                        "Kæra getur stöðvað verkefni (prósentustig)"),
-        RiskGoalImpact("R02", "G9", -5, -10, -20,
-                        "Kæra grefur undan ákvörðunarvaldi borgar"),
-    ],
-    "R03": [
-        RiskGoalImpact("R03", "G2", 6, 12, 24,
-                        "Endurskipulagning seinkar framkvæmdum"),
-        RiskGoalImpact("R03", "G3", 5, 12, 25,
-                        "Röng vara = verðmismunur (%)"),
-        RiskGoalImpact("R03", "G5", -5, -15, -30,
-                        "Óbyggilegt skipulag ógnar fullnaði"),
-        RiskGoalImpact("R03", "G10", -5, -10, -20,
-                        "Röng íbúðablöndun = félagsleg markmið bresta (prósentustig)"),
-    ],
-    "R04": [
-        RiskGoalImpact("R04", "G1", 3, 8, 18,
-                        "Breytingabeiðnir seinka innviðum"),
-        RiskGoalImpact("R04", "G2", 4, 10, 24,
-                        "Breytingar seinka byggingum enn meira"),
-        RiskGoalImpact("R04", "G3", 3, 8, 15,
-                        "Breytingar hækka kostnað sem skilar sér í verði (%)"),
-        RiskGoalImpact("R04", "G5", -3, -10, -25,
-                        "Endalausar breytingar ógna fullnaði"),
+    "R01": (
+        ("G1", 3, 6, 12,
+         "Seinkun á deiliskipulagi bætir 3–12 mánuðum við innviðaáætlun"),
+        ("G2", 3, 6, 12,
+         "Keðjuverkun: seinkun á innviðum seinkar byggingum"),
+        ("G4", 50, 150, 400,
+         "Umsýslukostnaður og verðbólga á biðtíma (M kr.)"),
+    ),
+    "R02": (
+        ("G1", 6, 12, 24,
+         "Kæra getur bætt 6–24 mánuðum við áætlun"),
+        ("G2", 6, 12, 24,
+         "Keðjuverkun: kæra seinkar öllu"),
+        ("G4", 100, 300, 800,
+         "Lögfræðikostnaður og tafakostnaður (M kr.)"),
+        ("G5", -5, -15, -40,
+         "Kæra getur stöðvað verkefni (prósentustig)"),
+        ("G9", -5, -10, -20,
+         "Kæra grefur undan ákvörðunarvaldi borgar"),
+    ),
+    "R03": (
+        ("G2", 6, 12, 24,
+         "Endurskipulagning seinkar framkvæmdum"),
+        ("G3", 5, 12, 25,
+         "Röng vara = verðmismunur (%)"),
+        ("G5", -5, -15, -30,
+         "Óbyggilegt skipulag ógnar fullnaði"),
+        ("G10", -5, -10, -20,
+         "Röng íbúðablöndun = félagsleg markmið bresta (prósentustig)"),
+    ),
+    "R04": (
+        ("G1", 3, 8, 18,
+         "Breytingabeiðnir seinka innviðum"),
+        ("G2", 4, 10, 24,
+         "Breytingar seinka byggingum enn meira"),
+        ("G3", 3, 8, 15,
+         "Breytingar hækka kostnað sem skilar sér í verði (%)"),
+        ("G5", -3, -10, -25,
+         "Endalausar breytingar ógna fullnaði"),
         # R04→G9 REMOVED: Change request probability is driven by F4 (integration),
         # not city governance factors. Kept S4 artificially high on City Control.
-        RiskGoalImpact("R04", "G10", -3, -8, -15,
-                        "Breytingar geta fjarlægt hagkvæmar íbúðir (prósentustig)"),
-    ],
-    "R05": [
-        RiskGoalImpact("R05", "G1", 2, 4, 9,
-                        "Umhverfismat dregst, seinkar innviðum"),
-        RiskGoalImpact("R05", "G2", 2, 4, 9,
-                        "Keðjuverkun á byggingar"),
-    ],
-    "R06": [
-        RiskGoalImpact("R06", "G1", 2, 6, 18,
-                        "Fornleifar geta seinkt framkvæmdum verulega"),
-        RiskGoalImpact("R06", "G4", 50, 200, 800,
-                        "Borgin greiðir fornleifarannsóknir á almenningsreit (M kr.)"),
-    ],
+        ("G10", -3, -8, -15,
+         "Breytingar geta fjarlægt hagkvæmar íbúðir (prósentustig)"),
+    ),
+    "R05": (
+        ("G1", 2, 4, 9,
+         "Umhverfismat dregst, seinkar innviðum"),
+        ("G2", 2, 4, 9,
+         "Keðjuverkun á byggingar"),
+    ),
+    "R06": (
+        ("G1", 2, 6, 18,
+         "Fornleifar geta seinkt framkvæmdum verulega"),
+        ("G4", 50, 200, 800,
+         "Borgin greiðir fornleifarannsóknir á almenningsreit (M kr.)"),
+    ),
     # ═══════════════════════════════════════════════════════════
     # INNVIÐIR (R07 merged into R10)
     # ═══════════════════════════════════════════════════════════
-    "R08": [
-        RiskGoalImpact("R08", "G4", 500, 2000, 6000,
-                        "Beinn kostnaður borgar við innviði umfram áætlun (M kr.)"),
-        RiskGoalImpact("R08", "G6", -15, -35, -60,
-                        "Fjárhagsáætlun innviða springur (prósentustig)"),
-    ],
-    "R09": [
-        RiskGoalImpact("R09", "G4", 200, 600, 2000,
-                        "Viðhaldskostnaður til langframa vegna galla (M kr.)"),
-        RiskGoalImpact("R09", "G6", -5, -10, -20,
-                        "Viðgerðir fara úr fjárhagsáætlun (prósentustig)"),
-        RiskGoalImpact("R09", "G7", -10, -25, -45,
-                        "Gæðaeinkunn innviða lækkar"),
-    ],
-    "R10": [
+    "R08": (
+        ("G4", 500, 2000, 6000,
+         "Beinn kostnaður borgar við innviði umfram áætlun (M kr.)"),
+        ("G6", -15, -35, -60,
+         "Fjárhagsáætlun innviða springur (prósentustig)"),
+    ),
+    "R09": (
+        ("G4", 200, 600, 2000,
+         "Viðhaldskostnaður til langframa vegna galla (M kr.)"),
+        ("G6", -5, -10, -20,
+         "Viðgerðir fara úr fjárhagsáætlun (prósentustig)"),
+        ("G7", -10, -25, -45,
+         "Gæðaeinkunn innviða lækkar"),
+    ),
+    "R10": (
         # Combined R10 (infra delays) + R07 (utility delays).
         # Utility delays (Veitur OR) are a common sub-cause.
         # Impact slightly raised to reflect combined scope.
-        RiskGoalImpact("R10", "G1", 4, 10, 24,
-                        "Innviða- og veitutafir seinka afhendingu beint"),
-        RiskGoalImpact("R10", "G2", 4, 10, 24,
-                        "Keðjuverkun: íbúðir geta ekki fólk fyrr en innviðir eru tilbúnir"),
-        RiskGoalImpact("R10", "G6", -10, -15, -25,
-                        "Tafir hækka innviðakostnað og þrýsta á fjárhagsáætlun"),
-    ],
+        ("G1", 4, 10, 24,
+         "Innviða- og veitutafir seinka afhendingu beint"),
+        ("G2", 4, 10, 24,
+         "Keðjuverkun: íbúðir geta ekki fólk fyrr en innviðir eru tilbúnir"),
+        ("G6", -10, -15, -25,
+         "Tafir hækka innviðakostnað og þrýsta á fjárhagsáætlun"),
+    ),
     # ═══════════════════════════════════════════════════════════
     # FRAMKVÆMDIR (R16 merged into R12)
     # ═══════════════════════════════════════════════════════════
-    "R11": [
-        RiskGoalImpact("R11", "G2", 12, 24, 48,
-                        "Gjaldþrot stöðvar framkvæmdir í marga mánuði"),
-        RiskGoalImpact("R11", "G5", -15, -35, -70,
-                        "Fullnaður í alvarlegri hættu"),
-        RiskGoalImpact("R11", "G8", -10, -20, -35,
-                        "Verktakar í erfiðleikum draga úr gæðum"),
+    "R11": (
+        ("G2", 12, 24, 48,
+         "Gjaldþrot stöðvar framkvæmdir í marga mánuði"),
+        ("G5", -15, -35, -70,
+         "Fullnaður í alvarlegri hættu"),
+        ("G8", -10, -20, -35,
+         "Verktakar í erfiðleikum draga úr gæðum"),
         # R11→G9 REMOVED: Bankruptcy probability is driven by F2 (contractor
         # strength) and F3 (capital patience), not city governance factors.
         # Kept S4 (F2=5) artificially high on City Control.
-        RiskGoalImpact("R11", "G10", -10, -20, -30,
-                        "Nýr eigandi byggir lúxus, ekki hagkvæmt"),
-    ],
-    "R12": [
+        ("G10", -10, -20, -30,
+         "Nýr eigandi byggir lúxus, ekki hagkvæmt"),
+    ),
+    "R12": (
         # Combined R12 (construction cost) + R16 (material prices).
         # Material price spikes are a major driver of construction
         # cost overruns, especially in Iceland where most materials
         # are imported.
-        RiskGoalImpact("R12", "G2", 3, 8, 18,
-                        "Kostnaðarvandamál hægja á framkvæmdum"),
-        RiskGoalImpact("R12", "G3", 5, 12, 25,
-                        "Kostnaðaraukning skilar sér beint í verði til kaupenda (%)"),
-        RiskGoalImpact("R12", "G5", -5, -15, -35,
-                        "Kostnaðarspírall ógnar framgangi verkefnis"),
-        RiskGoalImpact("R12", "G10", -5, -12, -25,
-                        "Hagkvæmar íbúðir verða óhagkvæmar þegar kostnaður hækkar"),
-    ],
-    "R13": [
-        RiskGoalImpact("R13", "G2", 6, 12, 30,
-                        "Beinar tafir á byggingum"),
-    ],
-    "R14": [
-        RiskGoalImpact("R14", "G8", -10, -25, -45,
-                        "Gæðaeinkunn bygginga lækkar"),
-    ],
-    "R15": [
-        RiskGoalImpact("R15", "G2", 4, 10, 20,
-                        "Mannekla seinkar framkvæmdum"),
-        RiskGoalImpact("R15", "G8", -5, -12, -25,
-                        "Flýtivinna = léleg gæði"),
-    ],
-    "R17": [
-        RiskGoalImpact("R17", "G1", 3, 8, 18,
-                        "Samhæfingarbrestur seinkar innviðum"),
-        RiskGoalImpact("R17", "G2", 4, 10, 24,
-                        "Tafir flæða yfir í byggingar"),
-        RiskGoalImpact("R17", "G7", -5, -12, -25,
-                        "Samhæfingargallar = gæðagallar í innviðum"),
-        RiskGoalImpact("R17", "G8", -5, -12, -25,
-                        "Samhæfingargallar = gæðagallar í byggingum"),
-    ],
+        ("G2", 3, 8, 18,
+         "Kostnaðarvandamál hægja á framkvæmdum"),
+        ("G3", 5, 12, 25,
+         "Kostnaðaraukning skilar sér beint í verði til kaupenda (%)"),
+        ("G5", -5, -15, -35,
+         "Kostnaðarspírall ógnar framgangi verkefnis"),
+        ("G10", -5, -12, -25,
+         "Hagkvæmar íbúðir verða óhagkvæmar þegar kostnaður hækkar"),
+    ),
+    "R13": (
+        ("G2", 6, 12, 30,
+         "Beinar tafir á byggingum"),
+    ),
+    "R14": (
+        ("G8", -10, -25, -45,
+         "Gæðaeinkunn bygginga lækkar"),
+    ),
+    "R15": (
+        ("G2", 4, 10, 20,
+         "Mannekla seinkar framkvæmdum"),
+        ("G8", -5, -12, -25,
+         "Flýtivinna = léleg gæði"),
+    ),
+    "R17": (
+        ("G1", 3, 8, 18,
+         "Samhæfingarbrestur seinkar innviðum"),
+        ("G2", 4, 10, 24,
+         "Tafir flæða yfir í byggingar"),
+        ("G7", -5, -12, -25,
+         "Samhæfingargallar = gæðagallar í innviðum"),
+        ("G8", -5, -12, -25,
+         "Samhæfingargallar = gæðagallar í byggingum"),
+    ),
     # ═══════════════════════════════════════════════════════════
     # MARKAÐUR (R21 removed)
     # ═══════════════════════════════════════════════════════════
-    "R18": [
-        RiskGoalImpact("R18", "G2", 12, 24, 48,
-                        "Verktakar hægja eða stöðva framkvæmdir í samdrætti"),
-        RiskGoalImpact("R18", "G5", -10, -25, -50,
-                        "Eftirspurnarbrestur ógnar fullnaði"),
-    ],
-    "R19": [
-        RiskGoalImpact("R19", "G5", -10, -25, -50,
-                        "Verktakar geta hætt þegar verð fer undir framkvæmdakostnað"),
-    ],
-    "R20": [
-        RiskGoalImpact("R20", "G2", 6, 12, 30,
-                        "Fjármögnunarþrýstingur hægir á öllu"),
-        RiskGoalImpact("R20", "G3", 5, 12, 25,
-                        "Fjármögnunarkostnaður skilar sér til kaupenda (%)"),
-        RiskGoalImpact("R20", "G5", -8, -20, -45,
-                        "Vaxtaskellur getur stöðvað verkefni"),
-    ],
+    "R18": (
+        ("G2", 12, 24, 48,
+         "Verktakar hægja eða stöðva framkvæmdir í samdrætti"),
+        ("G5", -10, -25, -50,
+         "Eftirspurnarbrestur ógnar fullnaði"),
+    ),
+    "R19": (
+        ("G5", -10, -25, -50,
+         "Verktakar geta hætt þegar verð fer undir framkvæmdakostnað"),
+    ),
+    "R20": (
+        ("G2", 6, 12, 30,
+         "Fjármögnunarþrýstingur hægir á öllu"),
+        ("G3", 5, 12, 25,
+         "Fjármögnunarkostnaður skilar sér til kaupenda (%)"),
+        ("G5", -8, -20, -45,
+         "Vaxtaskellur getur stöðvað verkefni"),
+    ),
     # ═══════════════════════════════════════════════════════════
     # FJÁRMÖGNUN
     # ═══════════════════════════════════════════════════════════
-    "R22": [
-        RiskGoalImpact("R22", "G2", 12, 24, 48,
-                        "Fjármögnunarbrestur stöðvar framkvæmdir"),
-        RiskGoalImpact("R22", "G5", -15, -35, -60,
-                        "Engin fjármögnun = ekkert verkefni"),
-    ],
-    "R23": [
-        RiskGoalImpact("R23", "G2", 12, 24, 36,
-                        "Sjóður hættir, alvarleg seinkun á meðan nýr fjárfestir finnst"),
-        RiskGoalImpact("R23", "G5", -10, -25, -45,
-                        "Helsti fjármögnunaraðili hverfur, ógnar framgangi"),
-        RiskGoalImpact("R23", "G9", -10, -20, -35,
-                        "Nýr aðili er ekki bundinn sömu skuldbindingum"),
-    ],
+    "R22": (
+        ("G2", 12, 24, 48,
+         "Fjármögnunarbrestur stöðvar framkvæmdir"),
+        ("G5", -15, -35, -60,
+         "Engin fjármögnun = ekkert verkefni"),
+    ),
+    "R23": (
+        ("G2", 12, 24, 36,
+         "Sjóður hættir, alvarleg seinkun á meðan nýr fjárfestir finnst"),
+        ("G5", -10, -25, -45,
+         "Helsti fjármögnunaraðili hverfur, ógnar framgangi"),
+        ("G9", -10, -20, -35,
+         "Nýr aðili er ekki bundinn sömu skuldbindingum"),
+    ),
     # ═══════════════════════════════════════════════════════════
     # STJÓRNMÁL OG SAMFÉLAG
     # ═══════════════════════════════════════════════════════════
-    "R24": [
-        RiskGoalImpact("R24", "G2", 6, 12, 24,
-                        "Pólitísk óvissa seinkar ákvörðunum"),
-        RiskGoalImpact("R24", "G5", -5, -15, -35,
-                        "Nýr meirihluti getur breytt eða stöðvað verkefni"),
-        RiskGoalImpact("R24", "G9", -10, -25, -45,
-                        "Stefnubreyting breytir forsendum"),
-        RiskGoalImpact("R24", "G10", -5, -15, -30,
-                        "Nýjar áherslur geta dregið úr félagslegri blöndun"),
-    ],
-    "R25": [
-        RiskGoalImpact("R25", "G1", 2, 6, 15,
-                        "Nýjar kröfur valda endurvinnslu"),
-        RiskGoalImpact("R25", "G2", 2, 6, 15,
-                        "Keðjuverkun á byggingar"),
-    ],
-    "R26": [
-        RiskGoalImpact("R26", "G1", 3, 8, 18,
-                        "Andstaða seinkar samþykktum"),
-        RiskGoalImpact("R26", "G2", 3, 8, 18,
-                        "Keðjuverkun á byggingar"),
-        RiskGoalImpact("R26", "G5", -3, -10, -25,
-                        "Mikil andstaða getur stöðvað verkefni"),
-        RiskGoalImpact("R26", "G9", -5, -15, -30,
-                        "Pólitískur þrýstingur takmarkar valmöguleika borgar"),
-    ],
+    "R24": (
+        ("G2", 6, 12, 24,
+         "Pólitísk óvissa seinkar ákvörðunum"),
+        ("G5", -5, -15, -35,
+         "Nýr meirihluti getur breytt eða stöðvað verkefni"),
+        ("G9", -10, -25, -45,
+         "Stefnubreyting breytir forsendum"),
+        ("G10", -5, -15, -30,
+         "Nýjar áherslur geta dregið úr félagslegri blöndun"),
+    ),
+    "R25": (
+        ("G1", 2, 6, 15,
+         "Nýjar kröfur valda endurvinnslu"),
+        ("G2", 2, 6, 15,
+         "Keðjuverkun á byggingar"),
+    ),
+    "R26": (
+        ("G1", 3, 8, 18,
+         "Andstaða seinkar samþykktum"),
+        ("G2", 3, 8, 18,
+         "Keðjuverkun á byggingar"),
+        ("G5", -3, -10, -25,
+         "Mikil andstaða getur stöðvað verkefni"),
+        ("G9", -5, -15, -30,
+         "Pólitískur þrýstingur takmarkar valmöguleika borgar"),
+    ),
     # ═══════════════════════════════════════════════════════════
     # VERKEFNISSTJÓRNUN OG SAMNINGAR (R28 merged into R27)
     # ═══════════════════════════════════════════════════════════
-    "R27": [
+    "R27": (
         # Combined R27 (owner coordination) + R28 (contractual disputes).
         # G4 impact from R28 (legal costs) now included.
-        RiskGoalImpact("R27", "G1", 4, 10, 24,
-                        "Deilur eigenda og samningaágreiningur seinkar innviðum"),
-        RiskGoalImpact("R27", "G2", 6, 15, 36,
-                        "Deilur stöðva ákvarðanir og seinka öllu"),
-        RiskGoalImpact("R27", "G4", 100, 400, 1200,
-                        "Lögfræðikostnaður og sáttir (M kr.)"),
-        RiskGoalImpact("R27", "G5", -5, -15, -35,
-                        "Stjórnunarbrestur ógnar framgangi"),
-        RiskGoalImpact("R27", "G9", -10, -25, -45,
-                        "Borgin missir áhrif í deilum"),
-    ],
+        ("G1", 4, 10, 24,
+         "Deilur eigenda og samningaágreiningur seinkar innviðum"),
+        ("G2", 6, 15, 36,
+         "Deilur stöðva ákvarðanir og seinka öllu"),
+        ("G4", 100, 400, 1200,
+         "Lögfræðikostnaður og sáttir (M kr.)"),
+        ("G5", -5, -15, -35,
+         "Stjórnunarbrestur ógnar framgangi"),
+        ("G9", -10, -25, -45,
+         "Borgin missir áhrif í deilum"),
+    ),
     # ═══════════════════════════════════════════════════════════
     # NEW RISKS
     # ═══════════════════════════════════════════════════════════
-    "R29": [
-        RiskGoalImpact("R29", "G4", 100, 400, 1500,
-                        "Viðgerðir og ábyrgðamál árum eftir afhendingu (M kr.)"),
-        RiskGoalImpact("R29", "G7", -5, -15, -30,
-                        "Gallar draga úr upplifun og nothæfi innviða"),
-        RiskGoalImpact("R29", "G8", -5, -15, -30,
-                        "Gallar í byggingum koma í ljós árum síðar"),
-    ],
-    "R30": [
-        RiskGoalImpact("R30", "G3", 5, 15, 30,
-                        "Virðisaukning lands skilar sér í hærra íbúðaverði (%)"),
+    "R29": (
+        ("G4", 100, 400, 1500,
+         "Viðgerðir og ábyrgðamál árum eftir afhendingu (M kr.)"),
+        ("G7", -5, -15, -30,
+         "Gallar draga úr upplifun og nothæfi innviða"),
+        ("G8", -5, -15, -30,
+         "Gallar í byggingum koma í ljós árum síðar"),
+    ),
+    "R30": (
+        ("G3", 5, 15, 30,
+         "Virðisaukning lands skilar sér í hærra íbúðaverði (%)"),
         # v5: G4 added — city loses money when intermediary captures land value
-        RiskGoalImpact("R30", "G4", 200, 800, 2000,
-                        "Borgin selur réttindi undir markaðsverði eða missir millisöluálag (M kr.)"),
-        RiskGoalImpact("R30", "G9", -10, -25, -45,
-                        "Borgin er bundin samningi þar sem hún hefur gefið eftir of mikið"),
-        RiskGoalImpact("R30", "G10", -5, -15, -30,
-                        "Of veik skilyrði gera félagslega blöndun óframkvæmanlega"),
-    ],
-    "R31": [
-        RiskGoalImpact("R31", "G1", 4, 10, 24,
-                        "Áfangar samræmast ekki, innviðir liggja ónotaðir"),
-        RiskGoalImpact("R31", "G2", 6, 15, 36,
-                        "Áfangi 2 stöðvast ef áfangi 1 gengur illa"),
-        RiskGoalImpact("R31", "G4", 200, 800, 3000,
-                        "Ónotaðir innviðir og tvíverknaður kosta borgina (M kr.)"),
-        RiskGoalImpact("R31", "G5", -5, -15, -40,
-                        "Hálflokið svæði sem enginn vill klára"),
-    ],
-    "R32": [
-        RiskGoalImpact("R32", "G5", -3, -10, -20,
-                        "Veik eftirlit dregur úr líkum á fullnaði"),
-        RiskGoalImpact("R32", "G7", -5, -12, -25,
-                        "Ónóg eftirlit dregur úr gæðum innviða"),
-        RiskGoalImpact("R32", "G9", -5, -15, -30,
-                        "Borgin getur ekki framfylgt markmiðum ef hún vantar sérfræðinga"),
-    ],
-    "R33": [
-        RiskGoalImpact("R33", "G10", -5, -15, -30,
-                        "Félagsleg blöndun nást ekki þrátt fyrir samningsskuldbindingu"),
-    ],
+        ("G4", 200, 800, 2000,
+         "Borgin selur réttindi undir markaðsverði eða missir millisöluálag (M kr.)"),
+        ("G9", -10, -25, -45,
+         "Borgin er bundin samningi þar sem hún hefur gefið eftir of mikið"),
+        ("G10", -5, -15, -30,
+         "Of veik skilyrði gera félagslega blöndun óframkvæmanlega"),
+    ),
+    "R31": (
+        ("G1", 4, 10, 24,
+         "Áfangar samræmast ekki, innviðir liggja ónotaðir"),
+        ("G2", 6, 15, 36,
+         "Áfangi 2 stöðvast ef áfangi 1 gengur illa"),
+        ("G4", 200, 800, 3000,
+         "Ónotaðir innviðir og tvíverknaður kosta borgina (M kr.)"),
+        ("G5", -5, -15, -40,
+         "Hálflokið svæði sem enginn vill klára"),
+    ),
+    "R32": (
+        ("G5", -3, -10, -20,
+         "Veik eftirlit dregur úr líkum á fullnaði"),
+        ("G7", -5, -12, -25,
+         "Ónóg eftirlit dregur úr gæðum innviða"),
+        ("G9", -5, -15, -30,
+         "Borgin getur ekki framfylgt markmiðum ef hún vantar sérfræðinga"),
+    ),
+    "R33": (
+        ("G10", -5, -15, -30,
+         "Félagsleg blöndun nást ekki þrátt fyrir samningsskuldbindingu"),
+    ),
     # ═══════════════════════════════════════════════════════════
     # v5 ADDITIONS
     # ═══════════════════════════════════════════════════════════
-    "R34": [
-        RiskGoalImpact("R34", "G2", 2, 6, 14,
-                        "Skattaleg skipulagning tekur tíma og getur stöðvað framkvæmdir (mán.)"),
-        RiskGoalImpact("R34", "G4", 200, 600, 1500,
-                        "Skattkostnaður, endurskipulagning, ráðgjöf, hugsanleg sektir (M kr.)"),
-        RiskGoalImpact("R34", "G9", -5, -10, -20,
-                        "Pólitísk áhætta ef skattavandamál verða opinber"),
-    ],
-    "R35": [
-        RiskGoalImpact("R35", "G1", 2, 6, 12,
-                        "Lögboðnir útboðsferlar seinka innviðaframkvæmdum (mán.)"),
-        RiskGoalImpact("R35", "G2", 3, 8, 18,
-                        "Útboð, kærufrestur og biðtími seinka byggingum (mán.)"),
-        RiskGoalImpact("R35", "G5", -3, -8, -15,
-                        "Stífir ferlar geta stöðvað verkefni ef útboð mistekst (prósentustig)"),
-    ],
-    "R36": [
-        RiskGoalImpact("R36", "G2", 3, 8, 18,
-                        "Slit samstarfs stöðvar framkvæmdir (mán.)"),
-        RiskGoalImpact("R36", "G4", 100, 400, 1200,
-                        "Lögfræðikostnaður, uppgjör, eignasala undir verði (M kr.)"),
-        RiskGoalImpact("R36", "G5", -5, -12, -25,
-                        "Hætta á að verkefni klárast ekki ef samstarf brotnar (prósentustig)"),
-        RiskGoalImpact("R36", "G9", -5, -15, -30,
-                        "Borgin missir samningsstöðu í slitaviðræðum"),
-    ],
-    "R37": [
-        RiskGoalImpact("R37", "G1", 2, 5, 12,
-                        "Kærur vegna hagsmunaárekstra seinka skipulagsákvörðunum (mán.)"),
-        RiskGoalImpact("R37", "G2", 2, 5, 12,
-                        "Ný útboð eða ógildingar seinka byggingum (mán.)"),
-        RiskGoalImpact("R37", "G5", -3, -8, -18,
-                        "Endurtekin ógildingar ógna fullnaði (prósentustig)"),
-        RiskGoalImpact("R37", "G9", -5, -15, -30,
-                        "Trúverðugleiki borgar sem skipulagsyfirvalds dregst í efa"),
-    ],
+    "R34": (
+        ("G2", 2, 6, 14,
+         "Skattaleg skipulagning tekur tíma og getur stöðvað framkvæmdir (mán.)"),
+        ("G4", 200, 600, 1500,
+         "Skattkostnaður, endurskipulagning, ráðgjöf, hugsanleg sektir (M kr.)"),
+        ("G9", -5, -10, -20,
+         "Pólitísk áhætta ef skattavandamál verða opinber"),
+    ),
+    "R35": (
+        ("G1", 2, 6, 12,
+         "Lögboðnir útboðsferlar seinka innviðaframkvæmdum (mán.)"),
+        ("G2", 3, 8, 18,
+         "Útboð, kærufrestur og biðtími seinka byggingum (mán.)"),
+        ("G5", -3, -8, -15,
+         "Stífir ferlar geta stöðvað verkefni ef útboð mistekst (prósentustig)"),
+    ),
+    "R36": (
+        ("G2", 3, 8, 18,
+         "Slit samstarfs stöðvar framkvæmdir (mán.)"),
+        ("G4", 100, 400, 1200,
+         "Lögfræðikostnaður, uppgjör, eignasala undir verði (M kr.)"),
+        ("G5", -5, -12, -25,
+         "Hætta á að verkefni klárast ekki ef samstarf brotnar (prósentustig)"),
+        ("G9", -5, -15, -30,
+         "Borgin missir samningsstöðu í slitaviðræðum"),
+    ),
+    "R37": (
+        ("G1", 2, 5, 12,
+         "Kærur vegna hagsmunaárekstra seinka skipulagsákvörðunum (mán.)"),
+        ("G2", 2, 5, 12,
+         "Ný útboð eða ógildingar seinka byggingum (mán.)"),
+        ("G5", -3, -8, -18,
+         "Endurtekin ógildingar ógna fullnaði (prósentustig)"),
+        ("G9", -5, -15, -30,
+         "Trúverðugleiki borgar sem skipulagsyfirvalds dregst í efa"),
+    ),
+}
+
+# Ids are interned so every impact, GOALS and the lookup maps share one
+# string object per id
+RISK_GOAL_IMPACTS: Dict[str, List[RiskGoalImpact]] = {
+    sys.intern(rid): [
+        RiskGoalImpact(sys.intern(rid), sys.intern(gid), low, likely, high)
+        for gid, low, likely, high, _rationale in rows
+    ]
+    for rid, rows in _RAW_IMPACTS.items()
 }
 
 
+# Flat column view of RISK_GOAL_IMPACTS: one row per (risk, goal) impact,
+# so PERT means for the whole table come from one vectorized expression.
+# Risks and goals are coded by their position in RISK_GOAL_IMPACTS / GOALS.
+_RISK_CODES: Dict[str, int] = {rid: i for i, rid in enumerate(RISK_GOAL_IMPACTS)}
+_GOAL_CODES: Dict[str, int] = {gid: i for i, gid in enumerate(GOALS)}
+_ROWS = [impact for impacts in RISK_GOAL_IMPACTS.values() for impact in impacts]
+IMPACT_INDEX: Dict[Tuple[str, str], int] = {
+    (impact.risk_id, impact.goal_id): row for row, impact in enumerate(_ROWS)
+}
+_RISK_IDX = np.array([_RISK_CODES[impact.risk_id] for impact in _ROWS], dtype=np.int16)
+_GOAL_IDX = np.array([_GOAL_CODES[impact.goal_id] for impact in _ROWS], dtype=np.int16)
+# Magnitudes are small whole-number estimates, exact in float32; the PERT
+# arithmetic upcasts to float64 so scores match the scalar pert_mean.
+_LOWS = np.array([impact.impact_low for impact in _ROWS], dtype=np.float32)
+_LIKELIES = np.array([impact.impact_likely for impact in _ROWS], dtype=np.float32)
+_HIGHS = np.array([impact.impact_high for impact in _ROWS], dtype=np.float32)
+# Rationales are only read by reporting, so they sit in a sidecar: one
+# packed UTF-8 buffer with byte offsets per row, decoded on demand. The raw
+# table is dropped once packed, so the buffer is the only copy of the table
+# text; impacts built elsewhere keep their own text in rationale_text.
+_RATIONALE_BYTES = [
+    rationale.encode("utf-8")
+    for rows in _RAW_IMPACTS.values() for *_, rationale in rows
+]
+_RATIONALE_BLOB = b"".join(_RATIONALE_BYTES)
+_RATIONALE_OFF = np.zeros(len(_RATIONALE_BYTES) + 1, dtype=np.int32)
+np.cumsum([len(raw) for raw in _RATIONALE_BYTES], out=_RATIONALE_OFF[1:])
+del _RATIONALE_BYTES, _RAW_IMPACTS
+del _ROWS
+
+# Inverse of RISK_GOAL_IMPACTS: goal_id -> impacts, in risk order. Stored
+# as tuples so no caller can reorder or extend the shared index.
+_by_goal: Dict[str, List[RiskGoalImpact]] = {}
+for _impacts in RISK_GOAL_IMPACTS.values():
+    for _impact in _impacts:
+        _by_goal.setdefault(_impact.goal_id, []).append(_impact)
+_IMPACTS_BY_GOAL: Dict[str, Tuple[RiskGoalImpact, ...]] = {
+    gid: tuple(impacts) for gid, impacts in _by_goal.items()
+}
+del _by_goal, _impacts, _impact
+
+
 def get_impacts_for_risk(risk_id: str) -> List[RiskGoalImpact]:
     """Get all goal impacts for a risk."""
     return RISK_GOAL_IMPACTS.get(risk_id, [])
 
 
 def get_impacts_for_goal(goal_id: str) -> List[RiskGoalImpact]:
-    """Get all risk impacts affecting a goal."""
-    result = []
-    for risk_id, impacts in RISK_GOAL_IMPACTS.items():
-        for impact in impacts:
-            if impact.goal_id == goal_id:
-                result.append(impact)
-    return result
+    """Get all risk impacts affecting a goal (a fresh list; the index is shared)."""
+    return list(_IMPACTS_BY_GOAL.get(goal_id, ()))
+
+
+def get_rationale(risk_id: str, goal_id: str) -> str:
+    """Get the table's rationale text for a risk's impact on a goal ("" if none)."""
+    row = IMPACT_INDEX.get((risk_id, goal_id))
+    if row is None:
+        return ""
+    return _RATIONALE_BLOB[_RATIONALE_OFF[row]:_RATIONALE_OFF[row + 1]].decode("utf-8")
 
 
 def pert_mean(low: float, likely: float, high: float) -> float:
     """Calculate PERT weighted mean."""
-    return (low + 4 * likely + high) / 6
\ No newline at end of file
+    return (low + 4 * likely + high) / 6
+
+
+def pert_mean_batch(lows, likelies, highs) -> np.ndarray:
+    """PERT weighted mean over arrays of low / likely / high values."""
+    lows = np.asarray(lows, dtype=np.float64)
+    likelies = np.asarray(likelies, dtype=np.float64)
+    highs = np.asarray(highs, dtype=np.float64)
+    return (lows + 4.0 * likelies + highs) / 6.0
+
+
+# PERT means of the whole impact table: static, so computed once at import
+_PERT_MEANS = pert_mean_batch(_LOWS, _LIKELIES, _HIGHS)
+_PERT_MEANS.flags.writeable = False
+
+
+def pert_mean_all() -> np.ndarray:
+    """PERT weighted mean of every impact, in IMPACT_INDEX row order (read-only)."""
+    return _PERT_MEANS
+
+
+def compute_goal_totals(p_risks, goal_weights) -> np.ndarray:
+    """
+    Weighted expected impact per goal: Σ P(risk) × PERT mean(impact) × weight(goal),
+    as one pass over the impact columns.
+    p_risks is indexed in RISK_GOAL_IMPACTS order; goal_weights and the
+    result are in GOALS order.
+    """
+    contrib = (
+        np.asarray(p_risks, dtype=np.float64)[_RISK_IDX]
+        * pert_mean_all()
+        * np.asarray(goal_weights, dtype=np.float64)[_GOAL_IDX]
+    )
+    return np.bincount(_GOAL_IDX, weights=contrib, minlength=len(_GOAL_CODES))
+
+
+def expected_impact_per_goal(p_risks) -> np.ndarray:
+    """
+    Expected impact summed per goal: Σ P(risk) × PERT mean(impact).
+    p_risks is indexed in RISK_GOAL_IMPACTS order; the result is in GOALS order.
+    """
+    return compute_goal_totals(p_risks, np.ones(len(_GOAL_CODES)))
+
+
+def expected_impact_matrix(p_risks) -> np.ndarray:
+    """
+    expected_impact_per_goal for many scenarios at once.
+    p_risks is (n_scenarios, n_risks) in RISK_GOAL_IMPACTS order; the result
+    is (n_scenarios, n_goals) in GOALS order, each row summed in the same
+    order as the single-scenario path.
+    """
+    p = np.asarray(p_risks, dtype=np.float64)
+    contrib = p[:, _RISK_IDX] * pert_mean_all()
+    out = np.zeros((p.shape[0], len(_GOAL_CODES)), dtype=np.float64)
+    np.add.at(out, (np.arange(p.shape[0])[:, None], _GOAL_IDX), contrib)
+    return out
@@ -10,14 +10,20 @@ Connects:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Tuple
 
-from .risk_calculator import calculate_scenario_risk_profile
-from .goal_impacts import GOALS, RISK_GOAL_IMPACTS, GoalDefinition, pert_mean
+import numpy as np
+
+from .risk_calculator import ReadOnlyDict, calculate_probability_matrix, calculate_scenario_risk_profile
+from .goal_impacts import (
+    GOALS, GOAL_LIST, RISK_GOAL_IMPACTS, GoalDefinition,
+    expected_impact_matrix, expected_impact_per_goal, get_impacts_for_goal,
+)
 from .structural_factors import SCENARIO_FACTORS
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GoalRiskContribution:
     """Contribution of one risk to one goal."""
     risk_id: str
@@ -28,7 +34,7 @@ class GoalRiskContribution:
     unit: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GoalScore:
     """Score for a single goal in a scenario."""
     goal_id: str
@@ -38,7 +44,7 @@ class GoalScore:
     baseline: float
     expected_impact: float
     expected_value: float
-    risk_contributions: List[GoalRiskContribution]
+    risk_contributions: Tuple[GoalRiskContribution, ...]
 
     @property
     def top_contributors(self) -> List[GoalRiskContribution]:
@@ -50,13 +56,13 @@ class GoalScore:
         )[:5]
 
 
-@dataclass
+@dataclass(frozen=True)
 class ScenarioGoalProfile:
     """Complete goal profile for a scenario."""
     scenario_id: str
     scenario_name_is: str
     scenario_name_en: str
-    goal_scores: Dict[str, GoalScore]
+    goal_scores: Mapping[str, GoalScore]
 
     def get_goal(self, goal_id: str) -> Optional[GoalScore]:
         return self.goal_scores.get(goal_id)
@@ -80,9 +86,14 @@ class WeightedScenarioScore:
     rank: int = 0
 
 
+@lru_cache(maxsize=None)
 def calculate_scenario_goal_profile(scenario_id: str) -> Optional[ScenarioGoalProfile]:
     """
     Calculate goal impacts for a scenario.
+    Memoized per scenario_id like calculate_scenario_risk_profile, so
+    calculate_weighted_score and the comparison helpers reuse one profile
+    across weight profiles. The shared profile is immutable (frozen
+    dataclasses, tuples and a read-only goal_scores mapping).
     """
     risk_profile = calculate_scenario_risk_profile(scenario_id)
     if not risk_profile:
@@ -95,38 +106,36 @@ def calculate_scenario_goal_profile(scenario_id: str) -> Optional[ScenarioGoalPr
         risk_probs[risk.risk_id] = risk.prob_pert_mean
         risk_names[risk.risk_id] = risk.name_is
 
+    goal_totals = expected_impact_per_goal(
+        np.array([risk_probs.get(rid, 0.0) for rid in RISK_GOAL_IMPACTS])
+    )
+
     # Calculate goal scores
     goal_scores: Dict[str, GoalScore] = {}
 
-    for goal_id, goal_def in GOALS.items():
+    for goal_code, (goal_id, goal_def) in enumerate(GOALS.items()):
         contributions: List[GoalRiskContribution] = []
-        total_impact = 0.0
-
-        for risk_id, impacts in RISK_GOAL_IMPACTS.items():
-            for impact in impacts:
-                if impact.goal_id != goal_id:
-                    continue
-
-                prob = risk_probs.get(risk_id, 0.0)
-                if prob == 0:
-                    continue
-
-                impact_mean = pert_mean(
-                    impact.impact_low,
-                    impact.impact_likely,
-                    impact.impact_high
-                )
-                expected = prob * impact_mean
-                total_impact += expected
-
-                contributions.append(GoalRiskContribution(
-                    risk_id=risk_id,
-                    risk_name=risk_names.get(risk_id, risk_id),
-                    probability=prob,
-                    impact_if_occurs=impact_mean,
-                    expected_impact=expected,
-                    unit=goal_def.unit.value,
-                ))
+        total_impact = float(goal_totals[goal_code])
+
+        # Only this goal's impacts (indexed by goal in goal_impacts), each
+        # with its PERT mean precomputed
+        for impact in get_impacts_for_goal(goal_id):
+            risk_id = impact.risk_id
+            prob = risk_probs.get(risk_id, 0.0)
+            if prob == 0:
+                continue
+
+            impact_mean = impact.mean
+            expected = prob * impact_mean
+
+            contributions.append(GoalRiskContribution(
+                risk_id=risk_id,
+                risk_name=risk_names.get(risk_id, risk_id),
+                probability=prob,
+                impact_if_occurs=impact_mean,
+                expected_impact=expected,
+                unit=goal_def.unit.label,
+            ))
 
         # Impact signs already encode direction:
         # positive impact = worse for lower_better goals (more months, more cost)
@@ -153,11 +162,11 @@ def calculate_scenario_goal_profile(scenario_id: str) -> Optional[ScenarioGoalPr
             goal_id=goal_id,
             goal_name_is=goal_def.name_is,
             goal_name_en=goal_def.name_en,
-            unit=goal_def.unit.value,
+            unit=goal_def.unit.label,
             baseline=baseline,
             expected_impact=total_impact,
             expected_value=expected_value,
-            risk_contributions=contributions,
+            risk_contributions=tuple(contributions),
         )
 
     scenario = SCENARIO_FACTORS.get(scenario_id)
@@ -165,10 +174,35 @@ def calculate_scenario_goal_profile(scenario_id: str) -> Optional[ScenarioGoalPr
         scenario_id=scenario_id,
         scenario_name_is=scenario.name_is if scenario else scenario_id,
         scenario_name_en=scenario.name_en if scenario else scenario_id,
-        goal_scores=goal_scores,
+        goal_scores=ReadOnlyDict(goal_scores),
     )
 
 
+# Normalization factors to make different units comparable.
+# Calibrated to actual spread across scenarios so each goal
+# contributes ~1.0 unit of differentiation at weight=1.
+# Sign convention: positive for lower_better, negative for higher_better.
+# Recalibrated in v5 for 33-risk model.
+NORMALIZERS: Dict[str, float] = {
+    "G1":  0.023171,   # Infra Speed: spread ~43 months
+    "G2":  0.006498,   # Construction Speed: spread ~154 months
+    "G3":  0.022491,   # Affordability: spread ~44 pp
+    "G4":  0.000225,   # City Financial: spread ~4453 M ISK
+    "G5": -0.005898,   # Completion: spread ~170 pp
+    "G6": -0.025075,   # Infra Budget: spread ~40 pp
+    "G7": -0.023433,   # Infra Quality: spread ~43 pts
+    "G8": -0.014442,   # Construction Quality: spread ~69 pts
+    "G9": -0.009893,   # City Control: spread ~101 pts (incl. variable baseline)
+    "G10": -0.015430,  # Social Mix: spread ~65 pp
+}
+
+# NORMALIZERS as a column in GOALS order (1.0 for a goal without one),
+# so scoring scales all goal impacts with one array multiply
+_GOAL_CODES: Dict[str, int] = {gid: j for j, gid in enumerate(GOALS)}
+_SCENARIO_CODES: Dict[str, int] = {sid: i for i, sid in enumerate(SCENARIO_FACTORS)}
+_NORMALIZER_COL = np.array([NORMALIZERS.get(gid, 1.0) for gid in GOALS], dtype=np.float64)
+
+
 def calculate_weighted_score(
     scenario_id: str,
     weights: Dict[str, float],
@@ -182,49 +216,27 @@ def calculate_weighted_score(
     if not profile:
         return None
 
-    # Normalization factors to make different units comparable.
-    # Calibrated to actual spread across scenarios so each goal
-    # contributes ~1.0 unit of differentiation at weight=1.
-    # Sign convention: positive for lower_better, negative for higher_better.
-    # Recalibrated in v5 for 33-risk model.
-    NORMALIZERS = {
-        "G1":  0.023171,   # Infra Speed: spread ~43 months
-        "G2":  0.006498,   # Construction Speed: spread ~154 months
-        "G3":  0.022491,   # Affordability: spread ~44 pp
-        "G4":  0.000225,   # City Financial: spread ~4453 M ISK
-        "G5": -0.005898,   # Completion: spread ~170 pp
-        "G6": -0.025075,   # Infra Budget: spread ~40 pp
-        "G7": -0.023433,   # Infra Quality: spread ~43 pts
-        "G8": -0.014442,   # Construction Quality: spread ~69 pts
-        "G9": -0.009893,   # City Control: spread ~101 pts (incl. variable baseline)
-        "G10": -0.015430,  # Social Mix: spread ~65 pp
-    }
+    impacts = np.array(
+        [profile.goal_scores[gid].expected_impact for gid in GOALS], dtype=np.float64
+    )
+
+    # G9 has a variable baseline (depends on F6/F7). The scorer must
+    # include the baseline gap so scenarios with less city involvement
+    # are penalized structurally, not just by risk damage.
+    g9_max_baseline = 100.0  # F6=5, F7=5
+    impacts[_GOAL_CODES["G9"]] += profile.goal_scores["G9"].baseline - g9_max_baseline
+
+    normalized = impacts * _NORMALIZER_COL if normalize else impacts
 
     total = 0.0
     contributions: Dict[str, float] = {}
 
     for goal_id, weight in weights.items():
-        goal_score = profile.goal_scores.get(goal_id)
-        if not goal_score:
+        code = _GOAL_CODES.get(goal_id)
+        if code is None:
             continue
 
-        impact = goal_score.expected_impact
-
-        # G9 has a variable baseline (depends on F6/F7). The scorer must
-        # include the baseline gap so scenarios with less city involvement
-        # are penalized structurally, not just by risk damage.
-        if goal_id == "G9":
-            g9_max_baseline = 100.0  # F6=5, F7=5
-            baseline_penalty = goal_score.baseline - g9_max_baseline
-            impact = impact + baseline_penalty
-
-        if normalize:
-            normalizer = NORMALIZERS.get(goal_id, 1.0)
-            normalized_impact = impact * normalizer
-        else:
-            normalized_impact = impact
-
-        weighted_contribution = abs(normalized_impact) * weight
+        weighted_contribution = abs(float(normalized[code])) * weight
         total += weighted_contribution
         contributions[goal_id] = weighted_contribution
 
@@ -237,24 +249,100 @@ def calculate_weighted_score(
     )
 
 
-def rank_scenarios(
+@lru_cache(maxsize=64)
+def _weight_columns(
+    weight_items: Tuple[Tuple[str, float], ...],
+) -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray]:
+    """
+    Resolve a weight profile once: the weighted goal ids (in weights
+    order, unknown ids dropped), their columns in GOALS order and the
+    weight vector. Presets and repeated slider settings hit the cache.
+    """
+    weighted_goals = tuple(gid for gid, _ in weight_items if gid in _GOAL_CODES)
+    weights = dict(weight_items)
+    goal_cols = np.array([_GOAL_CODES[gid] for gid in weighted_goals], dtype=np.intp)
+    weight_vec = np.array([weights[gid] for gid in weighted_goals], dtype=np.float64)
+    goal_cols.flags.writeable = False
+    weight_vec.flags.writeable = False
+    return weighted_goals, goal_cols, weight_vec
+
+
+@lru_cache(maxsize=8)
+def _goal_badness_matrix(
+    scenario_key: Optional[Tuple[str, ...]],
+    normalize: bool,
+) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """
+    |normalized goal impact| per (scenario, goal), G9 baseline gap
+    included. This does not depend on the weights, so it is computed once
+    per scenario set and every weight profile reuses it (read-only).
+    """
+    scenario_ids, risk_ids, probs = calculate_probability_matrix(
+        None if scenario_key is None else list(scenario_key)
+    )
+    risk_col = {rid: k for k, rid in enumerate(risk_ids)}
+    p_mean = (probs[..., 0] + 4 * probs[..., 1] + probs[..., 2]) / 6
+    impacts = expected_impact_matrix(p_mean[:, [risk_col[rid] for rid in RISK_GOAL_IMPACTS]])
+
+    # G9 baseline gap, as in calculate_scenario_goal_profile / calculate_weighted_score
+    f6 = np.array([SCENARIO_FACTORS[sid].F6 for sid in scenario_ids], dtype=np.float64)
+    f7 = np.array([SCENARIO_FACTORS[sid].F7 for sid in scenario_ids], dtype=np.float64)
+    g9_baseline = 40.0 + 8.0 * (f6 - 1) + 7.0 * (f7 - 1)
+    impacts[:, _GOAL_CODES["G9"]] += g9_baseline - 100.0
+
+    badness = np.abs(impacts * _NORMALIZER_COL if normalize else impacts)
+    badness.flags.writeable = False
+    return tuple(scenario_ids), badness
+
+
+def calculate_weighted_scores(
     weights: Dict[str, float],
     scenario_ids: Optional[List[str]] = None,
+    normalize: bool = True,
 ) -> List[WeightedScenarioScore]:
     """
-    Rank all scenarios by weighted goal score.
-    Returns sorted list (best first = lowest score).
+    calculate_weighted_score for many scenarios at once: one probability
+    matrix for all scenarios, then goal impacts, the G9 baseline gap and
+    normalization as (n_scenarios, n_goals) array operations.
+    The weight-independent part is cached per scenario set, so a new
+    weight profile only costs the weighting step.
     """
-    if scenario_ids is None:
-        scenario_ids = list(SCENARIO_FACTORS.keys())
+    scenario_ids, badness = _goal_badness_matrix(
+        None if scenario_ids is None else tuple(scenario_ids), normalize
+    )
+
+    weighted_goals, goal_cols, weight_vec = _weight_columns(tuple(weights.items()))
+    weighted = badness[:, goal_cols] * weight_vec
+    # Accumulate goal by goal, in weights order, like the scalar scorer
+    totals = np.zeros(len(scenario_ids), dtype=np.float64)
+    for j in range(len(weighted_goals)):
+        totals += weighted[:, j]
+
+    return [
+        WeightedScenarioScore(
+            scenario_id=sid,
+            scenario_name_is=SCENARIO_FACTORS[sid].name_is,
+            total_score=float(totals[i]),
+            goal_contributions=dict(zip(weighted_goals, weighted[i].tolist())),
+        )
+        for i, sid in enumerate(scenario_ids)
+    ]
 
-    scores = []
-    for sid in scenario_ids:
-        score = calculate_weighted_score(sid, weights)
-        if score:
-            scores.append(score)
 
-    scores.sort(key=lambda x: x.total_score)
+def rank_scenarios(
+    weights: Dict[str, float],
+    scenario_ids: Optional[List[str]] = None,
+) -> List[WeightedScenarioScore]:
+    """
+    Rank all scenarios by weighted goal score.
+    Returns sorted list (best first = lowest score); exact ties are
+    broken by scenario order in SCENARIO_FACTORS, so ranks are stable.
+    """
+    scores = calculate_weighted_scores(weights, scenario_ids)
+    totals = np.array([score.total_score for score in scores], dtype=np.float64)
+    codes = np.array([_SCENARIO_CODES[score.scenario_id] for score in scores], dtype=np.int32)
+    # lexsort: last key is primary
+    scores = [scores[i] for i in np.lexsort((codes, totals))]
 
     for i, score in enumerate(scores):
         score.rank = i + 1
@@ -296,8 +384,8 @@ def find_best_scenario_per_goal(
 
     result: Dict[str, Tuple[str, float]] = {}
 
-    for goal_id in GOALS.keys():
-        goal_def = GOALS[goal_id]
+    for goal_def in GOAL_LIST:
+        goal_id = goal_def.goal_id
         best_scenario = None
         best_impact = float('inf') if goal_def.direction == "lower_better" else float('-inf')
 
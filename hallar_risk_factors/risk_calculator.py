@@ -26,8 +26,11 @@ in epidemiology, actuarial science, and risk modeling.
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
 
 from .structural_factors import SCENARIO_FACTORS, STRUCTURAL_FACTORS, get_scenario_profile
 from .risk_sensitivities import RISK_PROFILES, RiskProfile, FactorDirection, Sensitivity
@@ -40,6 +43,13 @@ NEUTRAL_FACTOR = 3.0
 PROB_FLOOR = 1e-15
 PROB_CEIL = 1.0 - 1e-15
 
+# PROTECTIVE is the reciprocal of EXPOSURE: 3/(3+d) = ((3+d)/3)^-1, so one
+# signed exponent covers both directions without branching on the kind
+DIRECTION_SIGN: Dict[FactorDirection, float] = {
+    FactorDirection.PROTECTIVE: -1.0,
+    FactorDirection.EXPOSURE: 1.0,
+}
+
 
 def calculate_factor_effect(
     factor_score: int,
@@ -68,10 +78,7 @@ def calculate_factor_effect(
     """
     deviation = factor_score - NEUTRAL_FACTOR
 
-    if direction == FactorDirection.PROTECTIVE:
-        base_effect = NEUTRAL_FACTOR / (NEUTRAL_FACTOR + deviation)
-    else:
-        base_effect = (NEUTRAL_FACTOR + deviation) / NEUTRAL_FACTOR
+    base_effect = ((NEUTRAL_FACTOR + deviation) / NEUTRAL_FACTOR) ** DIRECTION_SIGN[direction]
 
     # Floor at 0.2 to prevent extreme artifacts at boundary scores
     base_effect = max(0.2, base_effect)
@@ -84,7 +91,8 @@ def calculate_factor_effect(
 def _logistic_transform(
     base_prob: float,
     factor_effects: List[float],
-) -> Tuple[float, Dict]:
+    debug: bool = False,
+) -> Tuple[float, Optional[Dict]]:
     """
     Logistic probability transformation.
 
@@ -96,18 +104,16 @@ def _logistic_transform(
 
     This is equivalent to treating factor effects as odds-ratio multipliers,
     which is the standard approach in logistic regression / risk modeling.
+
+    The per-factor log shifts are one NumPy pass over the effects. The
+    details dict is only built when debug=True; otherwise it is None.
     """
     base_prob = max(0.001, min(0.999, base_prob))
 
     base_log_odds = math.log(base_prob / (1.0 - base_prob))
 
-    adjustments = []
-    total_adjustment = 0.0
-    for effect in factor_effects:
-        effect = max(0.001, effect)
-        adj = math.log(effect)
-        adjustments.append(adj)
-        total_adjustment += adj
+    adjustments = np.log(np.maximum(0.001, np.asarray(factor_effects, dtype=np.float64)))
+    total_adjustment = float(adjustments.sum())
 
     adjusted_log_odds = base_log_odds + total_adjustment
 
@@ -122,10 +128,13 @@ def _logistic_transform(
     # Final clamp: sigmoid rounds to exactly 0.0/1.0 at |log-odds| > ~36
     adjusted_prob = max(PROB_FLOOR, min(PROB_CEIL, adjusted_prob))
 
+    if not debug:
+        return adjusted_prob, None
+
     details = {
         "base_prob": base_prob,
         "base_log_odds": round(base_log_odds, 4),
-        "adjustments": [round(a, 4) for a in adjustments],
+        "adjustments": [round(a, 4) for a in adjustments.tolist()],
         "total_adjustment": round(total_adjustment, 4),
         "adjusted_log_odds": round(adjusted_log_odds, 4),
         "final_prob": adjusted_prob,
@@ -197,53 +206,138 @@ def calculate_adjusted_probability(
     if not scenario:
         return [0.0, 0.0, 0.0], 1.0, []
 
-    # Check applicability
-    if risk_profile.requires_factors:
-        for factor_id, (min_val, max_val) in risk_profile.requires_factors.items():
-            factor_score = scenario.get_factor(factor_id)
-            if not (min_val <= factor_score <= max_val):
-                return [0.0, 0.0, 0.0], 0.0, [
-                    (factor_id, 0.0, "Risk does not apply to this scenario")
-                ]
+    # Read the row from the memoized scenario profile, so per-pair sweeps
+    # share one vectorized pass per scenario instead of one per risk
+    result = _scenario_risk_results(scenario_id).get(risk_id)
+    if result is None:
+        # Inapplicable risk: not in the profile; the modifier call returns
+        # early with the (0.0, "does not apply") breakdown
+        display_modifier, breakdown = calculate_scenario_modifier(scenario_id, risk_profile)
+        return [0.0, 0.0, 0.0], display_modifier, breakdown
 
-    # Collect factor effects
-    effects = []
-    breakdown = []
-    for sens in risk_profile.sensitivities:
-        factor_score = scenario.get_factor(sens.factor_id)
-        factor_info = STRUCTURAL_FACTORS.get(sens.factor_id)
-        effect = calculate_factor_effect(factor_score, sens.direction, sens.sensitivity)
-        effects.append(effect)
+    adjusted_prob = [result.prob_low, result.prob_likely, result.prob_high]
+    return adjusted_prob, result.modifier, list(result.breakdown)
 
-        if effect < 0.9:
-            impact = f"reduces risk ({effect:.2f}×)"
-        elif effect > 1.1:
-            impact = f"increases risk ({effect:.2f}×)"
-        else:
-            impact = f"neutral ({effect:.2f}×)"
 
-        breakdown.append((
-            sens.factor_id,
-            effect,
-            f"{factor_info.name_is if factor_info else sens.factor_id} = {factor_score}: {impact}"
-        ))
+@lru_cache(maxsize=None)
+def _sensitivity_arrays() -> Tuple[Tuple[str, ...], Tuple[str, ...], np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Flatten RISK_PROFILES into arrays for the vectorized pipeline.
+
+    One entry per (risk, factor) sensitivity: the factor column it reads,
+    the direction sign (-1 protective, +1 exposure) and the sensitivity
+    exponent. `membership` is a (n_sensitivities, n_risks) 0/1 matrix that
+    sums per-sensitivity log-effects into per-risk log-odds shifts.
+    Built on first use, not at import.
+    """
+    risk_ids = tuple(RISK_PROFILES.keys())
+    factor_ids: Dict[str, int] = {}
+    factor_col, sign, exponent, owner = [], [], [], []
+    for r, risk_profile in enumerate(RISK_PROFILES.values()):
+        for sens in risk_profile.sensitivities:
+            factor_col.append(factor_ids.setdefault(sens.factor_id, len(factor_ids)))
+            sign.append(DIRECTION_SIGN[sens.direction])
+            exponent.append(sens.sensitivity.value)
+            owner.append(r)
+
+    membership = np.zeros((len(owner), len(risk_ids)), dtype=np.float64)
+    membership[np.arange(len(owner)), owner] = 1.0
+
+    # Base log-odds for [low, likely, high], with the same clamp as _logistic_transform
+    base_probs = np.array(
+        [(rp.base_prob_low, rp.base_prob_likely, rp.base_prob_high) for rp in RISK_PROFILES.values()],
+        dtype=np.float64,
+    )
+    base_probs = np.clip(base_probs, 0.001, 0.999)
+    base_log_odds = np.log(base_probs) - np.log1p(-base_probs)
+
+    return (
+        risk_ids,
+        tuple(factor_ids),
+        np.array(factor_col, dtype=np.intp),
+        np.array(sign, dtype=np.float64),
+        np.array(exponent, dtype=np.float64),
+        membership,
+        base_log_odds,
+    )
+
+
+def calculate_probability_matrix(
+    scenario_ids: Optional[List[str]] = None,
+    apply_requirements: bool = True,
+) -> Tuple[List[str], List[str], np.ndarray]:
+    """
+    Vectorized logistic model over many scenarios and all risks at once.
+    Returns (scenario_ids, risk_ids, probs) with probs shaped
+    (n_scenarios, n_risks, 3) for [low, likely, high].
+
+    Same math as calculate_adjusted_probability, as array operations:
+      d = score - 3
+      ln(effect) = s * max(ln 0.2, sign * ln(1 + d/3))
+      L1 = L0 + Σ ln(effect)       (one matrix product over sensitivities)
+      p' = sigmoid(L1), clamped to [PROB_FLOOR, PROB_CEIL]
+    Risks that do not apply to a scenario (requires_factors) get 0.0,
+    unless apply_requirements=False (raw logistic output for every pair).
+    The PERT mean of the result is (probs @ [1, 4, 1]) / 6.
+    """
+    if scenario_ids is None:
+        scenario_ids = list(SCENARIO_FACTORS.keys())
+    scenario_ids = [sid for sid in scenario_ids if sid in SCENARIO_FACTORS]
 
-    # Apply logistic transform to each PERT estimate
-    prob_low, _ = _logistic_transform(risk_profile.base_prob_low, effects)
-    prob_likely, _ = _logistic_transform(risk_profile.base_prob_likely, effects)
-    prob_high, _ = _logistic_transform(risk_profile.base_prob_high, effects)
+    risk_ids, factor_ids, factor_col, sign, exponent, membership, base_log_odds = _sensitivity_arrays()
 
-    adjusted_prob = [prob_low, prob_likely, prob_high]
+    scores = np.array(
+        [[SCENARIO_FACTORS[sid].get_factor(fid) for fid in factor_ids] for sid in scenario_ids],
+        dtype=np.float64,
+    ).reshape(len(scenario_ids), len(factor_ids))
+    # ln(1 + d/3) once per (scenario, factor), then gathered per sensitivity:
+    # the log runs on n_factors columns rather than every sensitivity entry
+    log_ratio = np.log1p((scores - NEUTRAL_FACTOR) / NEUTRAL_FACTOR)[:, factor_col]
 
-    # Display modifier (raw product — for UI explanation, not for calculation)
-    display_modifier = 1.0
-    for e in effects:
-        display_modifier *= e
+    log_effect = exponent * np.maximum(math.log(0.2), sign * log_ratio)
+    log_effect = np.maximum(math.log(0.001), log_effect)
+    log_odds = base_log_odds + (log_effect @ membership)[:, :, np.newaxis]
 
-    return adjusted_prob, display_modifier, breakdown
+    # Overflow-free sigmoid: 1/(1+e^-x) = exp(-ln(1+e^-x)), and logaddexp
+    # never forms e^-x directly, so no ±700 guard is needed. The clamp stays:
+    # float64 still rounds the sigmoid to exactly 0/1 at |log-odds| > ~36
+    probs = np.clip(np.exp(-np.logaddexp(0.0, -log_odds)), PROB_FLOOR, PROB_CEIL)
 
+    if not apply_requirements:
+        return scenario_ids, list(risk_ids), probs
+
+    for r, risk_profile in enumerate(RISK_PROFILES.values()):
+        if not risk_profile.requires_factors:
+            continue
+        for s, sid in enumerate(scenario_ids):
+            scenario = SCENARIO_FACTORS[sid]
+            for factor_id, (min_val, max_val) in risk_profile.requires_factors.items():
+                if not (min_val <= scenario.get_factor(factor_id) <= max_val):
+                    probs[s, r] = 0.0
+                    break
 
-@dataclass
+    return scenario_ids, list(risk_ids), probs
+
+
+class ReadOnlyDict(dict):
+    """
+    dict that rejects mutation, for the memoized profiles.
+    Still a dict, so json.dumps, pickle, copy.deepcopy and st.cache_data
+    handle it; copies and unpickled objects stay read-only.
+    """
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+@dataclass(frozen=True)
 class ScenarioRiskResult:
     """Result of risk calculation for a single risk in a scenario."""
     risk_id: str
@@ -254,8 +348,20 @@ class ScenarioRiskResult:
     prob_likely: float
     prob_high: float
     modifier: float
-    affected_goals: List[str]
-    breakdown: List[Tuple[str, float, str]]
+    affected_goals: Tuple[str, ...]
+    breakdown: Tuple[Tuple[str, float, str], ...]
+    # Column views of breakdown, so callers can classify drivers with one
+    # mask (e.g. factor_ids[effects > 1.15]) instead of unpacking triples
+    factor_ids: np.ndarray = field(init=False, repr=False, compare=False)
+    effects: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        factor_ids = np.array([fid for fid, _effect, _desc in self.breakdown], dtype=str)
+        effects = np.array([effect for _fid, effect, _desc in self.breakdown], dtype=np.float64)
+        factor_ids.flags.writeable = False
+        effects.flags.writeable = False
+        object.__setattr__(self, "factor_ids", factor_ids)
+        object.__setattr__(self, "effects", effects)
 
     @property
     def prob_pert_mean(self) -> float:
@@ -263,14 +369,14 @@ class ScenarioRiskResult:
         return (self.prob_low + 4 * self.prob_likely + self.prob_high) / 6
 
 
-@dataclass
+@dataclass(frozen=True)
 class ScenarioRiskProfile:
     """Complete risk profile for a scenario."""
     scenario_id: str
     scenario_name_is: str
     scenario_name_en: str
-    factor_scores: Dict[str, int]
-    risks: List[ScenarioRiskResult]
+    factor_scores: Mapping[str, int]
+    risks: Tuple[ScenarioRiskResult, ...]
 
     def risks_by_category(self) -> Dict[str, List[ScenarioRiskResult]]:
         """Group risks by category."""
@@ -290,16 +396,27 @@ class ScenarioRiskProfile:
         return sorted(self.risks, key=lambda r: r.prob_likely, reverse=True)[:n]
 
 
+@lru_cache(maxsize=None)
 def calculate_scenario_risk_profile(scenario_id: str) -> Optional[ScenarioRiskProfile]:
-    """Calculate complete risk profile for a scenario."""
+    """
+    Calculate complete risk profile for a scenario.
+    Memoized per scenario_id (the model inputs are static module data).
+    The returned profile is shared by every caller, so it is immutable:
+    frozen dataclasses, tuples, a read-only mapping and read-only arrays.
+    """
     scenario = SCENARIO_FACTORS.get(scenario_id)
     if not scenario:
         return None
 
     results = []
 
-    for risk_id, risk_profile in RISK_PROFILES.items():
-        adjusted_prob, modifier, breakdown = calculate_adjusted_probability(scenario_id, risk_id)
+    # Probabilities for every risk in one vectorized pass; the per-risk
+    # loop below only builds the display modifier and breakdown text
+    _, _, probs = calculate_probability_matrix([scenario_id])
+    probs = probs[0].tolist()
+
+    for (risk_id, risk_profile), adjusted_prob in zip(RISK_PROFILES.items(), probs):
+        modifier, breakdown = calculate_scenario_modifier(scenario_id, risk_profile)
 
         if modifier == 0:
             continue
@@ -313,19 +430,28 @@ def calculate_scenario_risk_profile(scenario_id: str) -> Optional[ScenarioRiskPr
             prob_likely=adjusted_prob[1],
             prob_high=adjusted_prob[2],
             modifier=modifier,
-            affected_goals=risk_profile.affected_goals,
-            breakdown=breakdown,
+            affected_goals=tuple(risk_profile.affected_goals),
+            breakdown=tuple(breakdown),
         ))
 
     return ScenarioRiskProfile(
         scenario_id=scenario_id,
         scenario_name_is=scenario.name_is,
         scenario_name_en=scenario.name_en,
-        factor_scores=get_scenario_profile(scenario_id),
-        risks=results,
+        factor_scores=ReadOnlyDict(get_scenario_profile(scenario_id)),
+        risks=tuple(results),
     )
 
 
+@lru_cache(maxsize=None)
+def _scenario_risk_results(scenario_id: str) -> Mapping[str, ScenarioRiskResult]:
+    """Applicable risk results of a scenario's memoized profile, by risk_id."""
+    profile = calculate_scenario_risk_profile(scenario_id)
+    if not profile:
+        return ReadOnlyDict()
+    return ReadOnlyDict({r.risk_id: r for r in profile.risks})
+
+
 def compare_scenarios_by_goal(
     scenario_ids: List[str],
     goal_id: str,
@@ -345,13 +471,15 @@ def get_scenario_risk_summary(scenario_id: str) -> Dict:
     if not profile:
         return {}
 
-    high_risks = [r for r in profile.risks if r.prob_likely > 0.40]
-    medium_risks = [r for r in profile.risks if 0.20 <= r.prob_likely <= 0.40]
-    low_risks = [r for r in profile.risks if r.prob_likely < 0.20]
+    # Band on probabilities rounded to 1e-9: risks sitting exactly on 20% /
+    # 40% must not change band over last-bit noise in the logistic transform
+    high_risks = [r for r in profile.risks if round(r.prob_likely, 9) > 0.40]
+    medium_risks = [r for r in profile.risks if 0.20 <= round(r.prob_likely, 9) <= 0.40]
+    low_risks = [r for r in profile.risks if round(r.prob_likely, 9) < 0.20]
 
     return {
         "scenario_id": scenario_id,
-        "factor_scores": profile.factor_scores,
+        "factor_scores": dict(profile.factor_scores),
         "risk_count": len(profile.risks),
         "high_risk_count": len(high_risks),
         "medium_risk_count": len(medium_risks),
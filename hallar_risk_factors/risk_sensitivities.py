@@ -18,7 +18,7 @@ v4 — February 2026
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
 
@@ -621,6 +621,9 @@ RISK_PROFILES: Dict[str, RiskProfile] = {
     ),
 }
 
+# Risk IDs in numeric order (R1 < R2 < … < R10), parsed once at import
+RISK_IDS: Tuple[str, ...] = tuple(sorted(RISK_PROFILES, key=lambda rid: int(rid[1:])))
+
 
 def get_risk_affected_goals(risk_id: str) -> List[str]:
     """Get list of goals affected by a risk."""
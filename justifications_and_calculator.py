@@ -6,7 +6,7 @@ Every number has a written Icelandic justification.
 
 Contents:
 1. SCENARIO_FACTOR_JUSTIFICATIONS — 84 justification texts (12 scenarios × 7 factors)
-2. RISK_CONFIDENCE_TIERS — confidence rating for each of 33 risks
+2. RISK_CONFIDENCE_TIERS — confidence rating for each of 33 risks (+ confidence_row())
 3. RISK_BASE_JUSTIFICATIONS — why each base probability is what it is
 4. calculate_risk_logistic() — improved probability calculation
 5. validate_all() — comprehensive validation
@@ -14,6 +14,7 @@ Contents:
 
 from __future__ import annotations
 import math
+from functools import lru_cache
 from typing import Dict, Tuple, List, Optional
 from dataclasses import dataclass
 
@@ -711,6 +712,29 @@ RISK_CONFIDENCE: Dict[str, RiskConfidence] = {
         "Líkindamat byggt á kærum til úrskurðarnefnda og dómstóla."),
 }
 
+CONFIDENCE_TIER_ICONS: Dict[str, str] = {"High": "🟢", "Medium": "🟡", "Low": "🔴"}
+
+
+@lru_cache(maxsize=64)
+def confidence_row(risk_id: str) -> Optional[Tuple[str, str, str]]:
+    """
+    One row of the confidence table: (label, icon + tier, justification).
+    Returns None for risks without a confidence rating.
+
+    RISK_PROFILES and RISK_CONFIDENCE are static, so rows are cached for
+    the life of the process.
+    """
+    from hallar_risk_factors.risk_sensitivities import RISK_PROFILES
+
+    conf = RISK_CONFIDENCE.get(risk_id)
+    if not conf:
+        return None
+    return (
+        f"{risk_id}: {RISK_PROFILES[risk_id].name_is}",
+        f"{CONFIDENCE_TIER_ICONS.get(conf.tier_en, '')} {conf.tier}",
+        conf.justification,
+    )
+
 
 # ═══════════════════════════════════════════════════════════════════
 # 3. IMPROVED RISK CALCULATOR (Logistic)